@@ -10,10 +10,16 @@ import sys
 import json
 import logging
 import os
+from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
-from usnews_scraper.html_downloader import HTMLDownloader, DownloaderConfig
+from usnews_scraper.html_downloader import HTMLDownloader, DownloaderConfig, slugify_name
+from usnews_scraper.catalog_refresh import DEFAULT_CATALOG_DIFF, SOURCE_API, SOURCE_HTML
+from usnews_scraper.manifest import CorpusManifest
+from usnews_scraper.negative_cache import NegativeCache
+from usnews_scraper.latency import LatencyTracker, STAGE_EXTRACT, STAGE_LOAD
+from usnews_scraper.recrawl import load_recrawl_targets
 from usnews_scraper.selenium_base import setup_basic_logging
 
 
@@ -42,12 +48,15 @@ def load_universities() -> List[str]:
         return []
 
 
-def download_html(university_name: str):
+def download_html(university_name: str, incremental: bool = False, capture_api: bool = False, record_json: bool = False,
+                  reprobe: bool = False, hedge: bool = False):
     """Download HTML for a single university."""
     logger = logging.getLogger(__name__)
     logger.info(f"Downloading HTML for {university_name}")
     
-    config = DownloaderConfig(preserve_login_from_existing=True)
+    config = DownloaderConfig(preserve_login_from_existing=True, incremental=incremental,
+                              capture_api_json=capture_api, record_json=record_json, reprobe_negative=reprobe,
+                              hedge_navigation=hedge)
     downloader = HTMLDownloader(headless=True, downloader_config=config)
     
     try:
@@ -56,37 +65,54 @@ def download_html(university_name: str):
             logger.info(f"✅ Successfully downloaded HTML for {university_name}")
         else:
             logger.error(f"❌ Failed to download HTML for {university_name}")
+        # 백오프로 미뤄둔 페이지를 먼저 처리한 뒤 품질 검사에 실패한 이번 실행의 페이지만 재시도
+        downloader.drain_deferred_retries()
+        downloader.retry_failed_pages(include_previous=False)
     except Exception as e:
         logger.error(f"❌ Error downloading {university_name}: {e}")
 
 
-def download_all_html():
+def download_all_html(incremental: bool = False, capture_api: bool = False, record_json: bool = False,
+                      reprobe: bool = False, hedge: bool = False):
     """Download HTML for all universities with progress tracking."""
     logger = logging.getLogger(__name__)
-    universities = load_universities()
+    config = DownloaderConfig(preserve_login_from_existing=True, incremental=incremental,
+                              capture_api_json=capture_api, record_json=record_json, reprobe_negative=reprobe,
+                              hedge_navigation=hedge)
+    downloader = HTMLDownloader(headless=True, downloader_config=config)
+    # Iterate catalog entries directly (no name -> university re-lookup per school)
+    universities = list(downloader.catalog)
     
     if not universities:
         logger.error("No universities found to download")
         return
     
     logger.info(f"🚀 Starting download for {len(universities)} universities")
+    if incremental:
+        logger.info("🔁 Incremental mode: unchanged pages are skipped")
+    if capture_api:
+        logger.info("📡 API capture: admissions-calculator JSON is saved during the applying page load")
+    if record_json:
+        logger.info("📡 JSON recording: API responses are stored in downloads/<University>/api_responses.jsonl")
+    if reprobe:
+        logger.info("🔎 Re-probe: pages in the negative cache (redirect/404/CDN error) are tried again")
+    if hedge:
+        logger.info("🪢 Hedged navigation: pages slower than their type's p95 load time are requested again in a second tab")
     logger.info("=" * 80)
     
-    config = DownloaderConfig(preserve_login_from_existing=True)
-    downloader = HTMLDownloader(headless=True, downloader_config=config)
-    
     success_count = 0
     failed_count = 0
     skipped_count = 0
     
-    for i, university in enumerate(universities, 1):
+    for i, entry in enumerate(universities, 1):
+        university = entry.name
         try:
             # 진행 상황 로그 추가
             logger.info(f"\n🎓 [{i}/{len(universities)}] Processing: {university}")
             logger.info(f"📊 Progress: {i}/{len(universities)} ({i/len(universities)*100:.1f}%)")
             logger.info("-" * 60)
             
-            result = downloader.download_all_pages(university)
+            result = downloader.download_all_pages(university, entry.as_info())
             
             if result:
                 success_count += 1
@@ -99,6 +125,9 @@ def download_all_html():
             failed_count += 1
             logger.error(f"❌ Error downloading {university}: {e}")
         
+        # 백오프 시간이 지난 지연 재시도는 다음 학교로 넘어가기 전에 처리 (대기 없음)
+        downloader.run_due_retries()
+        
         # 전체 진행 상황 요약 (매 10개마다)
         if i % 10 == 0 or i == len(universities):
             logger.info(f"\n📈 Progress Summary:")
@@ -108,6 +137,11 @@ def download_all_html():
             logger.info(f"   Failed: {failed_count}")
             logger.info("=" * 60)
     
+    # 아직 남은 지연 재시도를 마저 처리
+    deferred_stats = downloader.drain_deferred_retries()
+    # 품질 검사(로그인/에러/업셀) 실패 페이지를 모아서 한 번에 재시도 (이전 실행에서 남은 실패 포함)
+    retry_stats = downloader.retry_failed_pages()
+    
     # 최종 결과
     logger.info(f"\n🎉 Download Complete!")
     logger.info(f"📊 Final Results:")
@@ -115,6 +149,10 @@ def download_all_html():
     logger.info(f"   Successfully downloaded: {success_count}")
     logger.info(f"   Skipped (already downloaded): {skipped_count}")
     logger.info(f"   Failed: {failed_count}")
+    if deferred_stats["requested"]:
+        logger.info(f"   Deferred retries (backoff): {deferred_stats['requested']} (saved {deferred_stats['saved']})")
+    if retry_stats["queued"]:
+        logger.info(f"   Re-queued pages (quality check): {retry_stats['queued']} (recovered {retry_stats['recovered']}, still failing {retry_stats['failed']})")
     if success_count + failed_count > 0:
         logger.info(f"   Success rate: {success_count/(success_count+failed_count)*100:.1f}%")
 
@@ -131,6 +169,146 @@ def list_universities():
         print(f"{i:4d}. {university}")
 
 
+def recrawl_from(source: str, batch_size: int = 50, capture_api: bool = False, record_json: bool = False,
+                 hedge: bool = False):
+    """Re-download only the pages listed in a validator report or the manifest."""
+    logger = logging.getLogger(__name__)
+    try:
+        targets = load_recrawl_targets(source)
+    except Exception as e:
+        logger.error(f"❌ Could not read re-crawl targets from {source}: {e}")
+        return
+    if not targets:
+        logger.info(f"✅ No pages to re-crawl in {source}")
+        return
+    
+    logger.info(f"🎯 Re-crawling {len(targets)} pages from {source}")
+    config = DownloaderConfig(preserve_login_from_existing=True, capture_api_json=capture_api, record_json=record_json,
+                              hedge_navigation=hedge)
+    downloader = HTMLDownloader(headless=True, downloader_config=config)
+    stats = downloader.recrawl_pages(targets, batch_size=batch_size)
+    deferred_stats = downloader.drain_deferred_retries(batch_size=batch_size)
+    stats["saved"] += deferred_stats["saved"]
+    retry_stats = downloader.retry_failed_pages(include_previous=False)
+    
+    logger.info(f"\n🎉 Re-crawl Complete!")
+    logger.info(f"   Requested: {stats['requested']}")
+    logger.info(f"   Saved: {stats['saved']}")
+    logger.info(f"   Failed: {stats['failed']}")
+    logger.info(f"   Unknown (not in universities.json): {stats['unknown']}")
+    if retry_stats["queued"]:
+        logger.info(f"   Re-queued pages (quality check): {retry_stats['queued']} (recovered {retry_stats['recovered']}, still failing {retry_stats['failed']})")
+
+
+def fetch_admissions(args: List[str]):
+    """Run scripts/fetch_admissions_calculator.py with the remaining arguments (--all, --concurrency, --direct, ...)."""
+    sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+    from fetch_admissions_calculator import main as fetch_admissions_main
+    fetch_admissions_main(args)
+
+
+def refresh_catalog(args: List[str]):
+    """Re-fetch the rankings listing, merge into universities.json and write the diff."""
+    logger = logging.getLogger(__name__)
+    source = SOURCE_HTML if SOURCE_HTML in args else SOURCE_API
+    prune = "--prune" in args
+    dry_run = "--dry-run" in args
+    config = DownloaderConfig(preserve_login_from_existing=True)
+    downloader = HTMLDownloader(headless=True, downloader_config=config)
+    diff = downloader.refresh_catalog(source=source, prune=prune, dry_run=dry_run, diff_path=DEFAULT_CATALOG_DIFF)
+    if diff is None:
+        return
+    
+    logger.info(f"\n🗂️ Catalog refresh ({source}){' [dry run]' if dry_run else ''}")
+    logger.info(f"   Added: {len(diff.added)}")
+    logger.info(f"   Removed (no longer listed{', pruned' if prune else ', kept'}): {len(diff.removed)}")
+    logger.info(f"   Renamed: {len(diff.renamed)}")
+    logger.info(f"   Link changed: {len(diff.link_changed)}")
+    logger.info(f"   Unchanged: {diff.unchanged}")
+    for entry in diff.added:
+        logger.info(f"   + {entry['name']} ({entry['school_id']})")
+    for entry in diff.removed:
+        logger.info(f"   - {entry['name']} ({entry['school_id']})")
+    for entry in diff.renamed:
+        logger.info(f"   ~ {entry['old_name']} → {entry['new_name']} ({entry['school_id']})")
+    for entry in diff.link_changed:
+        logger.info(f"   ~ {entry['name']}: {entry['old_link']} → {entry['new_link']}")
+    if diff.changed_slugs():
+        logger.info(f"👉 Crawl only the changed universities: python main.py --recrawl-from {DEFAULT_CATALOG_DIFF}")
+
+
+def show_status(args: List[str]):
+    """Answer corpus status questions from the manifest (no directory walk)."""
+    config = DownloaderConfig()
+    manifest = CorpusManifest(config.manifest_file or os.path.join(config.downloads_dir, "manifest.jsonl"))
+    query = args[0].lower() if args else "summary"
+    
+    if query == "rebuild":
+        count = manifest.rebuild(config.downloads_dir)
+        print(f"Manifest rebuilt from {config.downloads_dir}: {count} pages")
+        return
+    
+    if query == "missing":
+        page_type = args[1] if len(args) > 1 else "main"
+        slugs = [slugify_name(name) for name in load_universities()]
+        missing = manifest.missing(page_type, slugs)
+        print(f"Universities missing '{page_type}': {len(missing)}/{len(slugs)}")
+        for slug in missing:
+            print(f"  - {slug}")
+        return
+    
+    if query == "changed":
+        hours = float(args[1]) if len(args) > 1 else 24.0
+        changed = manifest.changed_since(datetime.now() - timedelta(hours=hours))
+        print(f"Pages changed in the last {hours:g}h: {len(changed)}")
+        for record in changed:
+            print(f"  - {record['saved_at']}  {record['university']}/{record['page_type']}")
+        return
+    
+    if query == "negative":
+        cache = NegativeCache(config.negative_cache_file or os.path.join(config.downloads_dir, "negative_cache.json"))
+        entries = cache.active()
+        print(f"Pages in the negative cache (skipped until expiry): {len(entries)}")
+        for university, key, entry in entries:
+            print(f"  - {university}/{key}  {entry['class']}  until {entry['expires_at'][:16]}  (x{entry.get('count', 1)})")
+        return
+    
+    if query == "timeouts":
+        tracker = LatencyTracker(config.latency_stats_file or os.path.join(config.downloads_dir, "latency_stats.json"))
+        print("Latency by page type (seconds) and the timeouts derived from it")
+        print(f"{'page_type':<18} {'stage':<8} {'n':>5} {'t/o':>4} {'p50':>7} {'p95':>7} {'p99':>7} {'timeout':>8}")
+        for key, stages in sorted(tracker.samples.items()):
+            for stage, default in ((STAGE_LOAD, 20), (STAGE_EXTRACT, 30)):
+                samples = stages.get(stage, [])
+                if not samples:
+                    continue
+                p50, p95, p99 = (tracker.percentile(key, stage, q) for q in (0.5, 0.95, 0.99))
+                cells = " ".join(f"{v:7.2f}" if v is not None else f"{'-':>7}" for v in (p50, p95, p99))
+                learned = tracker.timeout_for(key, stage, default)
+                note = "" if p99 is not None else " (default)"
+                timed_out = sum(1 for s in samples if s is None)
+                print(f"{key:<18} {stage:<8} {len(samples):>5} {timed_out:>4} {cells} {learned:>7}s{note}")
+        return
+    
+    if query == "not-logged-in":
+        records = manifest.not_logged_in()
+        print(f"Pages saved without login: {len(records)}")
+        for record in records:
+            print(f"  - {record['university']}/{record['page_type']}")
+        return
+    
+    summary = manifest.summary()
+    print("Corpus status (manifest)")
+    print("=" * 50)
+    print(f"Universities:   {summary['universities']}")
+    print(f"Pages:          {summary['pages']}")
+    print(f"Total size:     {summary['total_bytes'] / (1024 * 1024):,.1f} MiB")
+    print(f"Not logged in:  {summary['not_logged_in']}")
+    print("Pages by type:")
+    for page_type, count in summary['pages_by_type'].items():
+        print(f"  {page_type:<18} {count}")
+
+
 def main():
     """Main CLI entry point."""
     setup_logging()
@@ -141,10 +319,26 @@ def main():
         print("  python main.py <university_name>     # Download HTML for specific university")
         print("  python main.py --all                 # Download HTML for all universities")
         print("  python main.py --list                # List all available universities")
+        print("  python main.py --status [query]      # Corpus status from the manifest")
+        print("  python main.py --recrawl-from <file> # Re-download pages listed in a report/manifest")
+        print("  python main.py --refresh-catalog     # Refresh universities.json from the live rankings")
+        print("  python main.py --admissions [...]    # Fetch admissions-calculator JSON via the attached Chrome")
         print("  python main.py --help                # Show this help")
         return
     
-    command = sys.argv[1].lower()
+    # Option flags (may be combined with a command)
+    option_flags = {"--incremental", "--capture-api", "--record-json", "--reprobe", "--hedge"}
+    incremental = "--incremental" in sys.argv[1:]
+    capture_api = "--capture-api" in sys.argv[1:]
+    record_json = "--record-json" in sys.argv[1:]
+    reprobe = "--reprobe" in sys.argv[1:]
+    hedge = "--hedge" in sys.argv[1:]
+    args = [a for a in sys.argv[1:] if a not in option_flags]
+    if not args:
+        print("Usage: python main.py <university_name> | --all [--incremental] [--capture-api]")
+        return
+    
+    command = args[0].lower()
     
     if command == "--help":
         print("US News University HTML Downloader")
@@ -153,24 +347,71 @@ def main():
         print("  <university_name>  Download HTML for specific university")
         print("  --all             Download HTML for all universities")
         print("  --list            List all available universities")
+        print("  --status [query]  Corpus status from the manifest")
+        print("                    queries: missing <page_type> | changed [hours] | not-logged-in | negative | timeouts | rebuild")
+        print("  --recrawl-from <file> [batch_size]")
+        print("                    Re-download only the pages listed in html_quality_report.json")
+        print("                    (problem_pages), manifest.jsonl (pages saved without login)")
+        print("                    or data/catalog_diff.json (every page of changed universities)")
+        print("  --refresh-catalog [html] [--prune] [--dry-run]")
+        print("                    Walk the live rankings listing (JSON API, or HTML pages with 'html'),")
+        print("                    merge into universities.json by school_id and write data/catalog_diff.json")
+        print("  --admissions [--all] [--concurrency N] [--rate R] [--direct] [--store] ...")
+        print("                    Run scripts/fetch_admissions_calculator.py (Chrome started with")
+        print("                    --remote-debugging-port=9222 and logged in); --concurrency N loads N tabs at once")
         print("  --help            Show this help")
         print("")
+        print("Options:")
+        print("  --incremental     Re-crawl only changed pages (conditional requests + semantic hash)")
+        print("  --capture-api     Also save admissions_calculator.json from the applying page load")
+        print("  --record-json     Record every US News API JSON response to api_responses.jsonl")
+        print("  --reprobe         Ignore the negative cache (pages that redirected/404'd/hit a CDN error)")
+        print("  --hedge           Re-request pages slower than their type's p95 load time in a second tab")
+        print("")
         print("Examples:")
         print("  python main.py 'Princeton University'")
         print("  python main.py 'Harvard University'")
         print("  python main.py --all")
+        print("  python main.py --all --incremental")
+        print("  python main.py --all --capture-api")
+        print("  python main.py --all --hedge")
         print("  python main.py --list")
+        print("  python main.py --status missing campus-info")
+        print("  python main.py --status changed 24")
+        print("  python main.py --recrawl-from html_quality_report.json")
+        print("  python main.py --recrawl-from downloads/manifest.jsonl 100")
+        print("  python main.py --refresh-catalog --dry-run")
+        print("  python main.py --recrawl-from data/catalog_diff.json")
+        print("  python main.py --admissions --all --concurrency 4 --rate 1")
         
     elif command == "--list":
         list_universities()
         
+    elif command == "--status":
+        show_status(args[1:])
+        
+    elif command == "--recrawl-from":
+        if len(args) < 2:
+            print("Usage: python main.py --recrawl-from <html_quality_report.json|manifest.jsonl|catalog_diff.json> [batch_size]")
+            return
+        batch_size = int(args[2]) if len(args) > 2 else 50
+        recrawl_from(args[1], batch_size=batch_size, capture_api=capture_api, record_json=record_json, hedge=hedge)
+        
+    elif command == "--refresh-catalog":
+        refresh_catalog(args[1:])
+        
+    elif command == "--admissions":
+        fetch_admissions(args[1:])
+        
     elif command == "--all":
-        download_all_html()
+        download_all_html(incremental=incremental, capture_api=capture_api, record_json=record_json, reprobe=reprobe,
+                          hedge=hedge)
         
     else:
         # Treat as university name
-        university_name = " ".join(sys.argv[1:])
-        download_html(university_name)
+        university_name = " ".join(args)
+        download_html(university_name, incremental=incremental, capture_api=capture_api, record_json=record_json,
+                      reprobe=reprobe, hedge=hedge)
 
 
 if __name__ == "__main__":
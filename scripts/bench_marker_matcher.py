@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Marker matcher microbenchmark
+
+Compares the legacy per-pattern ``re.search(..., re.IGNORECASE)`` loops used by
+check_html_status.py / HTMLDownloader._check_login_status with the shared
+MarkerMatcher scan, and checks that both agree. A single combined alternation
+regex over the literal anchors (one pass, candidates verified per pattern) is
+timed as well, as the reference for why MarkerMatcher uses per-anchor ``find``.
+
+Usage:
+  python scripts/bench_marker_matcher.py --size-kb 600 --repeat 20
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from usnews_scraper.markers import (  # noqa: E402
+    MarkerMatcher, SIGN_IN_MARKERS, SIGN_OUT_MARKERS, UPSELL_OR_LOCK_PATTERNS, ERROR_PATTERNS,
+    _literal_anchor, _split_top_level_alternation,
+)
+
+CATEGORIES = {
+    "sign_out": SIGN_OUT_MARKERS,
+    "sign_in": SIGN_IN_MARKERS,
+    "error": ERROR_PATTERNS,
+    "upsell": UPSELL_OR_LOCK_PATTERNS,
+}
+
+
+def make_page(size_kb: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    tokens = [
+        'the', 'student', 'college', 'admission', 'rate', '<div class="Row">', '</div>', 'tuition',
+        'Compass', 'premium', 'data-test-id="label"', 'Sign', 'in-state', 'Log', '\n',
+    ]
+    words = []
+    size = 0
+    while size < size_kb * 1024:
+        word = rng.choice(tokens)
+        words.append(word)
+        size += len(word) + 1
+    # Header sign-out link and an upsell banner, as on real premium pages
+    words.insert(len(words) // 50, '<a href="/logout">Sign Out</a>')
+    words.insert(len(words) // 2, '<span>Try it now</span>')
+    return ' '.join(words)
+
+
+def legacy(text: str) -> dict:
+    out = {}
+    for category, patterns in CATEGORIES.items():
+        for pat in patterns:
+            if re.search(pat, text, re.IGNORECASE):
+                out[category] = pat
+                break
+    return out
+
+
+def single_scan(matcher: MarkerMatcher, text: str) -> dict:
+    scan = matcher.scan(text)
+    return {c: scan.first(c) for c in CATEGORIES if scan.first(c)}
+
+
+class CombinedRegex:
+    """One lookahead alternation over every anchor (overlapping candidates), each candidate verified in place."""
+
+    def __init__(self, categories: dict):
+        self.entries = [(c, p, re.compile(alt, re.IGNORECASE), _literal_anchor(alt))
+                        for c, patterns in categories.items() for p in patterns
+                        for alt in _split_top_level_alternation(p)]
+        anchors = sorted({a for *_, a in self.entries}, key=len, reverse=True)
+        self.candidates = re.compile('(?=(?:' + '|'.join(map(re.escape, anchors)) + '))', re.IGNORECASE)
+
+    def first(self, text: str) -> dict:
+        found = {}
+        for m in self.candidates.finditer(text):
+            pos = m.start()
+            for category, pattern, compiled, _ in self.entries:
+                if (category, pattern) not in found and compiled.match(text, pos):
+                    found[(category, pattern)] = pos
+        out = {}
+        for category, patterns in CATEGORIES.items():
+            for pat in patterns:
+                if (category, pat) in found:
+                    out[category] = pat
+                    break
+        return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Marker matcher microbenchmark")
+    parser.add_argument("--size-kb", type=int, default=600)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    text = make_page(args.size_kb)
+    matcher = MarkerMatcher(CATEGORIES)
+    combined = CombinedRegex(CATEGORIES)
+    assert legacy(text) == single_scan(matcher, text), "matcher disagrees with legacy search"
+    assert legacy(text) == combined.first(text), "combined regex disagrees with legacy search"
+
+    timings = {}
+    for name, fn in (("legacy re.search", lambda: legacy(text)), ("MarkerMatcher", lambda: single_scan(matcher, text)),
+                     ("combined regex", lambda: combined.first(text))):
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            fn()
+        timings[name] = (time.perf_counter() - started) / args.repeat * 1000
+
+    print(f"document: {len(text) / 1024:,.0f} KiB, repeat: {args.repeat}")
+    for name, ms in timings.items():
+        print(f"{name:<18} {ms:8.2f} ms/doc")
+    print(f"speedup: {timings['legacy re.search'] / timings['MarkerMatcher']:.1f}x "
+          f"(combined regex: {timings['legacy re.search'] / timings['combined regex']:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Ranking parser benchmark
+
+Builds a synthetic ranking page with N university cards (nested markup, inline
+SVG and script noise between cards, a few cards without a profile link) and
+compares the legacy whole-file ``re.findall`` extractor from
+extract_universities.py with the streaming ranking_parser, on time, peak
+memory and agreement.
+
+Usage:
+  python scripts/bench_ranking_parser.py --entries 10000 --repeat 3
+"""
+
+import os
+import re
+import sys
+import html
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from usnews_scraper.ranking_parser import parse_ranking_file  # noqa: E402
+
+LEGACY_PATTERN = r'<div[^>]*name="([^"]+)"[^>]*>.*?<a[^>]*href="(/best-colleges/[^"]+)"'
+
+
+def make_page(entries: int, missing_every: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    noise = [
+        '<svg viewBox="0 0 24 24"><path d="M12 2L2 7l10 5 10-5-10-5z"/></svg>',
+        '<span class="Tag">Tuition and fees</span>',
+        '<script type="application/json">{{"ad":"slot-{i}"}}</script>',
+        '<p class="Paragraph">Acceptance rate <strong>{pct}%</strong></p>',
+    ]
+    parts = ['<html><head><title>Best National Universities</title></head><body><ol>']
+    for i in range(entries):
+        name = f"University &amp; College {i}"
+        parts.append(f'<li><div class="DetailCardColleges__Card-sc" name="{name}" data-rank="{i + 1}">')
+        media = ''.join(n.format(i=i, pct=rng.randint(3, 95)) for n in rng.sample(noise, 3))
+        parts.append(f'<div class="Media">{media}</div>')
+        if missing_every and i % missing_every == missing_every - 1:
+            # 프로필 링크가 없는 카드 (광고/스폰서 카드 등)
+            parts.append('<a href="/sponsored/ad">Sponsored</a></div></li>')
+            continue
+        parts.append(f'<h3><a href="/best-colleges/university-and-college-{i}-{10000 + i}?src=rankings" '
+                     f'class="Anchor">University &amp; College {i}</a></h3></div></li>')
+    parts.append('</ol></body></html>')
+    return '\n'.join(parts)
+
+
+def legacy(path: str) -> list:
+    """extract_universities.py before the streaming parser (whole file + DOTALL regex)."""
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        content = f.read()
+    out = []
+    seen = set()
+    for name, href in re.findall(LEGACY_PATTERN, content, re.DOTALL | re.IGNORECASE):
+        name = html.unescape(name)
+        if name in seen:
+            continue
+        seen.add(name)
+        out.append((name, href.split('?')[0]))
+    return out
+
+
+def streaming(path: str) -> list:
+    return [(e.name, e.link) for e in parse_ranking_file(path)]
+
+
+def measure(fn, path: str, repeat: int):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(path)
+    elapsed = (time.perf_counter() - started) / repeat * 1000
+    tracemalloc.start()
+    fn(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ranking page parser benchmark")
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--missing-every", type=int, default=50, help="Every Nth card has no profile link (0 = none)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    page = make_page(args.entries, args.missing_every)
+    with tempfile.NamedTemporaryFile('w', suffix='.html', delete=False, encoding='utf-8') as f:
+        f.write(page)
+        path = f.name
+    try:
+        legacy_result, legacy_ms, legacy_peak = measure(legacy, path, args.repeat)
+        stream_result, stream_ms, stream_peak = measure(streaming, path, args.repeat)
+    finally:
+        os.unlink(path)
+
+    expected = {
+        f"University & College {i}": f"/best-colleges/university-and-college-{i}-{10000 + i}"
+        for i in range(args.entries)
+        if not (args.missing_every and i % args.missing_every == args.missing_every - 1)
+    }
+
+    def wrong(result):
+        return sum(1 for name, link in result if expected.get(name) != link)
+
+    print(f"page: {len(page) / (1024 * 1024):,.1f} MiB, {args.entries:,} cards ({len(expected):,} with profile links)")
+    print(f"{'extractor':<20} {'ms/run':>9} {'peak MiB':>9} {'entries':>8} {'mis-paired':>10}")
+    for name, result, ms, peak in (("legacy re.findall", legacy_result, legacy_ms, legacy_peak),
+                                   ("streaming parser", stream_result, stream_ms, stream_peak)):
+        print(f"{name:<20} {ms:9.1f} {peak / (1024 * 1024):9.1f} {len(result):8,} {wrong(result):10,}")
+    print(f"speedup: {legacy_ms / stream_ms:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Save-path memory benchmark
+
+Compares the legacy page post-processing (str slice + concat, full encode for
+hashing, text write) with the streaming path used by HTMLDownloader (one
+encoded buffer, memoryview slice, chunked hash-and-write). Each variant runs in
+a fresh process so peak RSS is not polluted by the other.
+
+Usage:
+  python scripts/bench_save_html.py --size-kb 900 --pages 20
+"""
+
+import os
+import sys
+import time
+import hashlib
+import argparse
+import tempfile
+import resource
+import tracemalloc
+import multiprocessing as mp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from usnews_scraper.normalize import ContentNormalizer  # noqa: E402
+from usnews_scraper.storage import AtomicFileWriter  # noqa: E402
+
+WIDGET_MARKER = '<div id="blueshift-recommendations-widget"'
+TRUNCATION_TEXT = "\n<!-- Truncated before recommendations widget -->\n"
+
+
+def make_page(size_kb: int) -> str:
+    # Mostly static markup with a volatile fragment (nonce, timestamp, tracking param) every 50 rows
+    plain = '<div class="Row"><span class="Label">Student life 학생 생활</span><a href="/best-colleges/x-1">link</a></div>\n'
+    volatile = (
+        '<div class="Row"><script nonce="n0nce">window.ts="2025-09-27T16:08:03.482Z"</script>'
+        '<a href="/best-colleges/x-1?utm_source=abc">link</a></div>\n'
+    )
+    block = plain * 49 + volatile
+    body = block * max(1, (size_kb * 1024) // len(block.encode('utf-8')))
+    cut = len(body) * 4 // 5
+    return body[:cut] + WIDGET_MARKER + body[cut:]
+
+
+def legacy(page: str, out_path: str, normalizer: ContentNormalizer) -> None:
+    html_content = page
+    idx = html_content.find(WIDGET_MARKER)
+    html_content = html_content[:idx] + TRUNCATION_TEXT
+    hashlib.sha256(html_content.encode('utf-8')).hexdigest()
+    hashlib.sha256(normalizer.normalize(html_content).encode('utf-8')).hexdigest()
+    with open(out_path, 'w', encoding='utf-8') as f:
+        f.write(html_content)
+
+
+def streaming(page: str, out_path: str, normalizer: ContentNormalizer, writer: AtomicFileWriter) -> None:
+    data = page.encode('utf-8')
+    idx = data.find(WIDGET_MARKER.encode('ascii'))
+    kept = memoryview(data)[:idx]
+    normalizer.semantic_hash(kept)
+    writer.write_hashed(out_path, kept, TRUNCATION_TEXT.encode('utf-8'))
+
+
+def run_variant(variant: str, size_kb: int, pages: int, queue) -> None:
+    normalizer = ContentNormalizer()
+    writer = AtomicFileWriter(fsync_batch_size=0, fsync_interval_seconds=0, sync_data=False)
+    out_dir = tempfile.mkdtemp(prefix="bench_save_html_")
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peaks = []
+    started = time.perf_counter()
+    for i in range(pages):
+        page = make_page(size_kb)
+        out_path = os.path.join(out_dir, f"page_{i}.html")
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        if variant == "legacy":
+            legacy(page, out_path, normalizer)
+        else:
+            streaming(page, out_path, normalizer, writer)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peaks.append(peak - base)
+        del page
+    elapsed = time.perf_counter() - started
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    queue.put({
+        "variant": variant,
+        "peak_alloc_per_page": max(peaks),
+        "rss_growth": (rss_after - rss_before) * scale,
+        "ms_per_page": elapsed / pages * 1000,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Save-path memory benchmark")
+    parser.add_argument("--size-kb", type=int, default=900, help="Synthetic page size in KiB")
+    parser.add_argument("--pages", type=int, default=20, help="Pages per variant")
+    args = parser.parse_args()
+
+    ctx = mp.get_context("spawn")
+    results = []
+    for variant in ("legacy", "streaming"):
+        queue = ctx.Queue()
+        proc = ctx.Process(target=run_variant, args=(variant, args.size_kb, args.pages, queue))
+        proc.start()
+        results.append(queue.get())
+        proc.join()
+
+    page_bytes = len(make_page(args.size_kb).encode('utf-8'))
+    print(f"page size: {page_bytes / 1024:,.0f} KiB, pages per variant: {args.pages}")
+    print(f"{'variant':<10} {'peak alloc/page':>16} {'peak RSS growth':>16} {'ms/page':>9}")
+    for r in results:
+        print(f"{r['variant']:<10} {r['peak_alloc_per_page'] / 1024:>13,.0f} KiB "
+              f"{r['rss_growth'] / 1024:>13,.0f} KiB {r['ms_per_page']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Multi-tab capture benchmark
+
+Captures the same slice of schools from universities.json once per
+``--concurrency`` value through the attached, logged-in Chrome (same
+prerequisites as fetch_admissions_calculator.py) and reports wall time,
+schools/s and the speedup over the first value. Payloads go to a throwaway
+NDJSON store, so downloads/ is not touched. Use a different ``--offset`` per
+run (or clear the browser cache) if warm-cache loads should not favour the
+later values.
+
+Usage:
+  python scripts/bench_tab_concurrency.py --limit 20 --concurrency 1,4 --rate 2
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from usnews_scraper.catalog import UniversityCatalog  # noqa: E402
+from fetch_admissions_calculator import (  # noqa: E402
+    AdmissionsOutput, admissions_file_for, read_universities, run_browser_jobs, setup_logger,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-tab capture benchmark")
+    parser.add_argument("--universities", type=str, default="data/universities.json")
+    parser.add_argument("--debugger-address", type=str, default="127.0.0.1:9222")
+    parser.add_argument("--limit", type=int, default=20, help="Schools per run")
+    parser.add_argument("--offset", type=int, default=0, help="First school of the slice")
+    parser.add_argument("--concurrency", type=str, default="1,4", help="Comma-separated tab counts to compare")
+    parser.add_argument("--rate", type=float, default=2.0, help="Tab page loads per second (multi-tab runs)")
+    parser.add_argument("--wait", type=int, default=30)
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds between schools (sequential run)")
+    args = parser.parse_args()
+    setup_logger()
+
+    catalog = UniversityCatalog(read_universities(args.universities))
+    entries = [e for e in catalog if e.school_id][args.offset:args.offset + args.limit]
+    jobs = [(e.name, e.link, e.school_id, admissions_file_for(e.name)) for e in entries]
+    if not jobs:
+        print("no schools to capture")
+        return
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for concurrency in [int(c) for c in args.concurrency.split(",") if c.strip()]:
+            run_args = argparse.Namespace(debugger_address=args.debugger_address, concurrency=concurrency,
+                                          rate=args.rate, wait=args.wait, delay=args.delay)
+            output = AdmissionsOutput(os.path.join(tmp, f"bench_{concurrency}.ndjson"))
+            started = time.perf_counter()
+            saved, skipped = run_browser_jobs(jobs, run_args, output)
+            elapsed = time.perf_counter() - started
+            output.close()
+            results.append((concurrency, elapsed, saved, skipped))
+
+    print(f"schools: {len(jobs)}, rate: {args.rate:g} loads/s")
+    base = results[0][1]
+    for concurrency, elapsed, saved, skipped in results:
+        print(f"concurrency {concurrency:<3} {elapsed:8.1f} s  {len(jobs) / elapsed:6.2f} schools/s  "
+              f"saved {saved:<4} skipped {skipped:<4} speedup {base / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
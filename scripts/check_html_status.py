@@ -6,17 +6,51 @@ Downloads HTML Validator
 - 에러 페이지 판별
 - 콘텐츠 로딩/완전성 판별
 
-결과는 JSON 하나로만 저장합니다.
+결과는 JSON 하나로 저장하거나(--json), 파일마다 한 줄씩 스트리밍 JSONL로 저장합니다(--jsonl).
 """
 
-import re
+import os
+import sys
 import json
+import mmap
+import hashlib
+import inspect
 import argparse
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+from dataclasses import dataclass, asdict
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
-from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from usnews_scraper import markers, page_check  # noqa: E402
+from usnews_scraper.markers import (  # noqa: E402
+    SIGN_IN_MARKERS, SIGN_OUT_MARKERS, ACCOUNT_MARKERS, UPSELL_OR_LOCK_PATTERNS, ERROR_PATTERNS,
+)
+from usnews_scraper.page_check import PageChecker  # noqa: E402
+
+# 검사 결과 캐시 파일명 (downloads 폴더 아래, 검사 순서대로 정렬된 JSONL)
+CACHE_FILENAME = ".validator_cache.jsonl"
+# 결과 형식 등 markers.py/page_check.py 밖의 판정 변경 시 올림
+CHECK_RULES_REVISION = 1
+# 병렬 스트리밍 검사 시 워커당 동시에 처리 중인 파일 수 상한
+STREAM_WINDOW_PER_WORKER = 16
+
+
+def _rules_version() -> str:
+    """Cache version: hash of the marker lists and the matcher/checker code, so any rule edit invalidates the cache."""
+    digest = hashlib.sha256()
+    patterns = [SIGN_IN_MARKERS, SIGN_OUT_MARKERS, ACCOUNT_MARKERS, UPSELL_OR_LOCK_PATTERNS, ERROR_PATTERNS]
+    digest.update(json.dumps([CHECK_RULES_REVISION, patterns], ensure_ascii=False).encode('utf-8'))
+    for module in (markers, page_check):
+        digest.update(inspect.getsource(module).encode('utf-8'))
+    return f"{CHECK_RULES_REVISION}-{digest.hexdigest()[:16]}"
+
+
+# 이 규칙 버전이 바뀌면 캐시 전체 무효화
+CHECK_RULES_VERSION = _rules_version()
 
 
 @dataclass
@@ -32,66 +66,207 @@ class PageCheckResult:
     file_size: int
 
 
-class DownloadsValidator:
-    def __init__(self, downloads_dir: str = "downloads", verbose: bool = False):
-        self.downloads_dir = Path(downloads_dir)
-        self.results: List[PageCheckResult] = []
-        self.verbose = verbose
+def _is_problem(result: PageCheckResult) -> bool:
+    return not result.is_logged_in or result.is_error_page
 
-        # 로그인/프리미엄 판별 관련 텍스트
-        self.sign_in_markers = [r'\bSign in\b', r'\bLog in\b', r'로그인']
-        self.sign_out_markers = [r'\bSign out\b', r'\bLog out\b', r'로그아웃']
-        self.account_markers = [r'My Account', r'Profile', r'Settings']
-
-        # 비로그인/업셀/락 표시 (비로그인 힌트)
-        self.upsell_or_lock_patterns = [
-            r'\bTry it now\b',
-            r'compass.*unlock',
-            r'premium.*unlock',
-            r'College Compass',
-        ]
-
-        # 에러/차단/빈 페이지 판별(일반적인 텍스트 + USNews 일부 패턴)
-        self.error_patterns = [
-            r'404 Not Found',
-            r'403 Forbidden',
-            r'401 Unauthorized',
-            r'We hit a snag',
-            r'An error occurred',
-            r'Access Denied',
-            r'akamai error',
-            r'cf-error',
-            r'Captcha|captcha',
-        ]
-
-
-    def _match(self, pattern: str, text: str) -> bool:
-        return re.search(pattern, text, re.IGNORECASE) is not None
-
-    def _matches_any(self, patterns: List[str], text: str) -> Optional[str]:
-        for pat in patterns:
-            if re.search(pat, text, re.IGNORECASE):
-                return pat
-        return None
 
-    def _extract_canonical(self, content: str) -> Optional[str]:
-        m = re.search(r'<link[^>]+rel=["\']canonical["\'][^>]+href=["\']([^"\']+)', content, re.IGNORECASE)
-        if m:
-            return m.group(1)
+@dataclass
+class ReportTotals:
+    """Running summary counters (same keys as the JSON report summary)."""
+    total_files: int = 0
+    problem_files: int = 0
+    logged_in_files: int = 0
+    not_logged_in_files: int = 0
+    error_pages: int = 0
+
+    def add(self, result: PageCheckResult) -> None:
+        self.total_files += 1
+        self.problem_files += _is_problem(result)
+        self.logged_in_files += result.is_logged_in
+        self.not_logged_in_files += not result.is_logged_in
+        self.error_pages += result.is_error_page
+
+
+# ========== 검사 결과 캐시 ==========
+# 캐시 줄: [university, file name, size, mtime_ns, compact status]
+# compact status: [logged_in, premium, error_page, content_ok, file_size, issues]
+CacheKey = Tuple[str, str]
+CacheEntry = Tuple[CacheKey, List[int], List[Any]]
+
+
+def _compact_status(result: PageCheckResult) -> List[Any]:
+    return [int(result.is_logged_in), int(result.is_premium), int(result.is_error_page), int(result.content_ok),
+            result.file_size, result.issues]
+
+
+def _expand_status(path: Path, status: List[Any]) -> PageCheckResult:
+    logged_in, premium, error_page, content_ok, file_size, issues = status
+    return PageCheckResult(
+        university=path.parent.name,
+        file_type=path.stem,
+        path=str(path),
+        is_logged_in=bool(logged_in),
+        is_premium=bool(premium),
+        is_error_page=bool(error_page),
+        content_ok=bool(content_ok),
+        issues=list(issues),
+        file_size=file_size,
+    )
+
+
+class _CacheReader:
+    """
+    Streams the previous cache in key order alongside the (sorted) scan, so
+    lookups are a merge join and the cache is never loaded into memory.
+    """
+
+    def __init__(self, path: Path, enabled: bool):
+        self._file = None
+        self._current: Optional[CacheEntry] = None
+        if not enabled or not path.exists():
+            return
+        try:
+            self._file = open(path, 'r', encoding='utf-8')
+            header = json.loads(self._file.readline() or '{}')
+        except Exception:
+            header = {}
+        if not isinstance(header, dict) or header.get('version') != CHECK_RULES_VERSION:
+            self.close()
+            return
+        self._advance()
+
+    def _advance(self) -> None:
+        self._current = None
+        while self._file is not None:
+            line = self._file.readline()
+            if not line:
+                return
+            try:
+                university, name, size, mtime_ns, status = json.loads(line)
+            except (ValueError, TypeError):
+                # 중단된 쓰기로 잘린 줄 등은 건너뜀
+                continue
+            self._current = ((university, name), [size, mtime_ns], status)
+            return
+
+    def take(self, key: CacheKey, passthrough=None) -> Optional[CacheEntry]:
+        """The entry for ``key`` if present; entries before it are handed to ``passthrough`` (or dropped)."""
+        while self._current is not None and self._current[0] < key:
+            if passthrough is not None:
+                passthrough(self._current)
+            self._advance()
+        if self._current is not None and self._current[0] == key:
+            entry = self._current
+            self._advance()
+            return entry
         return None
 
-    def _is_premium_by_canonical(self, canonical_url: Optional[str]) -> bool:
-        if not canonical_url:
-            return False
+    def drain(self, passthrough) -> None:
+        while self._current is not None:
+            passthrough(self._current)
+            self._advance()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._current = None
+
+
+class _CacheWriter:
+    """Writes the new cache line by line to a temp file, renamed over the cache only after a complete scan."""
+
+    def __init__(self, path: Path, enabled: bool):
+        self.path = path
+        self._tmp_path = path.with_name(path.name + '.part')
+        self._file = None
+        if enabled:
+            try:
+                self._file = open(self._tmp_path, 'w', encoding='utf-8')
+                self._file.write(json.dumps({'version': CHECK_RULES_VERSION}) + "\n")
+            except OSError as e:
+                print(f'캐시 저장 실패: {e}')
+                self._file = None
+
+    def write(self, entry: CacheEntry) -> None:
+        if self._file is not None:
+            (university, name), stat_key, status = entry
+            self._file.write(json.dumps([university, name, *stat_key, status], ensure_ascii=False) + "\n")
+
+    def commit(self) -> None:
+        if self._file is None:
+            return
         try:
-            host = urlparse(canonical_url).hostname or ''
-        except Exception:
-            return False
-        return host.startswith('premium.usnews.com')
+            self._file.close()
+            os.replace(self._tmp_path, self.path)
+        except OSError as e:
+            print(f'캐시 저장 실패: {e}')
+        self._file = None
+
+    def abort(self) -> None:
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        try:
+            os.remove(self._tmp_path)
+        except OSError:
+            pass
+
+
+def _read_text_mmap(file_path: Path) -> str:
+    """Path.read_text(errors='ignore')와 동일한 결과를 mmap 기반으로 읽습니다."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            content = str(mm, 'utf-8', 'ignore')
+    # read_text의 universal newlines 동작과 맞춤
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+# 워커 프로세스별 검사기 (ProcessPoolExecutor initializer에서 생성)
+_worker_validator: Optional["DownloadsValidator"] = None
+
+
+def _init_worker(downloads_dir: str, verbose: bool) -> None:
+    global _worker_validator
+    _worker_validator = DownloadsValidator(downloads_dir, verbose=verbose)
+
+
+def _check_in_worker(path: str) -> "PageCheckResult":
+    return _worker_validator.check_file(Path(path))
+
+
+class DownloadsValidator:
+    def __init__(self, downloads_dir: str = "downloads", verbose: bool = False, workers: int = 1, use_cache: bool = True):
+        self.downloads_dir = Path(downloads_dir)
+        self.results: List[PageCheckResult] = []
+        self.verbose = verbose
+        self.workers = max(1, workers)
+        self.use_cache = use_cache
+        self.cache_path = self.downloads_dir / CACHE_FILENAME
+
+        # 로그인/프리미엄/업셀/에러 판별 패턴 (usnews_scraper.markers와 공유)
+        self.sign_in_markers = list(SIGN_IN_MARKERS)
+        self.sign_out_markers = list(SIGN_OUT_MARKERS)
+        self.account_markers = list(ACCOUNT_MARKERS)
+        self.upsell_or_lock_patterns = list(UPSELL_OR_LOCK_PATTERNS)
+        self.error_patterns = list(ERROR_PATTERNS)
+
+        # 다운로더의 저장 전 검사와 같은 판정 로직 (usnews_scraper.page_check)
+        self.checker = PageChecker({
+            'sign_out': self.sign_out_markers,
+            'sign_in': self.sign_in_markers,
+            'error': self.error_patterns,
+            'upsell': self.upsell_or_lock_patterns,
+        })
 
     def check_file(self, file_path: Path) -> PageCheckResult:
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = _read_text_mmap(file_path)
         except Exception as e:
             return PageCheckResult(
                 university=file_path.parent.name,
@@ -105,50 +280,12 @@ class DownloadsValidator:
                 file_size=0,
             )
 
-        issues: List[str] = []
         file_size = len(content)
-
-        # canonical 검사로 premium 여부 우선 판정
-        canonical = self._extract_canonical(content)
-        is_premium = self._is_premium_by_canonical(canonical)
-        if canonical:
-            issues.append(f'canonical:{canonical}')
-        if is_premium:
-            issues.append('premium_by_canonical')
-
-        # 로그인 여부: canonical URL 기준으로 우선 판단
-        is_logged_in = False
-        if is_premium:
-            # premium canonical이면 로그인으로 간주
-            is_logged_in = True
-            issues.append('login_hit:premium_host')
-        elif canonical and 'www.usnews.com' in canonical:
-            # www.usnews.com canonical이면 비로그인으로 간주
-            is_logged_in = False
-            issues.append('not_logged_in:www_host')
-        elif self._matches_any(self.sign_out_markers, content):
-            # Sign out/Log out이 있으면 로그인으로 간주
-            is_logged_in = True
-            issues.append('login_hit:signout')
-        elif self._matches_any(self.sign_in_markers, content):
-            # Sign in/Log in이 있으면 비로그인으로 간주
-            is_logged_in = False
-            issues.append('login_hint:signin_present')
-        else:
-            # canonical URL이 없거나 다른 호스트면 불확실
-            is_logged_in = False
-            issues.append('not_logged_in:no_canonical_or_unknown_host')
-
-        # 에러페이지 판단
-        error_hit = self._matches_any(self.error_patterns, content)
-        is_error_page = bool(error_hit)
-        if error_hit:
-            issues.append(f'error_hit:{error_hit}')
-
-        # 업셀/락 힌트 기록(참고용)
-        upsell_hit = self._matches_any(self.upsell_or_lock_patterns, content)
-        if upsell_hit:
-            issues.append(f'upsell:{upsell_hit}')
+        check = self.checker.check(content)
+        is_logged_in = check.is_logged_in
+        is_premium = check.is_premium
+        is_error_page = check.is_error_page
+        issues = list(check.issues)
 
         # 콘텐츠 완전성은 항상 True로 설정 (로직 제거)
         content_ok = True
@@ -168,30 +305,132 @@ class DownloadsValidator:
             file_size=file_size,
         )
 
-    def scan(self, only_university: Optional[str] = None) -> List[PageCheckResult]:
+    def _iter_checked(self, items: Iterator[Tuple[Path, Any, Optional[PageCheckResult]]]) -> Iterator[Tuple[Path, Any, PageCheckResult]]:
+        """
+        (path, tag, cached result or None)를 받아 입력 순서대로 결과를 내보냅니다.
+        병렬 모드에서도 동시에 처리 중인 파일 수를 제한해 메모리가 코퍼스 크기에 비례하지 않게 합니다.
+        """
+        if self.workers <= 1:
+            for path, tag, cached in items:
+                yield path, tag, cached if cached is not None else self.check_file(path)
+            return
+        window = self.workers * STREAM_WINDOW_PER_WORKER
+        pool: Optional[ProcessPoolExecutor] = None
+        inflight: deque = deque()
+        try:
+            for path, tag, cached in items:
+                if cached is None and pool is None:
+                    # 캐시 미스가 처음 나올 때만 워커 풀 생성
+                    pool = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        initializer=_init_worker,
+                        initargs=(str(self.downloads_dir), self.verbose),
+                    )
+                inflight.append((path, tag, cached if cached is not None else pool.submit(_check_in_worker, str(path))))
+                while len(inflight) >= window or (inflight and not isinstance(inflight[0][2], Future)):
+                    done_path, done_tag, value = inflight.popleft()
+                    yield done_path, done_tag, value.result() if isinstance(value, Future) else value
+            while inflight:
+                done_path, done_tag, value = inflight.popleft()
+                yield done_path, done_tag, value.result() if isinstance(value, Future) else value
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+    def iter_results(self, only_university: Optional[str] = None) -> Iterator[PageCheckResult]:
+        """Check every page (cache hits reused) and yield results one by one in directory order."""
         if not self.downloads_dir.exists():
             print(f'downloads 폴더가 없습니다: {self.downloads_dir}')
-            return []
-        results: List[PageCheckResult] = []
+            return
         uni_dirs = [d for d in self.downloads_dir.iterdir() if d.is_dir()]
         if only_university:
             uni_dirs = [d for d in uni_dirs if d.name == only_university]
         uni_dirs = sorted(uni_dirs)
         print(f"대상 대학교 수: {len(uni_dirs)}")
-        for idx, uni_dir in enumerate(uni_dirs, 1):
-            html_files = sorted(uni_dir.glob('*.html'))
-            print(f"[{idx}/{len(uni_dirs)}] {uni_dir.name} - 파일 {len(html_files)}개 검사")
-            for html in html_files:
-                results.append(self.check_file(html))
-        self.results = results
-        return results
+
+        # 이전 캐시와 새 캐시 모두 (대학교, 파일명) 순서로 스트리밍 - 코퍼스 크기와 무관한 메모리
+        reader = _CacheReader(self.cache_path, self.use_cache)
+        writer = _CacheWriter(self.cache_path, self.use_cache)
+        # 특정 대학교만 검사할 때는 다른 대학교의 캐시 항목을 그대로 옮겨 씀
+        passthrough = (lambda entry: entry[0][0] != only_university and writer.write(entry)) if only_university else None
+        counts = {'hit': 0, 'miss': 0}
+
+        def entries() -> Iterator[Tuple[Path, Any, Optional[PageCheckResult]]]:
+            # 파일 목록 + (size, mtime) 키 수집, 캐시 적중 여부 판단 (대학교 단위로 지연 생성)
+            for idx, uni_dir in enumerate(uni_dirs, 1):
+                html_files = sorted(uni_dir.glob('*.html'))
+                print(f"[{idx}/{len(uni_dirs)}] {uni_dir.name} - 파일 {len(html_files)}개 검사")
+                for html in html_files:
+                    try:
+                        st = html.stat()
+                        stat_key = [st.st_size, st.st_mtime_ns]
+                    except OSError:
+                        stat_key = None
+                    cache_key = (uni_dir.name, html.name)
+                    cached = reader.take(cache_key, passthrough)
+                    if stat_key is not None and cached and cached[1] == stat_key:
+                        counts['hit'] += 1
+                        yield html, (cache_key, stat_key), _expand_status(html, cached[2])
+                    else:
+                        counts['miss'] += 1
+                        yield html, (cache_key, stat_key), None
+
+        # 새 파일/변경된 파일만 (병렬) 검사, 원래 순서대로 결과 전달 + 캐시 갱신
+        try:
+            for html, (cache_key, stat_key), result in self._iter_checked(entries()):
+                if stat_key is not None:
+                    writer.write((cache_key, stat_key, _compact_status(result)))
+                yield result
+            if passthrough is not None:
+                reader.drain(passthrough)
+        except BaseException:
+            # 중단된 검사로 캐시를 덮어쓰지 않음
+            writer.abort()
+            raise
+        finally:
+            reader.close()
+
+        if self.use_cache:
+            print(f"캐시 적중: {counts['hit']}개, 새로 검사: {counts['miss']}개")
+        writer.commit()
+
+    def scan(self, only_university: Optional[str] = None) -> List[PageCheckResult]:
+        self.results = list(self.iter_results(only_university))
+        return self.results
+
+    def stream_jsonl_report(self, output: str, only_university: Optional[str] = None, problems_only: bool = False) -> ReportTotals:
+        """
+        Check pages and write one JSONL line per result as it is produced.
+
+        Results are not kept in memory; the summary comes from running totals
+        and is written as the last line ({"summary": ..., "timestamp": ...}).
+        """
+        totals = ReportTotals()
+        tmp_path = output + '.part'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for result in self.iter_results(only_university):
+                totals.add(result)
+                if problems_only and not _is_problem(result):
+                    continue
+                f.write(json.dumps(asdict(result), ensure_ascii=False) + "\n")
+            f.write(json.dumps({'summary': asdict(totals), 'timestamp': datetime.now().isoformat()}, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, output)
+        print(f'JSONL 리포트 저장: {output}')
+        return totals
+
+    @staticmethod
+    def print_totals(totals: ReportTotals) -> None:
+        print("\n" + "="*60)
+        print("HTML 상태 검사 결과")
+        print("="*60)
+        print(f"총 파일 수: {totals.total_files}")
+        print(f"로그인된 파일: {totals.logged_in_files}")
+        print(f"에러 페이지: {totals.error_pages}")
+        print(f"문제 페이지: {totals.problem_files}")
 
     def print_summary(self) -> None:
         # 문제가 있는 페이지만 필터링
-        problem_pages = []
-        for r in self.results:
-            if not r.is_logged_in or r.is_error_page:
-                problem_pages.append(r)
+        problem_pages = [r for r in self.results if _is_problem(r)]
         
         print("\n" + "="*60)
         print("HTML 상태 검사 결과")
@@ -216,18 +455,12 @@ class DownloadsValidator:
 
     def save_json_report(self, output: str = 'html_quality_report.json') -> None:
         # 문제가 있는 페이지만 필터링 (링크만 포함)
-        problem_pages = []
-        for r in self.results:
-            if not r.is_logged_in or r.is_error_page:
-                problem_pages.append(r.path)
+        problem_pages = [r.path for r in self.results if _is_problem(r)]
         
-        summary: Dict[str, int] = {
-            'total_files': len(self.results),
-            'problem_files': len(problem_pages),
-            'logged_in_files': sum(1 for r in self.results if r.is_logged_in),
-            'not_logged_in_files': sum(1 for r in self.results if not r.is_logged_in),
-            'error_pages': sum(1 for r in self.results if r.is_error_page),
-        }
+        totals = ReportTotals()
+        for r in self.results:
+            totals.add(r)
+        summary: Dict[str, int] = asdict(totals)
         
         report = {
             'timestamp': datetime.now().isoformat(),
@@ -244,14 +477,29 @@ def parse_args():
     parser.add_argument('--university', type=str, default=None, help='특정 대학교명만 검사 (예: Princeton_University)')
     parser.add_argument('--verbose', action='store_true', help='진행 로그 출력')
     parser.add_argument('--json', action='store_true', help='JSON 리포트 생성')
-    parser.add_argument('--output', type=str, default='html_quality_report.json', help='JSON 리포트 파일명 (--json 옵션과 함께 사용)')
+    parser.add_argument('--jsonl', action='store_true', help='파일마다 한 줄씩 바로 쓰는 스트리밍 JSONL 리포트 (결과를 메모리에 모으지 않음)')
+    parser.add_argument('--problems-only', action='store_true', help='JSONL 리포트에 문제 페이지(비로그인/에러)만 기록')
+    parser.add_argument('--output', type=str, default=None, help='리포트 파일명 (기본: html_quality_report.json / .jsonl)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='병렬 검사 프로세스 수 (1 = 직렬)')
+    parser.add_argument('--no-cache', action='store_true', help='검사 결과 캐시를 사용하지 않고 전체 재검사')
     return parser.parse_args()
 
 
 def main():
     args = parse_args()
     print('Downloads HTML Validator 실행')
-    validator = DownloadsValidator(verbose=args.verbose)
+    validator = DownloadsValidator(verbose=args.verbose, workers=args.workers, use_cache=not args.no_cache)
+    
+    # 스트리밍 모드: 결과를 모으지 않고 한 줄씩 기록, 요약은 누적 카운터로 계산
+    if args.jsonl:
+        totals = validator.stream_jsonl_report(args.output or 'html_quality_report.jsonl', args.university, args.problems_only)
+        if not totals.total_files:
+            print('검사할 HTML이 없습니다.')
+            return
+        validator.print_totals(totals)
+        print('\n완료')
+        return
+    
     results = validator.scan(only_university=args.university)
     if not results:
         print('검사할 HTML이 없습니다.')
@@ -262,7 +510,7 @@ def main():
     
     # --json 옵션이 있으면 JSON 리포트도 생성
     if args.json:
-        validator.save_json_report(args.output)
+        validator.save_json_report(args.output or 'html_quality_report.json')
     
     print('\n완료')
 
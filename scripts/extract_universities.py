@@ -3,22 +3,22 @@
 ranking.html에서 universities.json 추출 스크립트
 
 US News ranking.html 파일에서 대학교 정보를 추출하여 universities.json을 생성합니다.
+파일은 청크 단위 HTMLParser 한 번의 스트리밍 패스로 처리합니다 (usnews_scraper.ranking_parser).
 """
 
-import re
+import os
+import sys
 import json
 import argparse
-import html
 from pathlib import Path
-from typing import List, Dict
-from dataclasses import dataclass
+from typing import List
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 
-@dataclass
-class University:
-    name: str
-    link: str
-    id: str
+from usnews_scraper.ranking_parser import RankingEntry, parse_ranking_file  # noqa: E402
+
+# 하위 호환: 추출 결과 타입 (name, link, school_id)
+University = RankingEntry
 
 
 class UniversityExtractor:
@@ -33,49 +33,12 @@ class UniversityExtractor:
             return []
 
         try:
-            content = self.ranking_file.read_text(encoding='utf-8', errors='ignore')
+            # 카드(div name=...)마다 뒤따르는 첫 /best-colleges/ 링크와 짝지음, 이름 기준 중복 제거
+            self.universities = parse_ranking_file(str(self.ranking_file))
         except Exception as e:
             print(f"파일 읽기 오류: {e}")
             return []
-
-        universities = []
-        
-        # 대학교 정보를 추출하는 패턴들
-        # 1. name 속성과 href 속성을 가진 div 요소에서 추출
-        name_pattern = r'name="([^"]+)"'
-        href_pattern = r'href="(/best-colleges/[^"]+)"'
-        
-        # 2. 정규식으로 대학교 정보 추출
-        # div 요소에서 name과 href를 함께 찾기
-        div_pattern = r'<div[^>]*name="([^"]+)"[^>]*>.*?<a[^>]*href="(/best-colleges/[^"]+)"'
-        
-        matches = re.findall(div_pattern, content, re.DOTALL | re.IGNORECASE)
-        
-        for name, href in matches:
-            # href에서 ID 추출 (예: /best-colleges/princeton-university-2627 -> 2627)
-            id_match = re.search(r'-(\d+)(?:\?|$)', href)
-            university_id = id_match.group(1) if id_match else ""
-            
-            # href에서 쿼리 파라미터 제거
-            clean_href = href.split('?')[0]
-            
-            university = University(
-                name=html.unescape(name),  # HTML 엔티티 디코딩
-                link=clean_href,
-                id=university_id
-            )
-            universities.append(university)
-        
-        # 중복 제거 (name 기준)
-        seen_names = set()
-        unique_universities = []
-        for uni in universities:
-            if uni.name not in seen_names:
-                seen_names.add(uni.name)
-                unique_universities.append(uni)
-        
-        self.universities = unique_universities
-        return unique_universities
+        return self.universities
 
     def save_json(self, output_file: str = "data/universities.json") -> None:
         """JSON 파일로 저장"""
@@ -88,7 +51,8 @@ class UniversityExtractor:
         for uni in self.universities:
             json_data.append({
                 "name": uni.name,
-                "link": uni.link
+                "link": uni.link,
+                "school_id": uni.school_id
             })
 
         # 출력 디렉토리 생성
@@ -110,7 +74,7 @@ class UniversityExtractor:
         print(f"\n추출된 대학교 수: {len(self.universities)}")
         print("\n처음 10개 대학교:")
         for i, uni in enumerate(self.universities[:10], 1):
-            print(f"{i:2d}. {uni.name} (ID: {uni.id})")
+            print(f"{i:2d}. {uni.name} (ID: {uni.school_id})")
         
         if len(self.universities) > 10:
             print(f"... 및 {len(self.universities) - 10}개 더")
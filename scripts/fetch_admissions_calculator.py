@@ -2,12 +2,24 @@
 """
 Fetch Admissions Calculator JSON via existing Chrome login session.
 
-Workflow:
+Workflow (default, browser capture):
 - Connect to an already-running Chrome with remote debugging enabled
-- Navigate to the university's applying page
-- Capture DevTools performance logs and filter the admissions-calculator API
+- Install a fetch/XHR hook for the admissions-calculator API (NetworkCapture) before navigating
+- Navigate to the university's applying page and wait until the matching response has loaded
+  (falls back to polling DevTools performance logs if the hook cannot be installed)
 - Save the first successful JSON response to downloads/<University>/admissions_calculator.json
 
+Workflow (--direct):
+- Capture the login cookies from the running Chrome once (SessionManager)
+- Call the admissions-calculator API directly for each school_id over a pooled,
+  rate-limited HTTP session (usnews_scraper.admissions_api)
+- Fall back to the browser capture above only for schools the API call could not serve
+
+Output (--store):
+- Instead of one pretty-printed file per university, append compact records
+  (school_id, name, fetched_at, hash, payload) to one NDJSON file indexed by school_id;
+  payloads whose hash did not change are not rewritten (usnews_scraper.admissions_store)
+
 Prerequisites:
 1) Launch Chrome with remote debugging and an isolated user-data-dir to keep your login session:
    /Applications/Google\ Chrome.app/Contents/MacOS/Google\ Chrome \
@@ -20,26 +32,48 @@ Usage examples:
   python scripts/fetch_admissions_calculator.py --name "Princeton University"
   python scripts/fetch_admissions_calculator.py --link "/best-colleges/princeton-university-2627"
   python scripts/fetch_admissions_calculator.py --school-id 2627 --name "Princeton University"
+  python scripts/fetch_admissions_calculator.py --all --direct --rate 2
+  python scripts/fetch_admissions_calculator.py --all --concurrency 4 --rate 1
+  python scripts/fetch_admissions_calculator.py --all --direct --store
 """
 
 import os
-import re
+import sys
 import json
 import time
 import argparse
 import logging
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from usnews_scraper.admissions_api import (  # noqa: E402
+    ADMISSIONS_API_PREFIX, API_AUTH, API_NOT_FOUND, API_OK, AdmissionsApiClient, dump_admissions_json,
+)
+from usnews_scraper.admissions_store import AdmissionsStore, DEFAULT_ADMISSIONS_STORE  # noqa: E402
+from usnews_scraper.catalog import USNEWS_ORIGINS, UniversityCatalog, school_id_from_link  # noqa: E402
+from usnews_scraper.rate_limit import RateLimiter  # noqa: E402
+from usnews_scraper.storage import AtomicFileWriter  # noqa: E402
+from usnews_scraper.selenium import SeleniumConfig, SessionManager, NetworkCapture, literal_pattern  # noqa: E402
+
 
 BASE_URL = "https://premium.usnews.com"
 APPLYING_SEGMENT = "applying"
-ADMISSIONS_API_PREFIX = (
-    "https://premium.usnews.com/best-colleges/compass/api/admissions-calculator?school_id="
-)
+
+# 연속 인증 실패가 이 횟수를 넘으면 세션을 한 번 다시 캡처하고, 그래도 실패하면 브라우저 경로로 전환
+MAX_CONSECUTIVE_AUTH_FAILURES = 3
+
+# --concurrency: 탭 하나를 확인할 때 응답을 기다리는 최대 시간(초) — 짧게 두고 다른 탭으로 넘어감
+TAB_POLL_SECONDS = 0.25
+
+# (university name, link, school_id, output file)
+Job = Tuple[str, str, str, Path]
 
 
 def setup_logger() -> None:
@@ -55,10 +89,7 @@ def slugify_name(name: str) -> str:
 
 
 def derive_school_id_from_link(link: str) -> Optional[str]:
-    if not link:
-        return None
-    match = re.search(r'-(\d+)(?:\?|$)', link)
-    return match.group(1) if match else None
+    return school_id_from_link(link) or None
 
 
 def construct_url_from_link(link: str, page_type: str) -> str:
@@ -86,20 +117,23 @@ def read_universities(universities_path: str) -> list[dict[str, Any]]:
         return []
 
 
-def find_university(universities: list[dict[str, Any]], name_query: str) -> Optional[dict[str, Any]]:
-    if not name_query:
-        return None
-    q = name_query.lower()
-    for u in universities:
-        if q in str(u.get('name', '')).lower():
-            return {"name": u.get("name", ""), "link": u.get("link", "")}
-    return None
+def find_university(catalog: UniversityCatalog, name_query: str) -> Optional[dict[str, Any]]:
+    """Exact name/slug/link/school_id match first, then the best ranked fuzzy match."""
+    entry = catalog.resolve(name_query) if name_query else None
+    return entry.as_info() if entry else None
 
 
-def create_driver_attached_to_existing(debugger_address: str = "127.0.0.1:9222") -> Optional[webdriver.Chrome]:
-    """Attach to an existing Chrome with remote debugging enabled and enable performance logs."""
+def create_driver_attached_to_existing(debugger_address: str = "127.0.0.1:9222",
+                                       page_load_strategy: str = "normal") -> Optional[webdriver.Chrome]:
+    """
+    Attach to an existing Chrome with remote debugging enabled and enable performance logs.
+
+    ``page_load_strategy="none"`` makes every command return without waiting for the
+    current tab's load, which --concurrency needs to poll several loading tabs.
+    """
     try:
         options = Options()
+        options.page_load_strategy = page_load_strategy
         options.add_experimental_option("debuggerAddress", debugger_address)
         # Enable performance logging to capture Network.* events via driver.get_log('performance')
         options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
@@ -142,8 +176,24 @@ def extract_cdp_message(entry: dict[str, Any]) -> Optional[dict[str, Any]]:
         return None
 
 
-def capture_first_admissions_json(driver: webdriver.Chrome, wait_seconds: int = 30) -> Optional[dict[str, Any]]:
-    """Poll performance logs to find the first successful admissions-calculator response and return its JSON body."""
+def school_response_pattern(school_id: str) -> str:
+    """
+    JavaScript RegExp matching only this school's admissions-calculator URL.
+
+    ``school_id=2627`` must not match ``school_id=26270``, and a late response for
+    the previous school (or another tab's school) must not be taken for this one.
+    """
+    return literal_pattern(f"{ADMISSIONS_API_PREFIX}{school_id}") + "(&|#|$)"
+
+
+def is_school_response(url: str, school_id: str) -> bool:
+    """Python-side twin of school_response_pattern for the performance-log fallback."""
+    prefix = f"{ADMISSIONS_API_PREFIX}{school_id}"
+    return url.startswith(prefix) and url[len(prefix):len(prefix) + 1] in ("", "&", "#")
+
+
+def capture_first_admissions_json(driver: webdriver.Chrome, school_id: str, wait_seconds: int = 30) -> Optional[dict[str, Any]]:
+    """Poll performance logs to find the first successful admissions-calculator response for ``school_id`` and return its JSON body."""
     deadline = time.time() + max(1, wait_seconds)
     seen_request_ids: set[str] = set()
     while time.time() < deadline:
@@ -162,7 +212,7 @@ def capture_first_admissions_json(driver: webdriver.Chrome, wait_seconds: int =
             request_id = params.get("requestId")
             if not request_id or request_id in seen_request_ids:
                 continue
-            if not url.startswith(ADMISSIONS_API_PREFIX):
+            if not is_school_response(url, school_id):
                 continue
             if status != 200:
                 continue
@@ -188,16 +238,387 @@ def capture_first_admissions_json(driver: webdriver.Chrome, wait_seconds: int =
     return None
 
 
-def ensure_download_dir(university_name: str, downloads_root: str = "downloads") -> Path:
-    uni_dir = Path(downloads_root) / slugify_name(university_name)
-    uni_dir.mkdir(parents=True, exist_ok=True)
-    return uni_dir
+def admissions_file_for(university_name: str, downloads_root: str = "downloads") -> Path:
+    return Path(downloads_root) / slugify_name(university_name) / "admissions_calculator.json"
+
+
+def save_admissions_json(out_file: Path, data: Any, writer: Optional[AtomicFileWriter] = None) -> None:
+    """Write admissions_calculator.json atomically (temp file + rename)."""
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    if writer is not None:
+        writer.write_text(str(out_file), dump_admissions_json(data))
+        return
+    writer = AtomicFileWriter(fsync_batch_size=0, fsync_interval_seconds=0)
+    writer.write_text(str(out_file), dump_admissions_json(data))
+    writer.flush()
+
+
+class AdmissionsOutput:
+    """Where captured payloads go: per-university JSON files (default) or one NDJSON store (--store)."""
+
+    def __init__(self, store_path: Optional[str] = None):
+        self.writer = AtomicFileWriter()
+        self.store = AdmissionsStore(store_path) if store_path else None
+        self.unchanged = 0
+
+    def exists(self, job: Job) -> bool:
+        if self.store is not None:
+            return job[2] in self.store
+        return job[3].exists()
+
+    def location(self, job: Job) -> str:
+        if self.store is not None:
+            return f"{self.store.path} (school_id={job[2]})"
+        return str(job[3])
+
+    def save(self, job: Job, data: Any) -> None:
+        """Persist one payload; in store mode an unchanged payload (same hash) is not rewritten."""
+        uni_name, _, school_id, out_file = job
+        if self.store is None:
+            save_admissions_json(out_file, data, self.writer)
+            return
+        if not self.store.put(school_id, uni_name, data):
+            self.unchanged += 1
+            logging.info(f"⏭️ Unchanged payload (same hash), not rewritten: {uni_name}")
+
+    def close(self) -> None:
+        self.writer.flush()
+        if self.store is not None:
+            self.store.maybe_compact()
+
+
+def wait_for_captured_json(capture: NetworkCapture, school_id: str, wait_seconds: int) -> Optional[Any]:
+    """Wait for this school's hooked admissions-calculator response (no polling) and return its JSON body."""
+    response = capture.wait_for(timeout=max(1, wait_seconds), status=200, url_pattern=school_response_pattern(school_id))
+    if response is None:
+        return None
+    if response.truncated:
+        logging.warning(f"⚠️ Captured response was truncated ({len(response.body)} chars): {response.url}")
+        return None
+    try:
+        return response.json()
+    except ValueError:
+        logging.warning(f"⚠️ Captured response is not JSON: {response.url}")
+        return None
+
+
+def capture_via_browser(driver: webdriver.Chrome, job: Job, wait_seconds: int, output: AdmissionsOutput,
+                        capture: Optional[NetworkCapture] = None) -> bool:
+    """Navigate to the applying page and save the first admissions-calculator response."""
+    uni_name, link, school_id, out_file = job
+    if capture is None or not capture.installed:
+        # Clear perf log buffer before navigating (polling fallback)
+        _ = get_performance_entries(driver)
+    else:
+        # 이전 학교 문서에서 늦게 도착한 응답은 버림
+        capture.drain()
+    driver.get(construct_url_from_link(link, APPLYING_SEGMENT))
+    logging.info("🔎 Waiting for admissions-calculator API response...")
+    if capture is not None and capture.installed:
+        data = wait_for_captured_json(capture, school_id, wait_seconds)
+    else:
+        data = capture_first_admissions_json(driver, school_id, wait_seconds=wait_seconds)
+    if not data:
+        logging.warning("⏭️ No API response captured within timeout")
+        return False
+    try:
+        output.save(job, data)
+        logging.info(f"✅ Saved: {output.location(job)}")
+        return True
+    except Exception as e:
+        logging.error(f"❌ Save failed: {e}")
+        return False
+
+
+def capture_session(debugger_address: str) -> Optional[SessionManager]:
+    """Capture login cookies (and User-Agent) from the running debug Chrome."""
+    session_manager = SessionManager(SeleniumConfig(debugger_address=debugger_address))
+    if not session_manager.capture_session_from_existing(USNEWS_ORIGINS) or not session_manager.session_cookies:
+        logging.error("❌ Could not capture login cookies from the running Chrome")
+        return None
+    return session_manager
+
+
+def fetch_direct(jobs: List[Job], debugger_address: str, rate: float, output: AdmissionsOutput) -> Tuple[int, int, List[Job]]:
+    """
+    Fetch admissions JSON straight from the API for every job.
+
+    Returns:
+        (saved, skipped, jobs that need the browser fallback)
+    """
+    session_manager = capture_session(debugger_address)
+    if session_manager is None:
+        return 0, 0, list(jobs)
+
+    client = AdmissionsApiClient.from_session_manager(session_manager, rate_limiter=RateLimiter(rate=rate))
+    saved = 0
+    skipped = 0
+    fallback: List[Job] = []
+    consecutive_auth = 0
+    recaptured = False
+    try:
+        for index, job in enumerate(jobs):
+            uni_name, link, school_id, out_file = job
+            result = client.fetch_admissions(school_id, referer=construct_url_from_link(link, APPLYING_SEGMENT))
+            if result.status == API_OK:
+                consecutive_auth = 0
+                try:
+                    output.save(job, result.data)
+                    logging.info(f"✅ [{index + 1}/{len(jobs)}] {uni_name} ({result.elapsed:.2f}s)")
+                    saved += 1
+                except Exception as e:
+                    logging.error(f"❌ Save failed for {uni_name}: {e}")
+                    skipped += 1
+                continue
+            if result.status == API_NOT_FOUND:
+                logging.info(f"⏭️ [{index + 1}/{len(jobs)}] {uni_name}: no admissions data (HTTP {result.http_status})")
+                skipped += 1
+                continue
+
+            logging.warning(f"⚠️ [{index + 1}/{len(jobs)}] {uni_name}: API {result.status} ({result.error}) - browser fallback")
+            fallback.append(job)
+            if result.status != API_AUTH:
+                continue
+            consecutive_auth += 1
+            if consecutive_auth < MAX_CONSECUTIVE_AUTH_FAILURES:
+                continue
+            if recaptured:
+                # 세션을 다시 잡아도 인증이 안 되면 남은 학교는 모두 브라우저 경로로
+                logging.error("❌ API session keeps failing authentication - switching to browser capture")
+                fallback.extend(jobs[index + 1:])
+                break
+            logging.info("🔐 Re-capturing login session from Chrome...")
+            recaptured = True
+            consecutive_auth = 0
+            refreshed = capture_session(debugger_address)
+            if refreshed is None:
+                fallback.extend(jobs[index + 1:])
+                break
+            client.load_cookies(refreshed.session_cookies)
+    finally:
+        client.close()
+    return saved, skipped, fallback
+
+
+@dataclass
+class CaptureTab:
+    """One browser tab used by --concurrency: its window handle, capture hook and in-flight job."""
+    handle: str
+    capture: NetworkCapture
+    job: Optional[Job] = None
+    deadline: float = 0.0
+    left_url: str = ""  # 네비게이션 직전 주소 (바뀌면 새 문서가 커밋된 것)
+
+
+def open_capture_tabs(driver: webdriver.Chrome, count: int) -> List[CaptureTab]:
+    """Open up to ``count`` new tabs, each with its own admissions-calculator hook."""
+    tabs: List[CaptureTab] = []
+    for _ in range(count):
+        try:
+            driver.switch_to.new_window("tab")
+        except Exception as e:
+            logging.warning(f"⚠️ Could not open a new tab: {e}")
+            break
+        capture = NetworkCapture(driver, [literal_pattern(ADMISSIONS_API_PREFIX)])
+        if not capture.install():
+            try:
+                driver.close()
+            except Exception:
+                pass
+            break
+        tabs.append(CaptureTab(driver.current_window_handle, capture))
+    return tabs
+
+
+def close_capture_tabs(driver: webdriver.Chrome, tabs: List[CaptureTab], home_handle: str) -> None:
+    """Remove the hooks, close the tabs opened by open_capture_tabs and return to the original tab."""
+    for tab in tabs:
+        try:
+            driver.switch_to.window(tab.handle)
+            tab.capture.uninstall()
+            driver.close()
+        except Exception:
+            pass
+    try:
+        driver.switch_to.window(home_handle)
+    except Exception:
+        pass
+
+
+def run_tabs_concurrently(driver: webdriver.Chrome, jobs: List[Job], args: argparse.Namespace,
+                          output: AdmissionsOutput) -> Optional[Tuple[int, int]]:
+    """
+    Capture jobs in ``args.concurrency`` tabs of the attached Chrome at once.
+
+    A single WebDriver session drives every tab, so the tabs are served round-robin:
+    each idle tab starts its next applying page (navigations share one RateLimiter at
+    ``args.rate``), and each busy tab is checked briefly for a captured response while
+    the others keep loading in the background.
+
+    The driver must be attached with ``page_load_strategy="none"``: under the default
+    strategies chromedriver holds every command on a tab until that tab's document
+    is loaded, which turns the round-robin back into one load at a time. A busy tab
+    is only polled once its new document has committed (its address changed), so the
+    capture wait never runs on the previous school's document.
+
+    Returns:
+        (saved, skipped), or None if no capture tab could be opened
+    """
+    home_handle = driver.current_window_handle
+    tabs = open_capture_tabs(driver, min(args.concurrency, len(jobs)))
+    if not tabs:
+        return None
+
+    limiter = RateLimiter(rate=args.rate)
+    pending = deque(jobs)
+    total = len(jobs)
+    saved = 0
+    skipped = 0
+    logging.info(f"🗂️ Capturing {total} schools in {len(tabs)} tabs ({args.rate:g} page loads/s)")
+
+    def finish(tab: CaptureTab, data: Optional[Any], reason: str = "") -> None:
+        nonlocal saved, skipped
+        job = tab.job
+        uni_name = job[0]
+        tab.job = None
+        progress = f"[{saved + skipped + 1}/{total}]"
+        if data is None:
+            logging.warning(f"⏭️ {progress} {uni_name}: {reason}")
+            skipped += 1
+            return
+        try:
+            output.save(job, data)
+            logging.info(f"✅ {progress} {uni_name} -> {output.location(job)}")
+            saved += 1
+        except Exception as e:
+            logging.error(f"❌ {progress} Save failed for {uni_name}: {e}")
+            skipped += 1
+
+    try:
+        while tabs and (pending or any(tab.job for tab in tabs)):
+            for tab in list(tabs):
+                if tab.job is None and not pending:
+                    continue
+                try:
+                    driver.switch_to.window(tab.handle)
+                    if tab.job is None:
+                        limiter.acquire()
+                        tab.job = pending.popleft()
+                        tab.deadline = time.monotonic() + max(1, args.wait)
+                        # 이 탭의 이전 학교 응답이 새 학교로 저장되지 않도록 버퍼를 비움
+                        tab.capture.drain()
+                        tab.left_url = driver.execute_script("return location.href;")
+                        # 비동기 네비게이션: 로드는 백그라운드에서 진행되고 다음 탭으로 넘어감
+                        driver.execute_script("window.location.assign(arguments[0]);",
+                                              construct_url_from_link(tab.job[1], APPLYING_SEGMENT))
+                        continue
+                    if driver.execute_script("return location.href;") == tab.left_url:
+                        # 아직 이전 문서 (새 문서 커밋 전) → 응답 대기 없이 다음 탭으로
+                        response = None
+                    else:
+                        response = tab.capture.wait_for(timeout=TAB_POLL_SECONDS, status=200,
+                                                        url_pattern=school_response_pattern(tab.job[2]))
+                except Exception as e:
+                    # 탭이 닫혔거나 크래시 → 해당 탭의 작업은 스킵하고 탭을 뺌
+                    logging.warning(f"⚠️ Tab lost ({type(e).__name__}) - continuing with {len(tabs) - 1} tabs")
+                    if tab.job is not None:
+                        finish(tab, None, "tab lost")
+                    tabs.remove(tab)
+                    continue
+                if response is not None:
+                    if response.truncated:
+                        finish(tab, None, f"captured response truncated ({len(response.body)} chars)")
+                        continue
+                    try:
+                        finish(tab, response.json())
+                    except ValueError:
+                        finish(tab, None, "captured response is not JSON")
+                elif time.monotonic() >= tab.deadline:
+                    finish(tab, None, "no API response captured within timeout")
+        if pending:
+            logging.warning(f"⏭️ {len(pending)} schools left unprocessed (no usable tabs)")
+            skipped += len(pending)
+    finally:
+        close_capture_tabs(driver, tabs, home_handle)
+    return saved, skipped
+
+
+def run_browser_jobs(jobs: List[Job], args: argparse.Namespace, output: AdmissionsOutput) -> Tuple[int, int]:
+    """Capture each job through the applying page in the attached Chrome; returns (saved, skipped)."""
+    if not jobs:
+        return 0, 0
+    multi_tab = args.concurrency > 1 and len(jobs) > 1
+    driver = create_driver_attached_to_existing(args.debugger_address, "none" if multi_tab else "normal")
+    if not driver:
+        return 0, len(jobs)
+    saved = 0
+    skipped = 0
+    capture = None
+    try:
+        if multi_tab:
+            result = run_tabs_concurrently(driver, jobs, args, output)
+            if result is not None:
+                return result
+            logging.warning("⚠️ Multi-tab capture unavailable - processing sequentially")
+            # 순차 경로는 driver.get이 로드를 기다려야 하므로 기본 전략으로 다시 연결
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            driver = create_driver_attached_to_existing(args.debugger_address)
+            if not driver:
+                return 0, len(jobs)
+        # 응답 완료 이벤트로 깨어나는 페이지 내 훅 (설치 실패 시 performance 로그 폴링으로 대체)
+        capture = NetworkCapture(driver, [literal_pattern(ADMISSIONS_API_PREFIX)])
+        if not capture.install():
+            logging.warning("⚠️ Network capture hook unavailable - polling performance logs instead")
+        for i, job in enumerate(jobs):
+            uni_name, link, school_id, _ = job
+            logging.info("\n=" * 30)
+            logging.info(f"📘 {uni_name}")
+            logging.info(f"🎯 {construct_url_from_link(link, APPLYING_SEGMENT)}")
+            logging.info(f"🎯 {ADMISSIONS_API_PREFIX}{school_id}")
+            if capture_via_browser(driver, job, args.wait, output, capture):
+                saved += 1
+            else:
+                skipped += 1
+            if args.delay > 0 and i < len(jobs) - 1:
+                time.sleep(args.delay)
+    finally:
+        # 사용자의 Chrome에 붙어 있으므로 등록한 훅은 반드시 제거
+        if capture is not None:
+            capture.uninstall()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    return saved, skipped
+
+
+def run_jobs(jobs: List[Job], args: argparse.Namespace, output: AdmissionsOutput) -> Tuple[int, int]:
+    """Direct API first (when --direct), then the browser path for whatever is left; returns (saved, skipped)."""
+    saved = 0
+    skipped = 0
+    try:
+        if args.direct:
+            logging.info(f"⚡ Direct API mode: {len(jobs)} schools at {args.rate:g} req/s")
+            saved, skipped, jobs = fetch_direct(jobs, args.debugger_address, args.rate, output)
+            if jobs and args.no_browser_fallback:
+                logging.warning(f"⏭️ {len(jobs)} schools need the browser path (disabled by --no-browser-fallback)")
+                skipped += len(jobs)
+                jobs = []
+            elif jobs:
+                logging.info(f"🌐 Browser fallback for {len(jobs)} schools")
+        browser_saved, browser_skipped = run_browser_jobs(jobs, args, output)
+    finally:
+        output.close()
+    return saved + browser_saved, skipped + browser_skipped
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     setup_logger()
     parser = argparse.ArgumentParser(description="Fetch Admissions Calculator JSON using existing Chrome session")
-    parser.add_argument("--name", type=str, default="", help="University name (partial match from data/universities.json)")
+    parser.add_argument("--name", type=str, default="", help="University name (exact, acronym or ranked fuzzy match from data/universities.json)")
     parser.add_argument("--link", type=str, default="", help="University link path like /best-colleges/princeton-university-2627")
     parser.add_argument("--school-id", type=str, default="", help="Override school_id explicitly")
     parser.add_argument("--universities", type=str, default="data/universities.json", help="Path to universities.json")
@@ -206,11 +627,19 @@ def main():
     # Batch options
     parser.add_argument("--all", action="store_true", help="Process all universities from the JSON list")
     parser.add_argument("--limit", type=int, default=0, help="Limit number of universities to process in --all mode")
-    parser.add_argument("--delay", type=float, default=1.0, help="Seconds to wait between universities in --all mode")
-    parser.add_argument("--overwrite", action="store_true", help="Overwrite existing admissions_calculator.json if present")
-    args = parser.parse_args()
-
-    # If batch mode, iterate all using a single driver attach
+    parser.add_argument("--delay", type=float, default=1.0, help="Seconds to wait between universities in --all mode (sequential only)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Browser tabs to capture in parallel (page loads limited by --rate)")
+    parser.add_argument("--overwrite", action="store_true", help="Re-fetch schools that already have data (store mode still skips unchanged payloads)")
+    parser.add_argument("--store", nargs="?", const=DEFAULT_ADMISSIONS_STORE, default=None,
+                        help=f"Append compact records to one NDJSON store instead of per-university files (default: {DEFAULT_ADMISSIONS_STORE})")
+    # Direct API options
+    parser.add_argument("--direct", action="store_true", help="Call the admissions API directly with the captured session cookies")
+    parser.add_argument("--rate", type=float, default=2.0, help="Max API requests (--direct) or tab page loads (--concurrency) per second")
+    parser.add_argument("--no-browser-fallback", action="store_true", help="In --direct mode, do not retry failures through the browser")
+    args = parser.parse_args(argv)
+    output = AdmissionsOutput(args.store)
+
+    # If batch mode, build the job list and run it with a single session/driver
     if args.all:
         universities = read_universities(args.universities)
         if not universities:
@@ -221,76 +650,34 @@ def main():
         if limit is not None:
             universities = universities[:limit]
 
-        driver = create_driver_attached_to_existing(args.debugger_address)
-        if not driver:
-            return
-
+        catalog = UniversityCatalog(universities)
+        jobs: List[Job] = []
         processed = 0
-        saved = 0
-        skipped = 0
-
-        try:
-            for u in universities:
-                uni_name = str(u.get("name", "")).strip()
-                link = str(u.get("link", "")).strip()
-                if not uni_name or not link:
-                    skipped += 1
-                    continue
-
-                school_id = derive_school_id_from_link(link) or ""
-                if not school_id:
-                    logging.warning(f"⏭️ No school_id for: {uni_name}")
-                    skipped += 1
-                    continue
+        # 이름/링크가 없거나 링크가 중복된 항목은 카탈로그에 들어가지 않음
+        skipped = len(universities) - len(catalog)
+        for entry in catalog:
+            uni_name, link, school_id = entry.name, entry.link, entry.school_id
+            if not school_id:
+                logging.warning(f"⏭️ No school_id for: {uni_name}")
+                skipped += 1
+                continue
 
-                applying_url = construct_url_from_link(link, APPLYING_SEGMENT)
-                logging.info("\n=" * 30)
-                logging.info(f"📘 {uni_name}")
-                logging.info(f"🎯 {applying_url}")
-                logging.info(f"🎯 {ADMISSIONS_API_PREFIX}{school_id}")
-
-                # Ensure output path
-                out_dir = ensure_download_dir(uni_name)
-                out_file = out_dir / "admissions_calculator.json"
-                if out_file.exists() and not args.overwrite:
-                    logging.info(f"⏭️ Already exists, skipping (use --overwrite to replace): {out_file}")
-                    skipped += 1
-                    processed += 1
-                    if args.delay > 0:
-                        time.sleep(args.delay)
-                    continue
+            job = (uni_name, link, school_id, admissions_file_for(uni_name))
+            processed += 1
+            if not args.overwrite and output.exists(job):
+                logging.info(f"⏭️ Already exists, skipping (use --overwrite to replace): {output.location(job)}")
+                skipped += 1
+                continue
+            jobs.append(job)
 
-                # Clear perf log buffer and navigate
-                _ = get_performance_entries(driver)
-                driver.get(applying_url)
-                logging.info("🔎 Waiting for admissions-calculator API response...")
-                data = capture_first_admissions_json(driver, wait_seconds=args.wait)
-                if not data:
-                    logging.warning("⏭️ No API response captured within timeout")
-                    skipped += 1
-                else:
-                    try:
-                        with open(out_file, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, ensure_ascii=False, indent=2)
-                        logging.info(f"✅ Saved: {out_file}")
-                        saved += 1
-                    except Exception as e:
-                        logging.error(f"❌ Save failed: {e}")
-                        skipped += 1
-
-                processed += 1
-                if args.delay > 0:
-                    time.sleep(args.delay)
-
-        finally:
-            try:
-                driver.quit()
-            except Exception:
-                pass
+        saved, run_skipped = run_jobs(jobs, args, output)
+        skipped += run_skipped
 
         logging.info("\n📦 Batch result")
         logging.info(f"Processed: {processed}")
         logging.info(f"Saved:     {saved}")
+        if output.store is not None:
+            logging.info(f"Unchanged: {output.unchanged} (same payload hash, not rewritten)")
         logging.info(f"Skipped:   {skipped}")
         return
 
@@ -307,7 +694,7 @@ def main():
         if not uni_name:
             logging.error("❌ --name is required (partial match supported)")
             return
-        found = find_university(universities, uni_name)
+        found = find_university(UniversityCatalog(universities), uni_name)
         if not found:
             logging.error(f"❌ University not found for name: {uni_name}")
             return
@@ -325,35 +712,9 @@ def main():
     logging.info(f"🎯 Target applying page: {applying_url}")
     logging.info(f"🎯 Admissions API prefix: {ADMISSIONS_API_PREFIX}{school_id}")
 
-    driver = create_driver_attached_to_existing(args.debugger_address)
-    if not driver:
-        return
-
-    try:
-        # Make sure performance log buffer is empty before navigation
-        _ = get_performance_entries(driver)
-
-        logging.info("🌐 Navigating to applying page...")
-        driver.get(applying_url)
-
-        # Wait a little for SPA/network to kick in and then poll logs
-        logging.info("🔎 Waiting for admissions-calculator API response...")
-        data = capture_first_admissions_json(driver, wait_seconds=args.wait)
-        if not data:
-            logging.error("❌ Admissions-calculator API response not captured within timeout.")
-            return
-
-        out_dir = ensure_download_dir(uni_name)
-        out_file = out_dir / "admissions_calculator.json"
-        with open(out_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        logging.info(f"✅ Saved: {out_file}")
-
-    finally:
-        try:
-            driver.quit()
-        except Exception:
-            pass
+    saved, _ = run_jobs([(uni_name, link, school_id, admissions_file_for(uni_name))], args, output)
+    if not saved:
+        logging.error("❌ Admissions-calculator API response not captured.")
 
 
 if __name__ == "__main__":
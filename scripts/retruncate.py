@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Re-cut stored pages before the recommendations widget
+
+Applies the current widget marker list (optionally per page type) to pages
+already under downloads/, so a marker added after a crawl does not require a
+re-download. Pages are rewritten through the same temp-file + rename writer as
+the downloader, and crawl_state.json / manifest.jsonl hashes are updated.
+
+A page can only be cut further: content removed by an earlier cut is gone and
+needs a re-crawl to restore.
+
+Usage:
+  python scripts/retruncate.py --downloads-dir downloads
+  python scripts/retruncate.py --markers markers.json --dry-run
+  python scripts/retruncate.py --university harvard-university
+
+markers.json maps page types ("main", "applying", ...) to marker lists;
+unlisted page types use usnews_scraper.markers.WIDGET_MARKERS.
+"""
+
+import os
+import sys
+import json
+import argparse
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from usnews_scraper.markers import DEFAULT_WIDGET_FINDER, TRUNCATION_SUFFIX, WidgetCutFinder  # noqa: E402
+from usnews_scraper.normalize import ContentNormalizer  # noqa: E402
+from usnews_scraper.crawl_state import CrawlState, page_key, page_type_from_filename  # noqa: E402
+from usnews_scraper.manifest import CorpusManifest  # noqa: E402
+from usnews_scraper.storage import AtomicFileWriter  # noqa: E402
+
+
+class Retruncator:
+    def __init__(self, downloads_dir: str, markers_by_page_type: Optional[Dict[str, List[str]]] = None,
+                 dry_run: bool = False):
+        self.downloads_dir = downloads_dir
+        self.dry_run = dry_run
+        self.finders: Dict[str, WidgetCutFinder] = {
+            page_key(ptype): WidgetCutFinder(markers) for ptype, markers in (markers_by_page_type or {}).items()
+        }
+        self.normalizer = ContentNormalizer()
+        self.writer = AtomicFileWriter()
+        self.crawl_state = CrawlState(os.path.join(downloads_dir, "crawl_state.json"))
+        self.manifest = CorpusManifest(os.path.join(downloads_dir, "manifest.jsonl"))
+        self.stats = {"scanned": 0, "recut": 0, "unchanged": 0, "bytes_removed": 0}
+
+    def retruncate_file(self, university: str, path: str) -> bool:
+        """Re-cut one page; returns True if it was (or would be) rewritten."""
+        page_type = page_type_from_filename(os.path.basename(path))
+        with open(path, 'rb') as f:
+            data = f.read()
+        self.stats["scanned"] += 1
+
+        body_end = len(data) - len(TRUNCATION_SUFFIX) if data.endswith(TRUNCATION_SUFFIX) else len(data)
+        finder = self.finders.get(page_key(page_type), DEFAULT_WIDGET_FINDER)
+        cut = finder.find(data, body_end)
+        if cut is None or cut[0] == 0:
+            self.stats["unchanged"] += 1
+            return False
+
+        cut_end, marker = cut
+        new_size = cut_end + len(TRUNCATION_SUFFIX)
+        self.stats["recut"] += 1
+        self.stats["bytes_removed"] += len(data) - new_size
+        print(f"✂️ {university}/{os.path.basename(path)} [{marker}] {len(data):,} → {new_size:,} bytes")
+        if self.dry_run:
+            return True
+
+        body = memoryview(data)[:cut_end]
+        semantic = self.normalizer.semantic_hash(body)
+        previous = self.manifest.get(university, page_type) or {}
+
+        def on_commit(raw: str, size: int) -> None:
+            self.crawl_state.record_content(university, page_type, raw, semantic, size)
+            self.manifest.record(university, page_type, path, size, raw, semantic, previous.get("logged_in"))
+
+        self.writer.write_hashed(path, body, TRUNCATION_SUFFIX, on_commit=on_commit)
+        return True
+
+    def run(self, university: Optional[str] = None) -> Dict[str, int]:
+        if not os.path.isdir(self.downloads_dir):
+            print(f"❌ 다운로드 폴더가 없습니다: {self.downloads_dir}")
+            return self.stats
+        try:
+            for uni_entry in sorted(os.scandir(self.downloads_dir), key=lambda e: e.name):
+                if not uni_entry.is_dir() or (university and uni_entry.name != university):
+                    continue
+                for file_entry in sorted(os.scandir(uni_entry.path), key=lambda e: e.name):
+                    if file_entry.is_file() and file_entry.name.endswith('.html'):
+                        self.retruncate_file(uni_entry.name, file_entry.path)
+        finally:
+            if not self.dry_run:
+                self.writer.flush()
+                self.crawl_state.save()
+                self.manifest.maybe_compact()
+        return self.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-cut stored HTML before the recommendations widget')
+    parser.add_argument('--downloads-dir', default='downloads', help='Downloads root directory')
+    parser.add_argument('--markers', help='JSON file: {page_type: [marker, ...]} (default: built-in markers)')
+    parser.add_argument('--university', help='Only process this university directory (slug)')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would be cut without writing')
+    args = parser.parse_args()
+
+    markers_by_page_type = None
+    if args.markers:
+        with open(args.markers, 'r', encoding='utf-8') as f:
+            markers_by_page_type = json.load(f)
+
+    stats = Retruncator(args.downloads_dir, markers_by_page_type, args.dry_run).run(args.university)
+    verb = "잘라낼 예정" if args.dry_run else "다시 자름"
+    print(f"\n📊 검사 {stats['scanned']}개 / {verb} {stats['recut']}개 / 변경 없음 {stats['unchanged']}개"
+          f" / 제거 {stats['bytes_removed']:,} bytes")
+
+
+if __name__ == '__main__':
+    main()
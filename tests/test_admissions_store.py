@@ -0,0 +1,78 @@
+import json
+
+from usnews_scraper.admissions_store import AdmissionsStore, payload_hash
+
+
+def _lines(path):
+    return path.read_bytes().splitlines()
+
+
+def test_payload_hash_ignores_key_order():
+    assert payload_hash({"a": 1, "b": [1, 2]}) == payload_hash({"b": [1, 2], "a": 1})
+    assert payload_hash({"a": 1}) != payload_hash({"a": 2})
+
+
+def test_unchanged_payload_is_not_rewritten(tmp_path):
+    path = tmp_path / "admissions.ndjson"
+    store = AdmissionsStore(str(path))
+    assert store.put("2627", "Princeton University", {"gpa": 3.9})
+    assert not store.put(2627, "Princeton University", {"gpa": 3.9})
+    assert store.put("2627", "Princeton University", {"gpa": 3.95})
+    assert len(_lines(path)) == 2
+    assert store.get("2627")["payload"] == {"gpa": 3.95}
+    assert "2627" in store and len(store) == 1
+
+
+def test_reload_keeps_latest_line_per_school(tmp_path):
+    path = tmp_path / "admissions.ndjson"
+    store = AdmissionsStore(str(path))
+    store.put("1", "A", {"v": 1})
+    store.put("2", "B", {"v": 1})
+    store.put("1", "A", {"v": 2})
+    reloaded = AdmissionsStore(str(path))
+    assert reloaded.get("1")["payload"] == {"v": 2}
+    assert {k: r["payload"] for k, r in reloaded.load_all().items()} == {"1": {"v": 2}, "2": {"v": 1}}
+    assert not reloaded.put("1", "A", {"v": 2})
+
+
+def test_torn_last_line_is_truncated_on_load(tmp_path):
+    path = tmp_path / "admissions.ndjson"
+    store = AdmissionsStore(str(path))
+    store.put("1", "A", {"v": 1})
+    intact = path.stat().st_size
+    with open(path, "ab") as f:
+        f.write(b'{"school_id":"2","name":"B","payl')  # 중단된 쓰기
+    reloaded = AdmissionsStore(str(path))
+    assert path.stat().st_size == intact
+    assert "2" not in reloaded
+    # 다음 append가 잘린 줄에 이어 붙지 않음
+    reloaded.put("2", "B", {"v": 1})
+    assert [json.loads(line)["school_id"] for line in _lines(path)] == ["1", "2"]
+
+
+def test_corrupt_middle_line_is_skipped(tmp_path):
+    path = tmp_path / "admissions.ndjson"
+    store = AdmissionsStore(str(path))
+    store.put("1", "A", {"v": 1})
+    with open(path, "ab") as f:
+        f.write(b"not json\n")
+    store = AdmissionsStore(str(path))
+    store.put("2", "B", {"v": 1})
+    assert set(AdmissionsStore(str(path)).load_all()) == {"1", "2"}
+
+
+def test_compaction_keeps_only_latest_lines(tmp_path):
+    path = tmp_path / "admissions.ndjson"
+    store = AdmissionsStore(str(path))
+    for version in range(3):
+        store.put("1", "A", {"v": version})
+    store.put("2", "B", {"v": 0})
+    store.maybe_compact()  # 4줄 / 2개교 → 아직 압축하지 않음
+    assert len(_lines(path)) == 4
+    store.put("1", "A", {"v": 3})
+    store.maybe_compact()
+    assert len(_lines(path)) == 2
+    assert store.get("1")["payload"] == {"v": 3} and store.get("2")["payload"] == {"v": 0}
+    assert not list(tmp_path.glob("*.part"))
+    reloaded = AdmissionsStore(str(path))
+    assert {k: r["payload"] for k, r in reloaded.load_all().items()} == {"1": {"v": 3}, "2": {"v": 0}}
@@ -0,0 +1,81 @@
+import logging
+
+import pytest
+
+from usnews_scraper.catalog import CONTAINMENT_BONUS, UniversityCatalog
+
+UNIVERSITIES = [
+    {"name": "Princeton University", "link": "/best-colleges/princeton-university-2627"},
+    {"name": "Massachusetts Institute of Technology", "link": "/best-colleges/massachusetts-institute-of-technology-2178"},
+    {"name": "Georgia Institute of Technology", "link": "/best-colleges/georgia-institute-of-technology-1569"},
+    {"name": "University of Texas--Austin", "link": "/best-colleges/university-of-texas-austin-3658"},
+    {"name": "Texas A&M University", "link": "/best-colleges/texas-am-university-10366"},
+    {"name": "Texas Tech University", "link": "/best-colleges/texas-tech-university-3644"},
+    {"name": "Texas State University", "link": "/best-colleges/texas-state-university-3615"},
+    {"name": "Union College (NY)", "link": "/best-colleges/union-college-ny-2889"},
+    {"name": "Union College (KY)", "link": "/best-colleges/union-college-ky-1978"},
+    {"name": "Duplicate Princeton", "link": "/best-colleges/princeton-university-2627/"},
+    {"name": "", "link": "/best-colleges/nameless-1"},
+]
+
+
+@pytest.fixture
+def catalog():
+    return UniversityCatalog(UNIVERSITIES)
+
+
+def test_duplicate_links_and_nameless_entries_are_ignored(catalog):
+    assert len(catalog) == 9
+    assert catalog.get_by_link("/best-colleges/princeton-university-2627").name == "Princeton University"
+    assert [e.rank_order for e in catalog] == list(range(9))
+
+
+@pytest.mark.parametrize("query", [
+    "/best-colleges/princeton-university-2627",
+    "https://www.usnews.com/best-colleges/princeton-university-2627/",
+    "/best-colleges/princeton-university-2627?int=nav",
+    "2627",
+    "Princeton_University",
+    "princeton   UNIVERSITY",
+])
+def test_lookup_exact(catalog, query):
+    assert catalog.lookup(query).name == "Princeton University"
+
+
+def test_lookup_has_no_fuzzy_fallback(catalog):
+    assert catalog.lookup("princeton") is None
+    assert catalog.lookup("") is None
+    assert catalog.lookup("9999") is None
+
+
+def test_resolve_unique_acronym(catalog):
+    assert catalog.resolve("MIT").name == "Massachusetts Institute of Technology"
+    assert catalog.resolve("m.i.t.").name == "Massachusetts Institute of Technology"
+
+
+def test_search_prefix_bonus(catalog):
+    results = catalog.search("georgia tech")
+    assert results[0][0].name == "Georgia Institute of Technology"
+    assert results[0][1] >= CONTAINMENT_BONUS
+    assert all(score < CONTAINMENT_BONUS for _, score in results[1:])
+    assert catalog.resolve("texas tech").name == "Texas Tech University"
+
+
+def test_equal_scores_keep_ranking_order(catalog):
+    results = catalog.search("union college")
+    assert [e.name for e, _ in results[:2]] == ["Union College (NY)", "Union College (KY)"]
+    assert results[0][1] == results[1][1]
+
+
+def test_resolve_ambiguous_query_warns(catalog, caplog):
+    with caplog.at_level(logging.WARNING, logger="usnews_scraper.catalog"):
+        assert catalog.resolve("texas").name == "Texas Tech University"
+    assert "Texas State University" in caplog.text
+    assert "University of Texas--Austin" not in caplog.text
+
+
+def test_resolve_exact_match_wins_without_warning(catalog, caplog):
+    with caplog.at_level(logging.WARNING, logger="usnews_scraper.catalog"):
+        assert catalog.resolve("Texas A&M University").name == "Texas A&M University"
+    assert caplog.text == ""
+    assert catalog.resolve("zzzz") is None
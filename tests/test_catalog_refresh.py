@@ -0,0 +1,161 @@
+import json
+
+import pytest
+
+from usnews_scraper import catalog_refresh
+from usnews_scraper.catalog import UniversityCatalog
+from usnews_scraper.catalog_refresh import (
+    SOURCE_API, SOURCE_HTML, diff_catalog, entries_from_api_payload, fetch_ranking_entries, merge_catalog,
+)
+from usnews_scraper.ranking_parser import RankingEntry
+
+
+def _item(name, slug, school_id):
+    return {"institution": {"displayName": name, "urlName": slug, "primaryKey": school_id}}
+
+
+def _page(items, total_pages=None):
+    data = {"items": items}
+    if total_pages:
+        data["totalPages"] = total_pages
+    return {"status": 200, "text": json.dumps({"data": data})}
+
+
+def _card(name, link):
+    return f'<div class="card" name="{name}"><h3><a href="{link}">{name}</a></h3></div>'
+
+
+class FakeBrowser:
+    """fetch_text / navigate_to / get_page_source driven by per-page responses (None = failure)."""
+
+    def __init__(self, api=None, html=None):
+        self.api = api or {}
+        self.html = html or {}
+        self.calls = []
+        self._page = None
+
+    def fetch_text(self, url):
+        page = int(url.rsplit("_page=", 1)[1])
+        self.calls.append(("api", page))
+        responses = self.api.get(page, [])
+        return responses.pop(0) if responses else None
+
+    def navigate_to(self, url):
+        self._page = int(url.rsplit("_page=", 1)[1]) if "_page=" in url else None
+        if self._page is not None:
+            self.calls.append(("html", self._page))
+        return True
+
+    def get_page_source(self):
+        responses = self.html.get(self._page, [])
+        return responses.pop(0) if responses else None
+
+
+@pytest.fixture(autouse=True)
+def no_pause(monkeypatch):
+    monkeypatch.setattr(catalog_refresh, "PAGE_RETRY_PAUSE_SECONDS", 0)
+
+
+def _catalog(*rows):
+    return UniversityCatalog({"name": name, "link": link} for name, link in rows)
+
+
+def test_entries_from_api_payload_reads_known_shapes():
+    payload = {"data": {"totalPages": "3", "items": [
+        _item("Princeton University", "princeton-university", 2627),
+        {"name": "MIT", "url": "https://www.usnews.com/best-colleges/mit-2178?x=1"},
+        {"institution": {"displayName": "No Link"}},
+        "junk",
+    ]}}
+    entries, total_pages = entries_from_api_payload(payload)
+    assert entries == [
+        RankingEntry("Princeton University", "/best-colleges/princeton-university-2627", "2627"),
+        RankingEntry("MIT", "/best-colleges/mit-2178", "2178"),
+    ]
+    assert total_pages == 3
+    assert entries_from_api_payload({"results": []}) == ([], None)
+    assert entries_from_api_payload(None) == ([], None)
+
+
+def test_fetch_walks_api_pages_until_reported_count():
+    browser = FakeBrowser(api={
+        1: [_page([_item("A", "a", 1)], total_pages=2)],
+        2: [_page([_item("B", "b", 2), _item("A", "a", 1)], total_pages=2)],
+    })
+    entries = fetch_ranking_entries(browser, SOURCE_API)
+    assert [e.school_id for e in entries] == ["1", "2"]
+    assert browser.calls == [("api", 1), ("api", 2)]
+
+
+def test_fetch_retries_a_failing_page():
+    browser = FakeBrowser(api={
+        1: [_page([_item("A", "a", 1)], total_pages=2)],
+        2: [None, {"status": 200, "text": "<html>blocked</html>"}, _page([_item("B", "b", 2)], total_pages=2)],
+    })
+    entries = fetch_ranking_entries(browser, SOURCE_API)
+    assert [e.school_id for e in entries] == ["1", "2"]
+
+
+def test_fetch_falls_back_to_html_for_a_later_api_page():
+    browser = FakeBrowser(
+        api={1: [_page([_item("A", "a", 1)])], 3: [_page([])]},
+        html={2: [_card("B", "/best-colleges/b-2")]},
+    )
+    entries = fetch_ranking_entries(browser, SOURCE_API)
+    assert [e.school_id for e in entries] == ["1", "2"]
+    assert ("html", 2) in browser.calls and ("api", 3) in browser.calls
+
+
+def test_fetch_switches_to_html_when_first_api_page_fails():
+    browser = FakeBrowser(html={1: [_card("A", "/best-colleges/a-1")], 2: ["<html></html>"]})
+    entries = fetch_ranking_entries(browser, SOURCE_API)
+    assert [e.school_id for e in entries] == ["1"]
+    assert ("api", 2) not in browser.calls
+
+
+def test_fetch_aborts_when_a_later_page_cannot_be_fetched():
+    browser = FakeBrowser(api={1: [_page([_item("A", "a", 1)], total_pages=3)]})
+    assert fetch_ranking_entries(browser, SOURCE_API) is None
+    browser = FakeBrowser(html={1: [_card("A", "/best-colleges/a-1")]})
+    assert fetch_ranking_entries(browser, SOURCE_HTML) is None
+
+
+def test_fetch_aborts_on_empty_page_before_reported_count():
+    browser = FakeBrowser(api={1: [_page([_item("A", "a", 1)], total_pages=3)], 2: [_page([], total_pages=3)]})
+    assert fetch_ranking_entries(browser, SOURCE_API) is None
+
+
+def test_diff_catalog_reports_each_change():
+    catalog = _catalog(
+        ("Princeton University", "/best-colleges/princeton-university-2627"),
+        ("Old Name College", "/best-colleges/old-name-college-100"),
+        ("Moved University", "/best-colleges/moved-university-200"),
+        ("Gone College", "/best-colleges/gone-college-300"),
+    )
+    fresh = [
+        RankingEntry("Princeton University", "/best-colleges/princeton-university-2627", "2627"),
+        RankingEntry("New Name College", "/best-colleges/old-name-college-100", "100"),
+        RankingEntry("Moved University", "https://www.usnews.com/best-colleges/moved-u-200/", "200"),
+        RankingEntry("Added University", "/best-colleges/added-university-400", "400"),
+    ]
+    diff = diff_catalog(catalog, fresh)
+    assert diff.unchanged == 1
+    assert diff.added == [{"school_id": "400", "name": "Added University",
+                           "link": "/best-colleges/added-university-400", "slug": "Added_University"}]
+    assert diff.removed == [{"school_id": "300", "name": "Gone College",
+                             "link": "/best-colleges/gone-college-300", "slug": "Gone_College"}]
+    assert [(r["old_slug"], r["new_slug"]) for r in diff.renamed] == [("Old_Name_College", "New_Name_College")]
+    assert [(r["old_link"], r["new_link"]) for r in diff.link_changed] == [
+        ("/best-colleges/moved-university-200", "/best-colleges/moved-u-200")]
+    assert diff.changed_slugs() == ["Added_University", "New_Name_College", "Moved_University"]
+    assert not diff.is_empty
+    assert diff_catalog(catalog, [RankingEntry(e.name, e.link, e.school_id) for e in catalog]).is_empty
+
+
+def test_merge_catalog_keeps_ranking_order_and_appends_dropped_schools():
+    catalog = _catalog(("A", "/best-colleges/a-1"), ("B", "/best-colleges/b-2"), ("C", "/best-colleges/c-3"))
+    fresh = [RankingEntry("C", "/best-colleges/c-3/", "3"), RankingEntry("D", "/best-colleges/d-4", "4"),
+             RankingEntry("A", "/best-colleges/a-1", "1")]
+    assert [row["school_id"] for row in merge_catalog(catalog, fresh)] == ["3", "4", "1", "2"]
+    assert merge_catalog(catalog, fresh)[0] == {"name": "C", "link": "/best-colleges/c-3", "school_id": "3"}
+    assert [row["school_id"] for row in merge_catalog(catalog, fresh, prune=True)] == ["3", "4", "1"]
@@ -0,0 +1,87 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+import check_html_status  # noqa: E402
+
+
+def test_rules_version_is_stable():
+    assert check_html_status._rules_version() == check_html_status.CHECK_RULES_VERSION
+
+
+def test_rules_version_changes_with_markers(monkeypatch):
+    before = check_html_status._rules_version()
+    monkeypatch.setattr(check_html_status, "ERROR_PATTERNS", check_html_status.ERROR_PATTERNS + [r"Service Unavailable"])
+    assert check_html_status._rules_version() != before
+
+
+def _corpus(root, universities=("Harvard_University", "Princeton_University"), pages=("main", "applying")):
+    for uni in universities:
+        (root / uni).mkdir(exist_ok=True)
+        for page in pages:
+            (root / uni / f"{page}.html").write_text(f"<html>Sign out {uni} {page}</html>", encoding="utf-8")
+
+
+def _run(root, only_university=None):
+    validator = check_html_status.DownloadsValidator(str(root))
+    calls = []
+    original = validator.check_file
+
+    def counting_check(path):
+        calls.append(path.parent.name + "/" + path.name)
+        return original(path)
+
+    validator.check_file = counting_check
+    results = list(validator.iter_results(only_university))
+    return results, calls
+
+
+def test_second_scan_is_served_from_cache(tmp_path):
+    _corpus(tmp_path)
+    first, calls = _run(tmp_path)
+    assert len(calls) == 4
+    second, calls = _run(tmp_path)
+    assert calls == []
+    assert second == first
+
+
+def test_changed_and_deleted_files(tmp_path):
+    _corpus(tmp_path)
+    _run(tmp_path)
+    (tmp_path / "Harvard_University" / "main.html").write_text("<html>Access Denied, much longer</html>")
+    (tmp_path / "Princeton_University" / "applying.html").unlink()
+    results, calls = _run(tmp_path)
+    assert calls == ["Harvard_University/main.html"]
+    assert [r.path.split("/")[-2] + "/" + r.file_type for r in results] == [
+        "Harvard_University/applying", "Harvard_University/main", "Princeton_University/main"]
+    assert results[1].is_error_page
+
+
+def test_single_university_scan_keeps_other_entries(tmp_path):
+    _corpus(tmp_path)
+    _run(tmp_path)
+    (tmp_path / "Princeton_University" / "main.html").write_text("<html>Sign out, updated page</html>")
+    _, calls = _run(tmp_path, only_university="Princeton_University")
+    assert calls == ["Princeton_University/main.html"]
+    _, calls = _run(tmp_path)
+    assert calls == []
+
+
+def test_cache_from_other_rules_version_is_ignored(tmp_path, monkeypatch):
+    _corpus(tmp_path)
+    _run(tmp_path)
+    monkeypatch.setattr(check_html_status, "CHECK_RULES_VERSION", "other")
+    _, calls = _run(tmp_path)
+    assert len(calls) == 4
+
+
+def test_interrupted_scan_keeps_previous_cache(tmp_path):
+    _corpus(tmp_path)
+    _run(tmp_path)
+    validator = check_html_status.DownloadsValidator(str(tmp_path))
+    results = validator.iter_results()
+    next(results)
+    results.close()
+    _, calls = _run(tmp_path)
+    assert calls == []
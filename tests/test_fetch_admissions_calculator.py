@@ -0,0 +1,27 @@
+import os
+import re
+import sys
+
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("requests")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from fetch_admissions_calculator import (  # noqa: E402
+    ADMISSIONS_API_PREFIX, is_school_response, school_response_pattern,
+)
+
+
+@pytest.mark.parametrize("suffix, expected", [
+    ("2627", True),
+    ("2627&v=2", True),
+    ("26270", False),
+    ("262", False),
+    ("1426", False),
+])
+def test_school_pattern_matches_only_that_school(suffix, expected):
+    url = ADMISSIONS_API_PREFIX + suffix
+    # JS RegExp 문법이지만 이 패턴은 Python re와도 같은 의미
+    assert bool(re.search(school_response_pattern("2627"), url)) is expected
+    assert is_school_response(url, "2627") is expected
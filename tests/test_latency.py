@@ -0,0 +1,86 @@
+import math
+
+from usnews_scraper.latency import (
+    CENSORED_HEADROOM, STAGE_EXTRACT, STAGE_LOAD, TIMEOUT_FACTOR, HedgeBudget, LatencyTracker, percentile,
+)
+
+
+def _tracker(tmp_path, **kwargs):
+    return LatencyTracker(str(tmp_path / "latency_stats.json"), **kwargs)
+
+
+def test_percentile_nearest_rank():
+    samples = [float(i) for i in range(1, 101)]
+    assert percentile(samples, 0.5) == 50.0
+    assert percentile(samples, 0.99) == 99.0
+    assert percentile([3.0], 0.99) == 3.0
+
+
+def test_default_until_min_samples(tmp_path):
+    tracker = _tracker(tmp_path, min_samples=5)
+    for _ in range(4):
+        tracker.record("applying", STAGE_LOAD, 2.0)
+    assert tracker.timeout_for("applying", STAGE_LOAD, 20) == 20
+    tracker.record("applying", STAGE_LOAD, 2.0)
+    assert tracker.timeout_for("applying", STAGE_LOAD, 20) == 8  # 2 × 1.5 → load lower bound
+
+
+def test_timeout_is_p99_times_factor_within_bounds(tmp_path):
+    tracker = _tracker(tmp_path, min_samples=10)
+    for _ in range(10):
+        tracker.record("", STAGE_LOAD, 20.0)
+    assert tracker.timeout_for("", STAGE_LOAD, 20) == int(20.0 * TIMEOUT_FACTOR)
+    for _ in range(10):
+        tracker.record("rankings", STAGE_EXTRACT, 100.0)
+    assert tracker.timeout_for("rankings", STAGE_EXTRACT, 30) == 45  # extract upper bound
+
+
+def test_timeouts_are_censored_and_do_not_ratchet(tmp_path):
+    tracker = _tracker(tmp_path, min_samples=20)
+    for _ in range(40):
+        tracker.record("campus-info", STAGE_LOAD, 10.0)
+    steady = tracker.timeout_for("campus-info", STAGE_LOAD, 20)
+    assert steady == 15
+    # 계속 타임아웃돼도 학습값은 완료된 시도의 p99 × factor × headroom에서 멈춤
+    timeout = steady
+    for _ in range(100):
+        tracker.record("campus-info", STAGE_LOAD, timeout, timed_out=True)
+        tracker.record("campus-info", STAGE_LOAD, 10.0)
+        timeout = tracker.timeout_for("campus-info", STAGE_LOAD, 20)
+    assert timeout == math.ceil(10.0 * TIMEOUT_FACTOR * CENSORED_HEADROOM)
+    assert tracker.percentile("campus-info", STAGE_LOAD, 0.99) == 10.0
+    # 타임아웃이 창 밖으로 밀려나면 원래 값으로 돌아옴
+    for _ in range(200):
+        tracker.record("campus-info", STAGE_LOAD, 10.0)
+    assert tracker.timeout_for("campus-info", STAGE_LOAD, 20) == steady
+
+
+def test_all_timed_out_keeps_default(tmp_path):
+    tracker = _tracker(tmp_path, min_samples=5)
+    for _ in range(50):
+        tracker.record("paying", STAGE_LOAD, 20, timed_out=True)
+    assert tracker.percentile("paying", STAGE_LOAD, 0.99) is None
+    assert tracker.timeout_for("paying", STAGE_LOAD, 20) == 20
+    assert tracker.timed_out_share("paying", STAGE_LOAD) == 1.0
+
+
+def test_window_and_round_trip(tmp_path):
+    tracker = _tracker(tmp_path, window=5, min_samples=1)
+    for i in range(8):
+        tracker.record("", STAGE_LOAD, float(i))
+    tracker.record("", STAGE_LOAD, 20, timed_out=True)
+    tracker.save()
+    reloaded = _tracker(tmp_path, window=5, min_samples=1)
+    assert reloaded.samples["main"][STAGE_LOAD] == [4.0, 5.0, 6.0, 7.0, None]
+    assert reloaded.completed("", STAGE_LOAD) == [4.0, 5.0, 6.0, 7.0]
+
+
+def test_hedge_budget_caps_fraction():
+    budget = HedgeBudget(fraction=0.1, burst=1)
+    hedges = 0
+    for _ in range(100):
+        hedged = budget.allow()
+        hedges += hedged
+        budget.record_navigation(hedged)
+    assert hedges <= 0.1 * 100 + 1
+    assert hedges >= 9
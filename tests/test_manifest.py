@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+
+from usnews_scraper.manifest import CorpusManifest
+
+
+def _record(manifest, university="princeton-university", page_type="", logged_in=True, saved_at=None):
+    return manifest.record(university, page_type, f"downloads/{university}/main.html", 100,
+                           "raw", "semantic", logged_in, saved_at=saved_at)
+
+
+def test_latest_line_wins_after_reload(tmp_path):
+    path = tmp_path / "manifest.jsonl"
+    manifest = CorpusManifest(str(path))
+    _record(manifest, logged_in=False)
+    _record(manifest, logged_in=True)
+    reloaded = CorpusManifest(str(path))
+    assert reloaded.get("princeton-university", "")["logged_in"] is True
+    assert reloaded.summary()["pages"] == 1
+
+
+def test_touch_updates_fetched_at_and_login_but_not_saved_at(tmp_path):
+    manifest = CorpusManifest(str(tmp_path / "manifest.jsonl"))
+    saved_at = (datetime.now() - timedelta(days=3)).isoformat()
+    _record(manifest, logged_in=False, saved_at=saved_at)
+    touched = manifest.touch("princeton-university", "", logged_in=True)
+    assert touched["saved_at"] == saved_at
+    assert touched["fetched_at"] > saved_at
+    assert manifest.not_logged_in() == []
+    # 변경 없는 재확인은 "변경된 페이지"에 포함되지 않음
+    assert manifest.changed_since(datetime.now() - timedelta(days=1)) == []
+
+
+def test_touch_unknown_page_returns_none(tmp_path):
+    manifest = CorpusManifest(str(tmp_path / "manifest.jsonl"))
+    assert manifest.touch("harvard-university", "applying") is None
+
+
+def test_remove_writes_tombstone(tmp_path):
+    path = tmp_path / "manifest.jsonl"
+    manifest = CorpusManifest(str(path))
+    _record(manifest, page_type="campus-info")
+    manifest.remove("princeton-university", "campus-info")
+    reloaded = CorpusManifest(str(path))
+    assert reloaded.get("princeton-university", "campus-info") is None
+    assert reloaded.missing("campus-info", ["princeton-university"]) == ["princeton-university"]
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    path = tmp_path / "manifest.jsonl"
+    manifest = CorpusManifest(str(path))
+    _record(manifest)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"university": "harv')
+    assert CorpusManifest(str(path)).universities() == {"princeton-university"}
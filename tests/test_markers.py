@@ -0,0 +1,86 @@
+import random
+import re
+
+import pytest
+
+from usnews_scraper.markers import (
+    DEFAULT_MARKER_CATEGORIES, WIDGET_MARKERS, MarkerMatcher, WidgetCutFinder,
+)
+
+TOKENS = [
+    'the', 'student', 'College', 'compass', 'Compass', 'premium', 'PREMIUM', 'unlock', 'Unlock', '\n',
+    'Sign', 'in', 'Sign in', 'signing', 'Log', 'out', 'Log out', 'Try it now', 'tried', '404 Not Found',
+    'captcha', 'CAPTCHA', 'We hit a snag', 'Profile', 'My Account', '로그인', '로그아웃', 'cf-error',
+    'blueshift-recommendations-widget', 'id="null-recommendations-widget"', '<div', 'SailthruRecommend__Container',
+]
+
+
+def _documents(count=200, seed=7):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield ' '.join(rng.choice(TOKENS) for _ in range(rng.randint(0, 80)))
+
+
+def _legacy_offsets(text, categories):
+    """The pre-matcher behavior: one re.search(IGNORECASE) per pattern."""
+    out = {}
+    for category, patterns in categories.items():
+        for pattern in patterns:
+            m = re.search(pattern, text, re.IGNORECASE)
+            if m:
+                out[(category, pattern)] = m.start()
+    return out
+
+
+def _legacy_widget_cut(content, markers):
+    """The pre-finder behavior: earliest find() over all markers, longer marker wins a tie."""
+    best = None
+    for marker in markers:
+        idx = content.find(marker)
+        if idx != -1 and (best is None or idx < best[0] or (idx == best[0] and len(marker) > len(best[1]))):
+            best = (idx, marker)
+    return best
+
+
+@pytest.mark.parametrize("text", list(_documents()))
+def test_scan_matches_per_pattern_search(text):
+    scan = MarkerMatcher().scan(text)
+    assert {(h.category, h.pattern): h.offset for h in scan.hits} == _legacy_offsets(text, DEFAULT_MARKER_CATEGORIES)
+
+
+def test_first_follows_declaration_order():
+    text = "Log in here ... later Sign in"
+    scan = MarkerMatcher().scan(text)
+    assert scan.first("sign_in") == r'\bSign in\b'
+    assert scan.earliest("sign_in").pattern == r'\bLog in\b'
+
+
+def test_gap_pattern_stays_on_one_line():
+    matcher = MarkerMatcher({"upsell": [r'compass.*unlock']})
+    assert not matcher.scan("compass\nunlock").has("upsell")
+    assert matcher.scan("x compass compass\nthen compass to unlock").earliest("upsell").offset == 23
+
+
+def test_scan_regions_and_categories():
+    text = "Sign out" + " " * 100 + "Access Denied"
+    matcher = MarkerMatcher()
+    assert not matcher.scan(text, regions=[(0, 50)]).has("error")
+    scan = matcher.scan(text, categories=["error"])
+    assert scan.has("error") and not scan.has("sign_out")
+
+
+@pytest.mark.parametrize("text", list(_documents(seed=11)))
+def test_widget_cut_finder_matches_legacy(text):
+    finder = WidgetCutFinder(WIDGET_MARKERS)
+    assert finder.find(text) == _legacy_widget_cut(text, WIDGET_MARKERS)
+    data = text.encode('utf-8')
+    expected = _legacy_widget_cut(data, [m.encode('utf-8') for m in WIDGET_MARKERS])
+    found = finder.find(data)
+    assert (found and (found[0], found[1].encode('utf-8'))) == (expected or None)
+
+
+def test_widget_cut_finder_respects_end():
+    text = "abc" + WIDGET_MARKERS[2] + "xyz"
+    finder = WidgetCutFinder(WIDGET_MARKERS)
+    assert finder.find(text, end=10) is None
+    assert finder.find(text, end=len(text)) == (3, WIDGET_MARKERS[2])
@@ -0,0 +1,111 @@
+import time
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from selenium.common.exceptions import TimeoutException  # noqa: E402
+
+from usnews_scraper.selenium.config import SeleniumConfig  # noqa: E402
+from usnews_scraper.selenium.navigation import (  # noqa: E402
+    MARK_NAVIGATION_JS, NAVIGATION_READY_JS, START_NAVIGATION_JS, NavigationManager, load_page,
+)
+
+
+class FakeTabs:
+    """Tabs of a driver under page_load_strategy "none": scripts never wait for a load."""
+
+    def __init__(self, load_seconds):
+        # 탭 순서대로 로드 시간 (None = 끝나지 않음)
+        self.load_seconds = list(load_seconds)
+        self.handles = ["tab0"]
+        self.current = "tab0"
+        self.ready_at = {}
+        self.stopped = set()
+        self.closed = []
+        self.loads = []
+
+    @property
+    def current_window_handle(self):
+        return self.current
+
+    @property
+    def switch_to(self):
+        tabs = self
+
+        class SwitchTo:
+            def window(self, handle):
+                tabs.current = handle
+
+            def new_window(self, kind):
+                tabs.current = f"tab{len(tabs.handles)}"
+                tabs.handles.append(tabs.current)
+        return SwitchTo()
+
+    def _start(self, url):
+        self.loads.append((self.current, url))
+        seconds = self.load_seconds[self.handles.index(self.current)]
+        self.ready_at[self.current] = None if seconds is None else time.monotonic() + seconds
+
+    def get(self, url):
+        self._start(url)
+
+    def execute_script(self, script, *args):
+        if script == START_NAVIGATION_JS:
+            self._start(args[0])
+        elif script == NAVIGATION_READY_JS:
+            ready_at = self.ready_at.get(self.current)
+            return ready_at is not None and time.monotonic() >= ready_at
+        elif script == "window.stop();":
+            self.stopped.add(self.current)
+        elif script != MARK_NAVIGATION_JS:
+            raise AssertionError(script)
+
+    def close(self):
+        self.closed.append(self.current)
+
+
+def _manager():
+    return NavigationManager(SeleniumConfig(post_render_wait_seconds=0, page_load_strategy="none"))
+
+
+def test_hedge_fires_when_primary_tab_stalls():
+    driver = FakeTabs([None, 0.2])
+    started = time.monotonic()
+    ok, hedged = _manager().navigate_hedged(driver, "https://x/a", hedge_after=0.3, timeout=5)
+    assert (ok, hedged) == (True, True)
+    assert time.monotonic() - started < 2
+    assert driver.loads == [("tab0", "https://x/a"), ("tab1", "https://x/a")]
+    # 멈춘 원래 탭은 중단 후 닫고, 이긴 탭에 남음
+    assert driver.closed == ["tab0"] and "tab0" in driver.stopped
+    assert driver.current_window_handle == "tab1"
+
+
+def test_no_hedge_when_primary_is_ready_in_time():
+    driver = FakeTabs([0.1, 0.1])
+    ok, hedged = _manager().navigate_hedged(driver, "https://x/a", hedge_after=1.0, timeout=5)
+    assert (ok, hedged) == (True, False)
+    assert driver.handles == ["tab0"] and driver.closed == []
+
+
+def test_hedge_gives_up_after_timeout():
+    driver = FakeTabs([None, None])
+    manager = _manager()
+    ok, hedged = manager.navigate_hedged(driver, "https://x/a", hedge_after=0.1, timeout=0.6)
+    assert (ok, hedged) == (False, True)
+    assert manager.last_load_timeouts == 1
+    assert driver.current_window_handle == "tab0" and "tab0" in driver.stopped
+
+
+def test_load_page_waits_for_new_document_under_none_strategy():
+    driver = FakeTabs([0.2])
+    started = time.monotonic()
+    load_page(driver, "https://x/a", "none", timeout=5)
+    assert time.monotonic() - started >= 0.2
+
+
+def test_load_page_times_out_under_none_strategy():
+    driver = FakeTabs([None])
+    with pytest.raises(TimeoutException):
+        load_page(driver, "https://x/a", "none", timeout=0.3)
+    assert "tab0" in driver.stopped
@@ -0,0 +1,76 @@
+import json
+from datetime import datetime, timedelta
+
+from usnews_scraper.negative_cache import NEG_CDN_ERROR, NEG_NOT_FOUND, NEG_REDIRECT, NegativeCache
+
+
+def _expire(cache, key, hours_ago=1):
+    cache.entries[key]["expires_at"] = (datetime.now() - timedelta(hours=hours_ago)).isoformat()
+
+
+def test_record_uses_class_ttl_and_counts_repeats(tmp_path):
+    cache = NegativeCache(str(tmp_path / "negative_cache.json"), ttl_hours={NEG_CDN_ERROR: 2})
+    entry = cache.record("Princeton_University", "applying", NEG_CDN_ERROR, "Reference #18")
+    ttl = datetime.fromisoformat(entry["expires_at"]) - datetime.fromisoformat(entry["recorded_at"])
+    assert ttl == timedelta(hours=2)
+    assert cache.record("Princeton_University", "applying", NEG_CDN_ERROR)["count"] == 2
+
+    redirect = cache.record("Princeton_University", "paying", NEG_REDIRECT)
+    ttl = datetime.fromisoformat(redirect["expires_at"]) - datetime.fromisoformat(redirect["recorded_at"])
+    assert ttl == timedelta(hours=30 * 24)
+
+
+def test_lookup_respects_expiry(tmp_path):
+    cache = NegativeCache(str(tmp_path / "negative_cache.json"))
+    cache.record("Yale_University", "", NEG_NOT_FOUND)
+    assert cache.lookup("Yale_University", "")["class"] == NEG_NOT_FOUND
+    assert cache.lookup("Yale_University", "main") is not None
+    assert cache.lookup("Yale_University", "", now=datetime.now() + timedelta(days=15)) is None
+    assert cache.lookup("Yale_University", "applying") is None
+
+
+def test_purge_expired_and_active(tmp_path):
+    cache = NegativeCache(str(tmp_path / "negative_cache.json"))
+    cache.record("A", "applying", NEG_REDIRECT)
+    cache.record("A", "paying", NEG_NOT_FOUND)
+    cache.record("B", "", NEG_CDN_ERROR)
+    _expire(cache, "A/paying")
+    cache.entries["B/main"]["expires_at"] = "not a date"
+
+    assert [(u, p) for u, p, _ in cache.active()] == [("A", "applying")]
+    assert cache.purge_expired() == 2
+    assert list(cache.entries) == ["A/applying"]
+    assert cache.purge_expired() == 0
+
+
+def test_clear_and_save_roundtrip(tmp_path):
+    path = tmp_path / "state" / "negative_cache.json"
+    cache = NegativeCache(str(path))
+    cache.record("A", "applying", NEG_REDIRECT)
+    cache.record("A", "paying", NEG_NOT_FOUND)
+    cache.clear("A", "paying")
+    cache.clear("A", "campus-info")
+    cache.save()
+    assert not (tmp_path / "state" / "negative_cache.json.part").exists()
+
+    reloaded = NegativeCache(str(path))
+    assert list(reloaded.entries) == ["A/applying"]
+    assert reloaded.lookup("A", "applying")["count"] == 1
+
+
+def test_save_skips_when_unchanged(tmp_path):
+    path = tmp_path / "negative_cache.json"
+    cache = NegativeCache(str(path))
+    cache.save()
+    assert not path.exists()
+    cache.clear("A", "applying")
+    cache.save()
+    assert not path.exists()
+
+
+def test_corrupt_file_starts_empty(tmp_path):
+    path = tmp_path / "negative_cache.json"
+    path.write_text("{not json", encoding="utf-8")
+    assert NegativeCache(str(path)).entries == {}
+    path.write_text(json.dumps([1, 2]), encoding="utf-8")
+    assert NegativeCache(str(path)).entries == {}
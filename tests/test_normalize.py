@@ -0,0 +1,69 @@
+import hashlib
+
+import pytest
+
+from usnews_scraper.normalize import ContentNormalizer, VolatileRule
+
+PAGE = (
+    '<html><head><meta name="csrf-token" content="{csrf}">'
+    '<script nonce="{nonce}">window.__DATA__={{"requestId":"{rid}","serverTime":{epoch}}}</script></head>'
+    '<body><div id="div-gpt-ad-{slot}-0" data-slot-id="{slot}"></div>'
+    '<p>Acceptance rate 4% · 학생 생활</p>'
+    '<time>{iso}</time><a href="/best-colleges/x-1?utm_source={utm}&amp;page=2">next</a></body></html>'
+)
+
+
+def _page(**overrides):
+    values = dict(csrf="a1", nonce="n1", rid="r-1", epoch="1695812345678", slot="1695812345678",
+                  iso="2025-09-27T16:08:03.482Z", utm="mail")
+    values.update(overrides)
+    return PAGE.format(**values)
+
+
+def test_volatile_fragments_do_not_change_semantic_hash():
+    normalizer = ContentNormalizer()
+    first = _page()
+    second = _page(csrf="b2", nonce="n2", rid="r-2", epoch="1695899999", slot="1700000000000",
+                   iso="2025-10-01T01:02:03+09:00", utm="web")
+    assert hashlib.sha256(first.encode("utf-8")).digest() != hashlib.sha256(second.encode("utf-8")).digest()
+    assert normalizer.semantic_hash(first) == normalizer.semantic_hash(second)
+
+
+def test_content_change_changes_semantic_hash():
+    normalizer = ContentNormalizer()
+    changed = _page().replace("4%", "5%")
+    assert normalizer.semantic_hash(_page()) != normalizer.semantic_hash(changed)
+
+
+def test_normalize_output():
+    text = ContentNormalizer().normalize(_page())
+    assert 'nonce=""' in text and 'content=""' in text
+    assert '"requestId":""' in text and '"serverTime":0' in text
+    assert 'id="div-gpt-ad"' in text and 'data-slot-id=""' in text
+    assert "<time>TIMESTAMP</time>" in text
+    assert "?utm_source=&amp;page=2" in text
+    assert "Acceptance rate 4% · 학생 생활" in text
+
+
+@pytest.mark.parametrize("convert", [str.encode, lambda s: memoryview(s.encode())])
+def test_bytes_input_matches_str(convert):
+    normalizer = ContentNormalizer()
+    page = _page()
+    assert normalizer.semantic_hash(convert(page)) == normalizer.semantic_hash(page)
+    assert normalizer.normalize(convert(page)) == normalizer.normalize(page).encode()
+
+
+def test_semantic_hash_is_hash_of_normalized_text():
+    normalizer = ContentNormalizer()
+    page = _page()
+    assert normalizer.semantic_hash(page) == hashlib.sha256(normalizer.normalize(page).encode()).hexdigest()
+
+
+def test_without_rules_semantic_hash_equals_raw_hash():
+    page = _page()
+    assert ContentNormalizer([]).semantic_hash(page) == hashlib.sha256(page.encode("utf-8")).hexdigest()
+
+
+def test_custom_rule_and_case_sensitivity():
+    normalizer = ContentNormalizer([VolatileRule("build", r'build-\d+', 'build', flags=0)])
+    assert normalizer.normalize("build-123 BUILD-456") == "build BUILD-456"
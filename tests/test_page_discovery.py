@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta
+
+from usnews_scraper.crawl_state import CrawlState
+from usnews_scraper.page_discovery import discover_page_types
+
+LINK = "/best-colleges/princeton-university-2627"
+PAGE_TYPES = ["", "applying", "paying", "campus-info", "academics"]
+
+
+def test_finds_linked_subpages_in_crawl_order():
+    html = (
+        f'<a href="{LINK}/paying">Paying</a>'
+        f"<a href='https://www.usnews.com{LINK}/applying/?src=nav'>Applying</a>"
+        f'<a href="https://premium.usnews.com{LINK}/Campus-Info#top">Campus</a>'
+    )
+    assert discover_page_types(html, LINK, PAGE_TYPES) == ["", "applying", "paying", "campus-info"]
+
+
+def test_accepts_full_url_and_trailing_slash_as_link():
+    html = f'<a href="{LINK}/academics">Academics</a>'
+    assert discover_page_types(html, f"https://www.usnews.com{LINK}/", PAGE_TYPES) == ["", "academics"]
+
+
+def test_ignores_other_schools_and_unknown_page_types():
+    html = (
+        '<a href="/best-colleges/yale-university-1426/applying">Yale</a>'
+        f'<a href="{LINK}-extra/paying">Other</a>'
+        f'<a href="{LINK}/rankings">Rankings</a>'
+    )
+    assert discover_page_types(html, LINK, PAGE_TYPES) is None
+
+
+def test_no_subpage_links_means_unknown():
+    assert discover_page_types(f'<a href="{LINK}">Main</a>', LINK, PAGE_TYPES) is None
+    assert discover_page_types("", LINK, PAGE_TYPES) is None
+    assert discover_page_types(f'<a href="{LINK}/paying">', "", PAGE_TYPES) is None
+
+
+def test_recorded_page_types_expire(tmp_path):
+    state = CrawlState(str(tmp_path / "crawl_state.json"))
+    state.record_page_types("Princeton_University", ["", "applying"])
+    assert state.get_page_types("Princeton_University", max_age_hours=1) == ["", "applying"]
+    old = (datetime.now() - timedelta(hours=2)).isoformat()
+    state.universities["Princeton_University"]["page_types_at"] = old
+    assert state.get_page_types("Princeton_University", max_age_hours=1) is None
+    assert state.get_page_types("Princeton_University") == ["", "applying"]
@@ -0,0 +1,61 @@
+import pytest
+
+from usnews_scraper.ranking_parser import RankingEntry, iter_ranking_entries, parse_ranking_file
+
+PAGE = (
+    '<html><body><div class="list">'
+    '<div class="card" data-rank="1" name="Princeton University">'
+    '<h3><a class="name" href="/best-colleges/princeton-university-2627?int=top_nav">Princeton</a></h3>'
+    '<a href="/best-colleges/princeton-university-2627/applying">Applying</a></div>'
+    '<div class="card" name="No Link College"><h3>No Link College</h3></div>'
+    '<div class="card" name="Texas A&amp;M University">'
+    '<a href="/best-colleges/texas-am-university-10366">Texas A&amp;M</a></div>'
+    '<a href="/best-colleges/search?page=2">Next</a>'
+    '</div></body></html>'
+)
+
+EXPECTED = [
+    RankingEntry("Princeton University", "/best-colleges/princeton-university-2627", "2627"),
+    RankingEntry("Texas A&M University", "/best-colleges/texas-am-university-10366", "10366"),
+]
+
+
+def _chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_single_chunk():
+    assert list(iter_ranking_entries([PAGE])) == EXPECTED
+
+
+@pytest.mark.parametrize("size", [1, 7, 16, 31, 64, 100])
+def test_tags_split_across_chunks_match_single_chunk(size):
+    assert list(iter_ranking_entries(_chunks(PAGE, size))) == list(iter_ranking_entries([PAGE]))
+
+
+def test_card_without_link_is_not_paired_with_next_link():
+    entries = list(iter_ranking_entries([PAGE]))
+    assert "No Link College" not in [e.name for e in entries]
+    assert entries[1].name == "Texas A&M University"
+
+
+def test_query_string_removed_and_name_unescaped():
+    entry = list(iter_ranking_entries([PAGE]))[0]
+    assert entry.link == "/best-colleges/princeton-university-2627"
+    assert list(iter_ranking_entries([PAGE]))[1].name == "Texas A&M University"
+
+
+def test_school_id_extracted_from_link():
+    assert [e.school_id for e in iter_ranking_entries([PAGE])] == ["2627", "10366"]
+    page = '<div name="No Id"><a href="/best-colleges/no-id-college">x</a></div>'
+    assert list(iter_ranking_entries([page])) == [RankingEntry("No Id", "/best-colleges/no-id-college", "")]
+
+
+def test_parse_ranking_file_keeps_first_occurrence(tmp_path):
+    duplicate = ('<div name="Princeton University"><a href="/best-colleges/princeton-duplicate-1">x</a></div>'
+                 '<div name="Yale University"><a href="/best-colleges/yale-university-1426">y</a></div>')
+    path = tmp_path / "ranking.html"
+    path.write_text(PAGE + duplicate, encoding="utf-8")
+    entries = parse_ranking_file(str(path), chunk_size=13)
+    assert [e.name for e in entries] == ["Princeton University", "Texas A&M University", "Yale University"]
+    assert entries[0].link == "/best-colleges/princeton-university-2627"
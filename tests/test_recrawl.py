@@ -0,0 +1,72 @@
+import json
+
+from usnews_scraper.manifest import CorpusManifest
+from usnews_scraper.recrawl import ALL_PAGES, batch_targets, load_recrawl_targets
+
+
+def _write_jsonl(path, rows):
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows) + "{torn", encoding="utf-8")
+
+
+def test_json_report_with_string_paths(tmp_path):
+    path = tmp_path / "report.json"
+    path.write_text(json.dumps({"problem_pages": [
+        "downloads/Princeton_University/main.html",
+        "downloads/Princeton_University/campus_info.html",
+        "downloads/Princeton_University/main.html",
+    ]}), encoding="utf-8")
+    assert load_recrawl_targets(str(path)) == [("Princeton_University", ""), ("Princeton_University", "campus-info")]
+
+
+def test_json_report_with_dict_paths(tmp_path):
+    path = tmp_path / "html_quality_report.json"
+    path.write_text(json.dumps({"timestamp": "2025-01-01T00:00:00", "summary": {}, "problem_pages": [
+        {"university": "Yale_University", "file_type": "academics", "path": "downloads/Yale_University/academics.html",
+         "issues": {"not_logged_in": True, "is_error_page": False, "details": []}},
+        {"university": "Yale_University", "file_type": "student_life",
+         "path": "downloads/Yale_University/student_life.html", "issues": {}},
+    ]}), encoding="utf-8")
+    assert load_recrawl_targets(str(path)) == [("Yale_University", "academics"), ("Yale_University", "student-life")]
+
+
+def test_validator_jsonl_skips_logged_in_rows(tmp_path):
+    path = tmp_path / "html_quality_report.jsonl"
+    _write_jsonl(path, [
+        {"university": "A", "file_type": "main", "path": "downloads/A/main.html",
+         "is_logged_in": True, "is_error_page": False},
+        {"university": "A", "file_type": "paying", "path": "downloads/A/paying.html",
+         "is_logged_in": False, "is_error_page": False},
+        {"university": "B", "file_type": "main", "path": "downloads/B/main.html",
+         "is_logged_in": True, "is_error_page": True},
+    ])
+    assert load_recrawl_targets(str(path)) == [("A", "paying"), ("B", "")]
+
+
+def test_manifest_jsonl_targets_only_not_logged_in_pages(tmp_path):
+    path = tmp_path / "manifest.jsonl"
+    manifest = CorpusManifest(str(path))
+    manifest.record("A", "", "downloads/A/main.html", 10, "r1", "s1", True)
+    manifest.record("A", "applying", "downloads/A/applying.html", 10, "r2", "s2", False)
+    manifest.record("B", "", "downloads/B/main.html", 10, "r3", "s3", False)
+    manifest.record("B", "", "downloads/B/main.html", 10, "r4", "s4", True)
+    assert load_recrawl_targets(str(path)) == [("A", "applying")]
+
+
+def test_catalog_diff_expands_to_every_page(tmp_path):
+    path = tmp_path / "catalog_diff.json"
+    path.write_text(json.dumps({"summary": {}, "added": [], "changed_slugs": ["New_College", "Renamed_U", "New_College"]}),
+                    encoding="utf-8")
+    assert load_recrawl_targets(str(path)) == [("New_College", ALL_PAGES), ("Renamed_U", ALL_PAGES)]
+
+
+def test_batches_group_by_university_in_first_seen_order():
+    targets = [("A", ""), ("B", ""), ("A", "paying"), ("C", ""), ("B", "applying"), ("A", "academics")]
+    assert batch_targets(targets, 2) == [
+        [("A", ""), ("A", "paying")],
+        [("A", "academics"), ("B", "")],
+        [("B", "applying"), ("C", "")],
+    ]
+    assert batch_targets(targets, 0) == [[t] for t in
+                                         [("A", ""), ("A", "paying"), ("A", "academics"),
+                                          ("B", ""), ("B", "applying"), ("C", "")]]
+    assert batch_targets([], 5) == []
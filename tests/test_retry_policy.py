@@ -0,0 +1,125 @@
+import random
+
+import pytest
+
+from usnews_scraper import retry_policy
+from usnews_scraper.retry_policy import (
+    ERR_AUTH, ERR_CLIENT, ERR_DRIVER, ERR_NETWORK, ERR_RATE_LIMIT, ERR_SERVER, ERR_TIMEOUT,
+    BackoffRule, CircuitBreaker, DeferredRetryQueue, RetryPolicy, classify_error,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = Clock()
+    monkeypatch.setattr(retry_policy.time, "monotonic", fake)
+    return fake
+
+
+@pytest.mark.parametrize("status, error_type, expected", [
+    (None, None, ERR_NETWORK),
+    (0, None, ERR_NETWORK),
+    (429, None, ERR_RATE_LIMIT),
+    (403, None, ERR_AUTH),
+    (503, None, ERR_SERVER),
+    (404, None, ERR_CLIENT),
+    (200, "Akamai Access Denied", ERR_SERVER),
+])
+def test_classify_error(status, error_type, expected):
+    assert classify_error(status, error_type) == expected
+
+
+def test_delay_is_jittered_exponential_and_capped():
+    policy = RetryPolicy({ERR_TIMEOUT: BackoffRule(2, 60)}, rng=random.Random(7))
+    for attempt in range(4):
+        raw = 2 * 2 ** attempt
+        delays = [policy.delay(ERR_TIMEOUT, attempt) for _ in range(200)]
+        assert all(0.5 * raw <= d < 1.5 * raw for d in delays)
+        assert len(set(delays)) > 1
+    assert all(policy.delay(ERR_TIMEOUT, 20) <= 60 for _ in range(50))
+    # 모르는 유형은 네트워크 규칙
+    assert policy.delay("unknown", 0) < 1.5 * policy.rules[ERR_NETWORK].base
+
+
+def test_driver_rule_stays_short():
+    policy = RetryPolicy(rng=random.Random(1))
+    assert max(policy.delay(ERR_DRIVER, a) for a in range(3) for _ in range(100)) < 1.5 * 4
+
+
+def test_breaker_opens_after_threshold_within_window(clock):
+    breaker = CircuitBreaker(failure_threshold=3, window_seconds=60, open_seconds=100)
+    breaker.record_failure("h")
+    clock.now += 61  # 창 밖으로 밀려남
+    breaker.record_failure("h")
+    breaker.record_failure("h")
+    assert breaker.allow("h")
+    breaker.record_failure("h")
+    assert not breaker.allow("h")
+    assert breaker.retry_after("h") == pytest.approx(100)
+    assert breaker.allow("other")
+
+
+def test_breaker_half_open_trial(clock):
+    breaker = CircuitBreaker(failure_threshold=1, open_seconds=100, max_open_seconds=300)
+    breaker.record_failure("h")
+    clock.now += 100
+    assert breaker.allow("h")        # 시험 요청 1회
+    assert not breaker.allow("h")    # 시험 중에는 더 보내지 않음
+    breaker.record_failure("h")      # 시험 실패 → 차단 두 배
+    assert breaker.retry_after("h") == pytest.approx(200)
+    clock.now += 200
+    assert breaker.allow("h")
+    breaker.record_failure("h")
+    assert breaker.retry_after("h") == pytest.approx(300)  # 상한
+    clock.now += 300
+    assert breaker.allow("h")
+    breaker.record_success("h")
+    assert breaker.allow("h") and breaker.allow("h")
+    assert breaker.retry_after("h") == 0.0
+
+
+def test_queue_pops_due_items_in_order(clock):
+    queue = DeferredRetryQueue()
+    assert queue.next_due_in() is None
+    queue.push(("a", ""), 30, ERR_TIMEOUT)
+    queue.push(("b", ""), 10, ERR_SERVER)
+    assert queue.next_due_in() == pytest.approx(10)
+    assert queue.pop_due() == []
+    clock.now += 30
+    assert queue.pop_due() == [("b", ""), ("a", "")]
+    assert len(queue) == 0
+
+
+def test_queue_attempt_counting(clock):
+    queue = DeferredRetryQueue()
+    key = ("a", "applying")
+    assert queue.push(key, 1, ERR_TIMEOUT) == 1
+    assert queue.push(key, 1, ERR_TIMEOUT) == 2
+    assert queue.push(key, 1, "circuit_open", count_attempt=False) == 2
+    assert queue.push(("b", ""), 1, "circuit_open", count_attempt=False) == 0
+    queue.forget(key)
+    assert key not in queue and queue.attempts_for(key) == 0
+
+
+def test_queue_replace_carries_attempts_over(clock):
+    queue = DeferredRetryQueue()
+    page, school = ("a", ""), ("a", "*")
+    queue.push(page, 5, ERR_TIMEOUT)
+    queue.replace(page, school)
+    assert page not in queue and school in queue
+    assert queue.attempts_for(school) == 1
+    # 학교 전체 재시도에서 메인이 다시 미뤄짐 → 횟수가 줄지 않고 누적
+    queue.pop_due()
+    clock.now += 5
+    assert queue.pop_due() == [school]
+    queue.push(page, 5, ERR_TIMEOUT)
+    queue.replace(page, school)
+    assert queue.attempts_for(school) == 2
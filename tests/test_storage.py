@@ -0,0 +1,137 @@
+import hashlib
+import os
+import time
+
+import pytest
+
+from usnews_scraper import storage
+from usnews_scraper.storage import TEMP_SUFFIX, AtomicFileWriter, recover_orphaned_temp_files
+
+
+def _dead_pid() -> int:
+    pid = os.fork()
+    if pid == 0:
+        os._exit(0)
+    os.waitpid(pid, 0)
+    return pid
+
+
+def test_write_hashed_replaces_file_and_hashes_data_plus_suffix(tmp_path):
+    path = tmp_path / "main.html"
+    path.write_text("old")
+    writer = AtomicFileWriter()
+    data = b"<html>" + b"x" * 200_000
+    digest, size = writer.write_hashed(str(path), memoryview(data)[:150_000], b"</html>", chunk_size=4096)
+    expected = data[:150_000] + b"</html>"
+    assert path.read_bytes() == b"old"
+    with open(writer.current_path(str(path)), 'rb') as f:
+        assert f.read() == expected
+    writer.flush()
+    assert path.read_bytes() == expected
+    assert digest == hashlib.sha256(expected).hexdigest()
+    assert size == len(expected)
+    assert not [p for p in os.listdir(tmp_path) if p.endswith(TEMP_SUFFIX)]
+
+
+def test_failed_rename_removes_temp_and_keeps_old_file(tmp_path, monkeypatch):
+    path = tmp_path / "main.html"
+    path.write_text("old")
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    committed = []
+    monkeypatch.setattr(os, "replace", fail_replace)
+    writer = AtomicFileWriter()
+    writer.write_text(str(path), "new", on_commit=lambda digest, size: committed.append(True))
+    writer.flush()
+    assert path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["main.html"]
+    assert committed == []
+
+
+def test_failed_write_removes_temp_and_keeps_old_file(tmp_path):
+    path = tmp_path / "main.html"
+    path.write_text("old")
+    writer = AtomicFileWriter()
+    with pytest.raises(TypeError):
+        writer.write_hashed(str(path), b"new", suffix="not bytes")
+    writer.flush()
+    assert path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["main.html"]
+
+
+def test_flush_batches_by_count(tmp_path):
+    writer = AtomicFileWriter(fsync_batch_size=3, fsync_interval_seconds=0)
+    for i in range(2):
+        writer.write_text(str(tmp_path / f"{i}.html"), "a")
+    assert len(writer._pending_files) == 2
+    writer.write_text(str(tmp_path / "2.html"), "a")
+    assert writer._pending_files == []
+
+
+def test_batch_is_synced_in_one_pass(tmp_path, monkeypatch):
+    events = []
+    monkeypatch.setattr(storage, "_sync_fd", lambda fd: events.append("sync"))
+    monkeypatch.setattr(storage, "_fsync_path", lambda path, directory=False: events.append("dir"))
+    writer = AtomicFileWriter(fsync_batch_size=5, fsync_interval_seconds=0)
+    committed = []
+    for i in range(5):
+        path = tmp_path / f"{i}.html"
+        writer.write_text(str(path), "a", on_commit=lambda digest, size, p=path: committed.append(p.exists()))
+        events.append("write")
+    assert events == ["write"] * 4 + ["sync"] * 5 + ["dir", "write"]
+    assert committed == [True] * 5
+    assert sorted(os.listdir(tmp_path)) == [f"{i}.html" for i in range(5)]
+
+
+def test_pending_write_is_not_visible_until_flush(tmp_path):
+    writer = AtomicFileWriter(fsync_batch_size=0, fsync_interval_seconds=0)
+    path = tmp_path / "main.html"
+    committed = []
+    writer.write_text(str(path), "first", on_commit=lambda digest, size: committed.append("first"))
+    writer.write_text(str(path), "second", on_commit=lambda digest, size: committed.append((digest, size)))
+    assert not path.exists() and committed == []
+    assert [p for p in os.listdir(tmp_path) if p.endswith(".html")] == []
+    writer.flush()
+    assert path.read_text() == "second"
+    assert committed == [(hashlib.sha256(b"second").hexdigest(), 6)]
+    assert writer.current_path(str(path)) == str(path)
+
+
+def test_recover_removes_temp_of_dead_process(tmp_path):
+    school = tmp_path / "Princeton_University"
+    school.mkdir()
+    orphan = school / f"main.html.{_dead_pid()}{TEMP_SUFFIX}"
+    orphan.write_text("partial")
+    assert recover_orphaned_temp_files(str(tmp_path)) == 1
+    assert not orphan.exists()
+
+
+def test_recover_keeps_fresh_temp_of_live_process(tmp_path):
+    live = tmp_path / f"main.html.{os.getppid()}{TEMP_SUFFIX}"
+    own = tmp_path / f"applying.html.{os.getpid()}{TEMP_SUFFIX}"
+    live.write_text("in progress")
+    own.write_text("in progress")
+    assert recover_orphaned_temp_files(str(tmp_path)) == 0
+    assert live.exists() and own.exists()
+
+
+def test_recover_removes_stale_temp_without_pid(tmp_path):
+    stale = tmp_path / f"crawl_state.json{TEMP_SUFFIX}"
+    fresh = tmp_path / f"manifest.jsonl{TEMP_SUFFIX}"
+    stale.write_text("{}")
+    fresh.write_text("{}")
+    old = time.time() - 2 * 3600
+    os.utime(stale, (old, old))
+    assert recover_orphaned_temp_files(str(tmp_path), stale_after_seconds=3600) == 1
+    assert not stale.exists() and fresh.exists()
+
+
+def test_recover_respects_max_depth(tmp_path):
+    deep = tmp_path / "a" / "b"
+    deep.mkdir(parents=True)
+    orphan = deep / f"main.html.{_dead_pid()}{TEMP_SUFFIX}"
+    orphan.write_text("partial")
+    assert recover_orphaned_temp_files(str(tmp_path), max_depth=2) == 0
+    assert recover_orphaned_temp_files(str(tmp_path), max_depth=3) == 1
@@ -0,0 +1,166 @@
+"""
+Admissions Calculator API Client
+
+Calls the admissions-calculator JSON endpoint directly over a pooled HTTP
+session authenticated with cookies captured from the logged-in Chrome
+(SessionManager), instead of loading every university's applying page just to
+sniff that one XHR. Requests go through a shared RateLimiter; results that
+need a browser (auth failures, non-JSON responses) are reported so callers can
+fall back to the page-capture path.
+"""
+
+import json
+import time
+import random
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .rate_limit import RateLimiter
+
+logger = logging.getLogger("usnews_scraper.admissions_api")
+
+
+# ===================== Module-level Constants =====================
+ADMISSIONS_API_PREFIX = (
+    "https://premium.usnews.com/best-colleges/compass/api/admissions-calculator?school_id="
+)
+
+# Outcome classes of ApiResult.status
+API_OK = "ok"
+API_AUTH = "auth"            # 401/403 or HTML login page → needs browser / new session
+API_NOT_FOUND = "not_found"  # 404 (no calculator for this school)
+API_ERROR = "error"          # retries exhausted (429/5xx/network)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class ApiResult:
+    school_id: str
+    status: str
+    http_status: int = 0
+    data: Optional[Any] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def needs_browser(self) -> bool:
+        return self.status in (API_AUTH, API_ERROR)
+
+
+class AdmissionsApiClient:
+    """Pooled requests.Session for the admissions-calculator endpoint."""
+
+    def __init__(self, cookies: Optional[Iterable[Dict[str, Any]]] = None, user_agent: Optional[str] = None,
+                 rate_limiter: Optional[RateLimiter] = None, timeout: float = 20.0,
+                 max_retries: int = 3, pool_size: int = 8):
+        """
+        Args:
+            cookies: Selenium-style cookie dicts (SessionManager.session_cookies)
+            user_agent: Browser User-Agent to send with the captured cookies
+            rate_limiter: Shared limiter (default: 2 requests/second)
+            timeout: Per-request timeout in seconds
+            max_retries: Retries for 429/5xx/network errors (jittered exponential backoff)
+            pool_size: Keep-alive connections kept per host
+        """
+        self.rate_limiter = rate_limiter or RateLimiter(rate=2.0)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=max(1, pool_size))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept": "application/json, text/plain, */*",
+            "Accept-Language": "en-US,en;q=0.9",
+            "X-Requested-With": "XMLHttpRequest",
+        })
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+        if cookies:
+            self.load_cookies(cookies)
+
+    @classmethod
+    def from_session_manager(cls, session_manager, **kwargs) -> "AdmissionsApiClient":
+        """Build a client from a SessionManager that already captured the login session."""
+        return cls(cookies=session_manager.session_cookies,
+                   user_agent=getattr(session_manager, "user_agent", None), **kwargs)
+
+    def load_cookies(self, cookies: Iterable[Dict[str, Any]]) -> int:
+        """Replace the session cookies with Selenium-style cookie dicts; returns the number loaded."""
+        self.session.cookies.clear()
+        count = 0
+        for c in cookies:
+            name, value = c.get("name"), c.get("value")
+            if not name or value is None:
+                continue
+            self.session.cookies.set(
+                name, value,
+                domain=c.get("domain") or "",
+                path=c.get("path", "/"),
+                secure=bool(c.get("secure", False)),
+                expires=c.get("expiry"),
+            )
+            count += 1
+        return count
+
+    def close(self) -> None:
+        self.session.close()
+
+    def fetch_admissions(self, school_id: str, referer: Optional[str] = None) -> ApiResult:
+        """
+        GET the admissions-calculator JSON for one school.
+
+        Args:
+            school_id: US News school id (derive_school_id_from_link)
+            referer: Applying page URL sent as Referer (as the browser XHR would)
+        """
+        url = f"{ADMISSIONS_API_PREFIX}{school_id}"
+        headers = {"Referer": referer} if referer else None
+        started = time.monotonic()
+        last_error = None
+        last_status = 0
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout, allow_redirects=False)
+            except requests.RequestException as e:
+                last_error = f"{type(e).__name__}: {e}"
+                last_status = 0
+            else:
+                last_status = response.status_code
+                if response.status_code == 200:
+                    try:
+                        data = response.json()
+                    except ValueError:
+                        # 로그인 페이지 등 HTML이 돌아오면 세션 만료로 간주
+                        return ApiResult(school_id, API_AUTH, 200, error="non-JSON response",
+                                         elapsed=time.monotonic() - started)
+                    return ApiResult(school_id, API_OK, 200, data=data, elapsed=time.monotonic() - started)
+                if response.status_code in (301, 302, 303, 307, 308, 401, 403):
+                    return ApiResult(school_id, API_AUTH, response.status_code,
+                                     error=response.headers.get("Location") or response.reason,
+                                     elapsed=time.monotonic() - started)
+                if response.status_code in (404, 410):
+                    return ApiResult(school_id, API_NOT_FOUND, response.status_code, elapsed=time.monotonic() - started)
+                last_error = f"HTTP {response.status_code}"
+                if response.status_code not in RETRY_STATUSES:
+                    break
+                if response.status_code == 429:
+                    retry_after = response.headers.get("Retry-After", "")
+                    self.rate_limiter.pause(float(retry_after) if retry_after.isdigit() else 30.0)
+            if attempt < self.max_retries:
+                delay = min(60.0, 2.0 ** attempt) * (0.5 + random.random())
+                logger.info(f"🔁 school_id={school_id} 재시도 {attempt + 1}/{self.max_retries} ({last_error}) - {delay:.1f}초 후")
+                time.sleep(delay)
+        return ApiResult(school_id, API_ERROR, last_status, error=last_error, elapsed=time.monotonic() - started)
+
+
+def dump_admissions_json(data: Any) -> str:
+    """Serialization used for admissions_calculator.json (same format as the browser capture path)."""
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
@@ -0,0 +1,155 @@
+"""
+Consolidated Admissions Dataset
+
+Single append-only NDJSON file of admissions-calculator payloads, one compact
+line per fetch: ``school_id``, ``name``, ``fetched_at``, ``hash`` and
+``payload``. An in-memory index (school_id -> hash and byte offset) is built
+with one sequential read on open, so a re-fetch whose payload hash did not
+change is skipped without writing, a single school can be read with one seek,
+and the whole dataset loads in one pass instead of opening 1,827 pretty-printed
+per-university files.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .storage import TEMP_SUFFIX
+
+logger = logging.getLogger("usnews_scraper.admissions_store")
+
+
+# ===================== Module-level Constants =====================
+DEFAULT_ADMISSIONS_STORE = os.path.join("downloads", "admissions_calculator.ndjson")
+
+
+def payload_hash(payload: Any) -> str:
+    """SHA256 of the canonical (sorted-key, compact) JSON serialization."""
+    canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class AdmissionsStore:
+    """NDJSON-backed admissions dataset indexed by school_id (latest line wins)."""
+
+    def __init__(self, path: str = DEFAULT_ADMISSIONS_STORE):
+        self.path = path
+        # school_id -> (hash, byte offset of the latest line)
+        self.index: Dict[str, Tuple[str, int]] = {}
+        self._line_count = 0
+        self.load()
+
+    # ========== 로드/저장 ==========
+    def load(self) -> None:
+        """Build the school_id index with one sequential read; drop a torn last line from an interrupted write."""
+        self.index = {}
+        self._line_count = 0
+        if not os.path.exists(self.path):
+            return
+        valid_end = 0
+        with open(self.path, 'rb') as f:
+            offset = 0
+            for line in f:
+                start = offset
+                offset += len(line)
+                if not line.endswith(b"\n"):
+                    break
+                valid_end = offset
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._line_count += 1
+                self.index[str(record.get("school_id", ""))] = (record.get("hash", ""), start)
+        if valid_end < os.path.getsize(self.path):
+            # 중단된 쓰기로 잘린 마지막 줄은 잘라내야 다음 append가 그 줄에 붙지 않음
+            logger.warning(f"⚠️ 잘린 마지막 줄 제거: {self.path}")
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid_end)
+
+    def is_unchanged(self, school_id: str, digest: str) -> bool:
+        entry = self.index.get(str(school_id))
+        return entry is not None and entry[0] == digest
+
+    def put(self, school_id: str, name: str, payload: Any, fetched_at: Optional[str] = None) -> bool:
+        """
+        Append a record unless the school's latest payload has the same hash.
+
+        Returns:
+            True if a line was written, False if the payload was unchanged
+        """
+        school_id = str(school_id)
+        digest = payload_hash(payload)
+        if self.is_unchanged(school_id, digest):
+            return False
+        record = {
+            "school_id": school_id,
+            "name": name,
+            "fetched_at": fetched_at or datetime.now().isoformat(),
+            "hash": digest,
+            "payload": payload,
+        }
+        line = (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'ab') as f:
+            offset = f.tell()
+            f.write(line)
+        self.index[school_id] = (digest, offset)
+        self._line_count += 1
+        return True
+
+    def __contains__(self, school_id: object) -> bool:
+        return str(school_id) in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    # ========== 조회 ==========
+    def get(self, school_id: str) -> Optional[Dict[str, Any]]:
+        """Latest record for one school (single seek)."""
+        entry = self.index.get(str(school_id))
+        if entry is None:
+            return None
+        with open(self.path, 'rb') as f:
+            f.seek(entry[1])
+            return json.loads(f.readline())
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Latest record per school, in one sequential read (superseded lines are skipped by offset)."""
+        if not os.path.exists(self.path):
+            return
+        live_offsets = {offset for _, offset in self.index.values()}
+        with open(self.path, 'rb') as f:
+            offset = 0
+            for line in f:
+                start = offset
+                offset += len(line)
+                if start in live_offsets:
+                    yield json.loads(line)
+
+    def load_all(self) -> Dict[str, Dict[str, Any]]:
+        """The full dataset: school_id -> latest record."""
+        return {record["school_id"]: record for record in self.iter_records()}
+
+    # ========== 정리 ==========
+    def compact(self) -> None:
+        """Rewrite the file with only the latest line per school."""
+        tmp_path = f"{self.path}{TEMP_SUFFIX}"
+        index: Dict[str, Tuple[str, int]] = {}
+        with open(tmp_path, 'wb') as out:
+            for record in self.iter_records():
+                index[record["school_id"]] = (record["hash"], out.tell())
+                out.write((json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8'))
+        os.replace(tmp_path, self.path)
+        self.index = index
+        self._line_count = len(index)
+
+    def maybe_compact(self) -> None:
+        """Compact when superseded lines outnumber live ones."""
+        if self._line_count > 2 * max(1, len(self.index)):
+            self.compact()
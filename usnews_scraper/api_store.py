@@ -0,0 +1,95 @@
+"""
+API Response Store
+
+Per-university append-only JSONL of the JSON API responses recorded while the
+crawler loaded a page (SeleniumBase JSON recording mode). Each line keeps the
+URL, HTTP status, content type, size, timing and the parsed payload, so
+downstream consumers can read compass/rankings/cost data from the API payloads
+instead of re-parsing the rendered HTML.
+"""
+
+import os
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from .crawl_state import page_key
+
+logger = logging.getLogger("usnews_scraper.api_store")
+
+
+# ===================== Module-level Constants =====================
+# downloads/<slug>/api_responses.jsonl
+API_STORE_FILENAME = "api_responses.jsonl"
+
+
+class ApiResponseStore:
+    """JSONL store of recorded API responses, one file per university directory."""
+
+    def __init__(self, downloads_dir: str, filename: str = API_STORE_FILENAME):
+        self.downloads_dir = downloads_dir
+        self.filename = filename
+
+    def path_for(self, university: str) -> str:
+        return os.path.join(self.downloads_dir, university, self.filename)
+
+    @staticmethod
+    def make_record(page_type: str, response) -> Dict[str, Any]:
+        """
+        Build a store record from a CapturedResponse.
+
+        The payload is kept parsed (``data``); a truncated or unparsable body is
+        stored as ``data: null`` with the metadata so the gap stays visible.
+        """
+        data: Optional[Any] = None
+        if not response.truncated:
+            try:
+                data = response.json()
+            except ValueError:
+                data = None
+        return {
+            "page_type": page_key(page_type),
+            "url": response.url,
+            "status": response.status,
+            "content_type": response.content_type,
+            "size": len(response.body.encode('utf-8')),
+            "elapsed_ms": response.elapsed_ms,
+            "truncated": response.truncated,
+            "captured_at": datetime.fromtimestamp(response.captured_at).isoformat(),
+            "data": data,
+        }
+
+    def append(self, university: str, page_type: str, responses: Iterable) -> int:
+        """Append recorded responses for one page; returns the number of lines written."""
+        records = [self.make_record(page_type, r) for r in responses]
+        if not records:
+            return 0
+        path = self.path_for(university)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n")
+        return len(records)
+
+    def load(self, university: str) -> List[Dict[str, Any]]:
+        """All records for a university in capture order."""
+        path = self.path_for(university)
+        records: List[Dict[str, Any]] = []
+        if not os.path.exists(path):
+            return records
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # 중단된 쓰기로 잘린 마지막 줄은 무시
+                    continue
+        return records
+
+    def latest(self, university: str) -> Dict[str, Dict[str, Any]]:
+        """Latest record per URL (later captures replace earlier ones)."""
+        return {record["url"]: record for record in self.load(university)}
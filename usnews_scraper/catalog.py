@@ -0,0 +1,217 @@
+"""
+University Catalog
+
+Indexed view of ``data/universities.json`` built once at load time: exact maps
+by link, school_id, download slug, normalized name and acronym, plus a
+character-trigram index for ranked fuzzy search. Replaces the linear
+"first substring hit in list order" scans, which cost O(n) per lookup and
+resolved ambiguous queries ("texas", "MIT") to whichever school came first.
+"""
+
+import re
+import json
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger("usnews_scraper.catalog")
+
+
+# ===================== Module-level Constants =====================
+# Common origins for session capture/application (lightweight home so scripts need not import the downloader)
+USNEWS_ORIGINS = [
+    "https://www.usnews.com",
+    "https://premium.usnews.com",
+]
+
+SCHOOL_ID_RE = re.compile(r'-(\d+)(?:\?|$)')
+
+# Words skipped when building acronyms ("Massachusetts Institute of Technology" -> "mit")
+ACRONYM_STOPWORDS = {"of", "the", "and", "at", "in", "for", "a", "an"}
+
+# Bonus added to the trigram score when every query word starts a word of the name
+# ("georgia tech" -> "Georgia Institute of Technology")
+CONTAINMENT_BONUS = 0.5
+
+# Candidates within this score of the best are reported as ambiguous
+AMBIGUITY_MARGIN = 0.05
+
+_NON_WORD_RE = re.compile(r'[^a-z0-9]+')
+
+
+def slugify_name(name: str) -> str:
+    """Normalize university name to a safe directory slug."""
+    normalized = name.replace(' ', '_').replace('&', 'and').replace(',', '').replace('.', '')
+    normalized = ''.join(c for c in normalized if c.isalnum() or c in '_-')
+    return normalized
+
+
+def school_id_from_link(link: str) -> str:
+    """/best-colleges/princeton-university-2627 -> "2627" ("" if the link has no id)."""
+    match = SCHOOL_ID_RE.search(link or "")
+    return match.group(1) if match else ""
+
+
+def normalize_link(link: str) -> str:
+    """Path-only link without query string or trailing slash (accepts full URLs)."""
+    path = urlparse(link).path if "://" in (link or "") else (link or "").split('?')[0]
+    if path and not path.startswith('/'):
+        path = '/' + path
+    return path.rstrip('/')
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, '&' -> 'and', punctuation and dashes collapsed to single spaces."""
+    return _NON_WORD_RE.sub(' ', name.lower().replace('&', ' and ')).strip()
+
+
+def _acronym(normalized: str) -> str:
+    words = [w for w in normalized.split() if w not in ACRONYM_STOPWORDS]
+    return ''.join(w[0] for w in words) if len(words) > 1 else ""
+
+
+def _trigrams(normalized: str) -> Set[str]:
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    name: str
+    link: str
+    school_id: str
+    slug: str
+    rank_order: int
+
+    def as_info(self) -> Dict[str, str]:
+        """The ``{'name', 'link'}`` dict used as university_info throughout the crawler."""
+        return {'name': self.name, 'link': self.link}
+
+
+class UniversityCatalog:
+    """Universities indexed by link, school_id, slug, name and trigrams (list order = ranking order)."""
+
+    def __init__(self, universities: Iterable[Dict]):
+        self.entries: List[CatalogEntry] = []
+        self.by_link: Dict[str, CatalogEntry] = {}
+        self.by_school_id: Dict[str, CatalogEntry] = {}
+        self.by_slug: Dict[str, CatalogEntry] = {}
+        self.by_name: Dict[str, CatalogEntry] = {}
+        self.by_acronym: Dict[str, List[CatalogEntry]] = {}
+        self._grams: Dict[str, List[int]] = {}
+        self._gram_totals: List[int] = []
+        self._words: List[List[str]] = []
+        for university in universities:
+            self.add(university.get('name', ''), university.get('link', ''))
+
+    @classmethod
+    def from_json(cls, path: str) -> "UniversityCatalog":
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def add(self, name: str, link: str) -> Optional[CatalogEntry]:
+        """Index one university; entries without a name or with a duplicate link are ignored."""
+        name = (name or "").strip()
+        link = normalize_link(link)
+        if not name or not link or link in self.by_link:
+            return None
+        entry = CatalogEntry(name, link, school_id_from_link(link), slugify_name(name), len(self.entries))
+        self.entries.append(entry)
+        self.by_link[link] = entry
+        if entry.school_id:
+            self.by_school_id.setdefault(entry.school_id, entry)
+        self.by_slug.setdefault(entry.slug, entry)
+        normalized = normalize_name(name)
+        self.by_name.setdefault(normalized, entry)
+        acronym = _acronym(normalized)
+        if acronym:
+            self.by_acronym.setdefault(acronym, []).append(entry)
+        grams = _trigrams(normalized)
+        for gram in grams:
+            self._grams.setdefault(gram, []).append(entry.rank_order)
+        self._gram_totals.append(len(grams))
+        self._words.append(normalized.split())
+        return entry
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[CatalogEntry]:
+        return iter(self.entries)
+
+    # ========== 정확 조회 ==========
+    def get_by_link(self, link: str) -> Optional[CatalogEntry]:
+        return self.by_link.get(normalize_link(link))
+
+    def get_by_school_id(self, school_id: str) -> Optional[CatalogEntry]:
+        return self.by_school_id.get(str(school_id))
+
+    def get_by_slug(self, slug: str) -> Optional[CatalogEntry]:
+        return self.by_slug.get(slug)
+
+    def lookup(self, query: str) -> Optional[CatalogEntry]:
+        """Exact match on link, school_id, slug or normalized name (no fuzzy matching)."""
+        query = (query or "").strip()
+        if not query:
+            return None
+        if '/' in query:
+            return self.get_by_link(query)
+        if query.isdigit() and query in self.by_school_id:
+            return self.by_school_id[query]
+        return self.by_slug.get(query) or self.by_name.get(normalize_name(query))
+
+    # ========== 퍼지 검색 ==========
+    def search(self, query: str, limit: int = 10) -> List[Tuple[CatalogEntry, float]]:
+        """
+        Rank entries by trigram similarity to ``query``.
+
+        Score = Dice coefficient of the padded character trigram sets, plus
+        CONTAINMENT_BONUS when every query word is a prefix of a word in the
+        name. Ties keep catalog (ranking) order.
+
+        Returns:
+            Up to ``limit`` (entry, score) pairs, best first
+        """
+        normalized = normalize_name(query or "")
+        if not normalized:
+            return []
+        grams = _trigrams(normalized)
+        query_total = len(grams)
+        overlap: Counter = Counter()
+        for gram in grams:
+            overlap.update(self._grams.get(gram, ()))
+        query_words = set(normalized.split())
+
+        def _contained(words: List[str]) -> bool:
+            return all(any(w.startswith(q) for w in words) for q in query_words)
+
+        scored: List[Tuple[float, int]] = []
+        for index, common in overlap.items():
+            score = 2.0 * common / (query_total + self._gram_totals[index])
+            if _contained(self._words[index]):
+                score += CONTAINMENT_BONUS
+            scored.append((score, index))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(self.entries[index], round(score, 4)) for score, index in scored[:limit]]
+
+    def resolve(self, query: str) -> Optional[CatalogEntry]:
+        """
+        Best single match for a user query: exact lookup, then a unique acronym
+        ("MIT"), then the top fuzzy result (ambiguous results are logged).
+        """
+        entry = self.lookup(query)
+        if entry is not None:
+            return entry
+        acronym_hits = self.by_acronym.get(normalize_name(query or "").replace(' ', ''), [])
+        if len(acronym_hits) == 1:
+            return acronym_hits[0]
+        results = self.search(query, limit=5)
+        if not results:
+            return None
+        best, best_score = results[0]
+        close = [e.name for e, score in results[1:] if best_score - score <= AMBIGUITY_MARGIN]
+        if close:
+            logger.warning(f"⚠️ '{query}' 검색 결과가 모호합니다 → '{best.name}' 선택 (다른 후보: {', '.join(close)})")
+        return best
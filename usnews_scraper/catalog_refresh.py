@@ -0,0 +1,276 @@
+"""
+Catalog Refresh
+
+Rebuilds the university list from the live, paginated US News rankings
+listing instead of a hand-saved ``data/ranking.html``. Pages are fetched with
+the crawler's own browser session: the listing's backing JSON API first, with
+the HTML listing (parsed by ranking_parser) as a fallback. The result is merged
+into ``data/universities.json`` keyed by school_id, and a diff (added /
+removed / renamed / link changed) is written so that only the changed
+universities need to be crawled again (``main.py --recrawl-from <diff>``).
+"""
+
+import json
+import time
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .catalog import UniversityCatalog, normalize_link, school_id_from_link, slugify_name
+from .ranking_parser import UNIVERSITY_LINK_PREFIX, RankingEntry, iter_ranking_entries
+from .storage import AtomicFileWriter
+
+logger = logging.getLogger("usnews_scraper.catalog_refresh")
+
+
+# ===================== Module-level Constants =====================
+# All ranked schools, in ranking order (the listing data/ranking.html was saved from)
+RANKINGS_LIST_URL = "https://www.usnews.com/best-colleges/search"
+RANKINGS_API_URL = "https://www.usnews.com/best-colleges/api/search"
+RANKINGS_QUERY = "_sort=rank&_sortDirection=asc"
+
+DEFAULT_CATALOG_DIFF = "data/catalog_diff.json"
+
+# Safety stop for listings that never report their page count
+MAX_RANKING_PAGES = 200
+
+# Extra attempts per listing page before the walk is abandoned (a partial listing would mark the rest as removed)
+PAGE_RETRIES = 2
+PAGE_RETRY_PAUSE_SECONDS = 3.0
+
+# Refresh sources
+SOURCE_API = "api"
+SOURCE_HTML = "html"
+
+
+def _page_url(base: str, page: int) -> str:
+    return f"{base}?{RANKINGS_QUERY}&_page={page}"
+
+
+def _entry_from_item(item: Dict[str, Any]) -> Optional[RankingEntry]:
+    """One search-API item -> RankingEntry (fields looked up defensively; the API is undocumented)."""
+    institution = item.get("institution") if isinstance(item.get("institution"), dict) else item
+    name = institution.get("displayName") or institution.get("name") or ""
+    link = ""
+    for key in ("url", "link", "profileUrl"):
+        value = institution.get(key) or ""
+        if UNIVERSITY_LINK_PREFIX in value:
+            link = normalize_link(value)
+            break
+    school_id = str(institution.get("primaryKey") or institution.get("schoolId") or "") or school_id_from_link(link)
+    if not link and institution.get("urlName") and school_id:
+        link = f"{UNIVERSITY_LINK_PREFIX}{institution['urlName']}-{school_id}"
+    if not name or not link:
+        return None
+    return RankingEntry(name=name.strip(), link=link, school_id=school_id or school_id_from_link(link))
+
+
+def entries_from_api_payload(payload: Any) -> Tuple[List[RankingEntry], Optional[int]]:
+    """
+    Parse one page of the search API.
+
+    Returns:
+        (entries in page order, total page count or None if not reported)
+    """
+    data = payload.get("data", payload) if isinstance(payload, dict) else {}
+    items = data.get("items") or data.get("results") or []
+    entries = [e for e in (_entry_from_item(i) for i in items if isinstance(i, dict)) if e is not None]
+    total_pages = data.get("totalPages") or data.get("total_pages")
+    return entries, int(total_pages) if total_pages else None
+
+
+# ========== 수집 ==========
+def _fetch_api_page(browser, page: int) -> Optional[Tuple[List[RankingEntry], Optional[int]]]:
+    response = browser.fetch_text(_page_url(RANKINGS_API_URL, page))
+    if not response or response.get("status") != 200:
+        logger.warning(f"⚠️ 랭킹 API {page}페이지 실패 (status={response and response.get('status')})")
+        return None
+    try:
+        return entries_from_api_payload(json.loads(response.get("text") or ""))
+    except ValueError:
+        # 봇 차단/로그인 페이지 등 JSON이 아닌 응답
+        logger.warning(f"⚠️ 랭킹 API {page}페이지가 JSON이 아닙니다")
+        return None
+
+
+def _fetch_html_page(browser, page: int, list_url: str) -> Optional[List[RankingEntry]]:
+    if not browser.navigate_to(_page_url(list_url, page)):
+        logger.warning(f"⚠️ 랭킹 목록 {page}페이지 이동 실패")
+        return None
+    html_text = browser.get_page_source()
+    if not html_text:
+        return None
+    return list(iter_ranking_entries([html_text]))
+
+
+def _fetch_page(browser, page: int, source: str,
+                list_url: str) -> Optional[Tuple[List[RankingEntry], Optional[int], str]]:
+    """
+    One listing page, retried ``PAGE_RETRIES`` times; an API page that keeps
+    failing is read from the HTML listing instead.
+
+    Returns:
+        (entries, total page count or None, source that served the page), or None if every attempt failed
+    """
+    for attempt in range(PAGE_RETRIES + 1):
+        if attempt:
+            time.sleep(PAGE_RETRY_PAUSE_SECONDS)
+        if source == SOURCE_API:
+            result = _fetch_api_page(browser, page)
+            if result is not None:
+                return result[0], result[1], SOURCE_API
+        else:
+            page_entries = _fetch_html_page(browser, page, list_url)
+            if page_entries is not None:
+                return page_entries, None, SOURCE_HTML
+    if source == SOURCE_API:
+        logger.info(f"↩️ 랭킹 API {page}페이지 실패 → HTML 목록으로 대체")
+        return _fetch_page(browser, page, SOURCE_HTML, list_url)
+    return None
+
+
+def fetch_ranking_entries(browser, source: str = SOURCE_API, list_url: str = RANKINGS_LIST_URL,
+                          max_pages: int = MAX_RANKING_PAGES) -> Optional[List[RankingEntry]]:
+    """
+    Walk the paginated rankings listing with an open browser session.
+
+    Stops at the reported page count, at the first page that adds no new
+    school (an error before the reported count), or at ``max_pages``. Every page is retried; with ``source="api"``
+    a page the API keeps failing on is read from the HTML listing (a failing
+    first page switches the rest of the walk to the HTML listing).
+
+    Args:
+        browser: SeleniumBase with a running driver (login session already applied)
+        source: SOURCE_API or SOURCE_HTML
+
+    Returns:
+        Unique entries (by school_id, else link) in ranking order, or None if
+        a page could not be fetched at all (a partial listing would report
+        every later school as removed)
+    """
+    entries: List[RankingEntry] = []
+    seen = set()
+    if source == SOURCE_API:
+        # 같은 오리진에서 요청해야 세션 쿠키가 함께 전송됨
+        browser.navigate_to(list_url)
+    page = 1
+    expected_pages = None
+    while page <= max_pages:
+        result = _fetch_page(browser, page, source, list_url)
+        if result is None:
+            logger.error(f"❌ 랭킹 {page}페이지를 가져오지 못했습니다 - 목록이 불완전하므로 중단")
+            return None
+        page_entries, total_pages, served_by = result
+        expected_pages = total_pages or expected_pages
+        if page == 1 and served_by != source:
+            logger.info("↩️ 랭킹 API 사용 불가 → HTML 목록으로 전환")
+            source = served_by
+        new_count = 0
+        for entry in page_entries:
+            key = entry.school_id or entry.link
+            if key in seen:
+                continue
+            seen.add(key)
+            entries.append(entry)
+            new_count += 1
+        logger.info(f"📄 랭킹 {page}페이지: {new_count}개 (누적 {len(entries)}개)")
+        if new_count == 0 and expected_pages and page < expected_pages:
+            logger.error(f"❌ 랭킹 {page}페이지가 비어 있습니다 (전체 {expected_pages}페이지) - 목록이 불완전하므로 중단")
+            return None
+        if new_count == 0 or (expected_pages and page >= expected_pages):
+            break
+        page += 1
+    return entries
+
+
+# ========== 비교/병합 ==========
+@dataclass
+class CatalogDiff:
+    added: List[Dict[str, str]] = field(default_factory=list)
+    removed: List[Dict[str, str]] = field(default_factory=list)
+    # {"school_id", "old_name", "new_name", "old_slug", "new_slug", "link"}
+    renamed: List[Dict[str, str]] = field(default_factory=list)
+    # {"school_id", "name", "slug", "old_link", "new_link"}
+    link_changed: List[Dict[str, str]] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.renamed or self.link_changed)
+
+    def changed_slugs(self) -> List[str]:
+        """Download slugs that need crawling: new schools, renamed schools (new folder) and moved links."""
+        slugs = [e["slug"] for e in self.added]
+        slugs += [e["new_slug"] for e in self.renamed]
+        slugs += [e["slug"] for e in self.link_changed]
+        return list(dict.fromkeys(slugs))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "generated_at": datetime.now().isoformat(),
+            "summary": {
+                "added": len(self.added),
+                "removed": len(self.removed),
+                "renamed": len(self.renamed),
+                "link_changed": len(self.link_changed),
+                "unchanged": self.unchanged,
+            },
+            "added": self.added,
+            "removed": self.removed,
+            "renamed": self.renamed,
+            "link_changed": self.link_changed,
+            "changed_slugs": self.changed_slugs(),
+        }
+
+
+def _key(school_id: str, link: str) -> str:
+    return school_id or normalize_link(link)
+
+
+def diff_catalog(catalog: UniversityCatalog, fresh: List[RankingEntry]) -> CatalogDiff:
+    """Compare the current catalog with freshly fetched entries, matched by school_id (link if no id)."""
+    diff = CatalogDiff()
+    current = {_key(e.school_id, e.link): e for e in catalog}
+    fresh_keys = set()
+    for entry in fresh:
+        key = _key(entry.school_id, entry.link)
+        fresh_keys.add(key)
+        old = current.get(key)
+        link = normalize_link(entry.link)
+        if old is None:
+            diff.added.append({"school_id": entry.school_id, "name": entry.name, "link": link,
+                               "slug": slugify_name(entry.name)})
+            continue
+        if old.name != entry.name:
+            diff.renamed.append({"school_id": entry.school_id, "old_name": old.name, "new_name": entry.name,
+                                 "old_slug": old.slug, "new_slug": slugify_name(entry.name), "link": link})
+        if old.link != link:
+            diff.link_changed.append({"school_id": entry.school_id, "name": entry.name,
+                                      "slug": slugify_name(entry.name), "old_link": old.link, "new_link": link})
+        if old.name == entry.name and old.link == link:
+            diff.unchanged += 1
+    for key, old in current.items():
+        if key not in fresh_keys:
+            diff.removed.append({"school_id": old.school_id, "name": old.name, "link": old.link, "slug": old.slug})
+    return diff
+
+
+def merge_catalog(catalog: UniversityCatalog, fresh: List[RankingEntry], prune: bool = False) -> List[Dict[str, str]]:
+    """
+    New universities.json content: fresh entries in ranking order, then (unless
+    ``prune``) schools that dropped off the listing, in their old order.
+    """
+    merged = [{"name": e.name, "link": normalize_link(e.link), "school_id": e.school_id} for e in fresh]
+    if not prune:
+        fresh_keys = {_key(e.school_id, e.link) for e in fresh}
+        merged += [{"name": e.name, "link": e.link, "school_id": e.school_id}
+                   for e in catalog if _key(e.school_id, e.link) not in fresh_keys]
+    return merged
+
+
+def write_json(path: str, data: Any) -> None:
+    """Atomically replace ``path`` with pretty-printed JSON (same format as extract_universities.py)."""
+    writer = AtomicFileWriter()
+    writer.write_text(path, json.dumps(data, ensure_ascii=False, indent=2))
+    writer.flush()
@@ -0,0 +1,149 @@
+"""
+Crawl State
+
+Persistent per-page crawl metadata (raw/semantic hashes, timestamps) keyed by
+university slug and page type. Used by HTMLDownloader for dedupe,
+skip-if-unchanged and re-crawl decisions across runs.
+"""
+
+import os
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from .storage import TEMP_SUFFIX
+
+logger = logging.getLogger("usnews_scraper.crawl_state")
+
+
+def page_key(page_type: str) -> str:
+    """Normalize a page type ("" = main) to the key stored in the state file."""
+    return "main" if page_type == "" else page_type
+
+
+def page_type_from_filename(filename: str) -> str:
+    """Inverse of the downloader's file naming: 'main.html' -> '', 'campus_info.html' -> 'campus-info'."""
+    stem = os.path.basename(filename)
+    if stem.endswith('.html'):
+        stem = stem[:-len('.html')]
+    return "" if stem == "main" else stem.replace('_', '-')
+
+
+class CrawlState:
+    """JSON-backed store: { university_slug: { "pages": { page_key: {...} } } }"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.universities: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self.load()
+
+    def load(self) -> None:
+        """Load state from disk (missing or corrupt file = empty state)."""
+        if not os.path.exists(self.path):
+            self.universities = {}
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.universities = data.get("universities", {}) if isinstance(data, dict) else {}
+        except Exception as e:
+            logger.warning(f"⚠️ 크롤 상태 파일 읽기 실패 (빈 상태로 시작): {e}")
+            self.universities = {}
+
+    def save(self) -> None:
+        """Write state to disk if anything changed since the last save."""
+        if not self._dirty:
+            return
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}{TEMP_SUFFIX}"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"universities": self.universities}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"⚠️ 크롤 상태 저장 실패: {e}")
+
+    def get_page(self, university: str, page_type: str) -> Optional[Dict[str, Any]]:
+        """Return the stored record for a page, or None."""
+        return self.universities.get(university, {}).get("pages", {}).get(page_key(page_type))
+
+    def update_page(self, university: str, page_type: str, **fields: Any) -> Dict[str, Any]:
+        """Merge ``fields`` into the page record and return it."""
+        uni = self.universities.setdefault(university, {"pages": {}})
+        record = uni.setdefault("pages", {}).setdefault(page_key(page_type), {})
+        record.update(fields)
+        self._dirty = True
+        return record
+
+    def record_content(self, university: str, page_type: str, raw_hash: Optional[str], semantic_hash: Optional[str], size: int) -> bool:
+        """
+        Record hashes for a freshly fetched page.
+
+        Returns:
+            True if the semantic content changed (or is new), False if unchanged
+        """
+        now = datetime.now().isoformat()
+        previous = self.get_page(university, page_type) or {}
+        changed = semantic_hash is None or previous.get("semantic_hash") != semantic_hash
+        fields: Dict[str, Any] = {
+            "raw_hash": raw_hash,
+            "semantic_hash": semantic_hash,
+            "size": size,
+            "checked_at": now,
+        }
+        if changed:
+            fields["changed_at"] = now
+        self.update_page(university, page_type, **fields)
+        return changed
+
+    def is_unchanged(self, university: str, page_type: str, semantic_hash: Optional[str]) -> bool:
+        """True if the stored semantic hash equals ``semantic_hash``."""
+        if not semantic_hash:
+            return False
+        record = self.get_page(university, page_type)
+        return bool(record) and record.get("semantic_hash") == semantic_hash
+
+    def record_check(self, university: str, page_type: str, problems: List[str]) -> None:
+        """Record the pre-save quality check result ("ok" or "failed" + problem classes)."""
+        self.update_page(
+            university, page_type,
+            check_status="failed" if problems else "ok",
+            check_problems=list(problems),
+            check_at=datetime.now().isoformat(),
+        )
+
+    def record_page_types(self, university: str, page_types: List[str]) -> None:
+        """Record the page types discovered from the university's main-page navigation."""
+        uni = self.universities.setdefault(university, {"pages": {}})
+        uni["page_types"] = [page_key(p) for p in page_types]
+        uni["page_types_at"] = datetime.now().isoformat()
+        self._dirty = True
+
+    def get_page_types(self, university: str, max_age_hours: Optional[float] = None) -> Optional[List[str]]:
+        """Page types ("" = main) recorded by record_page_types, or None if never discovered or older than ``max_age_hours``."""
+        uni = self.universities.get(university, {})
+        keys = uni.get("page_types")
+        if keys is None:
+            return None
+        if max_age_hours is not None:
+            try:
+                recorded_at = datetime.fromisoformat(uni.get("page_types_at", ""))
+            except ValueError:
+                return None
+            if datetime.now() - recorded_at > timedelta(hours=max_age_hours):
+                return None
+        return ["" if key == "main" else key for key in keys]
+
+    def failed_pages(self) -> List[Tuple[str, str]]:
+        """(university, page_key) of every page whose last quality check failed."""
+        return [
+            (university, key)
+            for university, data in self.universities.items()
+            for key, record in data.get("pages", {}).items()
+            if record.get("check_status") == "failed"
+        ]
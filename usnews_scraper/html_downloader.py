@@ -8,14 +8,35 @@ Loads university information from universities.json file.
 
 import time
 import os
+import functools
 import json
 import re
-import hashlib
 import logging
+from datetime import datetime
 from typing import Optional, List, Dict, Tuple
 from dataclasses import dataclass
 from urllib.parse import urlparse
 from .selenium_base import SeleniumBase, SeleniumConfig
+from .selenium import NetworkCapture, literal_pattern
+from .admissions_api import ADMISSIONS_API_PREFIX, dump_admissions_json
+from .api_store import ApiResponseStore
+from .normalize import ContentNormalizer, VolatileRule
+from .crawl_state import CrawlState, page_key
+from .storage import AtomicFileWriter, recover_orphaned_temp_files
+from .manifest import CorpusManifest
+from .markers import DEFAULT_WIDGET_FINDER, TRUNCATION_SUFFIX, WidgetCutFinder
+from .page_check import PageChecker, DEFAULT_FAILURE_CLASSES
+from .recrawl import ALL_PAGES, RecrawlTarget, batch_targets
+from .catalog import USNEWS_ORIGINS, UniversityCatalog, slugify_name
+from .page_discovery import discover_page_types
+from .negative_cache import NEG_CDN_ERROR, NEG_NOT_FOUND, NEG_REDIRECT, NegativeCache
+from .latency import DEFAULT_HEDGE_BUDGET, HEDGE_PERCENTILE, STAGE_EXTRACT, STAGE_LOAD, HedgeBudget, LatencyTracker
+from .retry_policy import (
+    ERR_DRIVER, ERR_TIMEOUT, BackoffRule, CircuitBreaker, DeferredRetryQueue, RetryPolicy, classify_error
+)
+from .catalog_refresh import (
+    DEFAULT_CATALOG_DIFF, SOURCE_API, CatalogDiff, diff_catalog, fetch_ranking_entries, merge_catalog, write_json
+)
 
 logger = logging.getLogger("usnews_scraper.html_downloader")
 
@@ -35,11 +56,20 @@ PAGE_TYPES = [
 # Base URL for premium pages
 BASE_URL = "https://premium.usnews.com"
 
-# Common origins for session capture/application
-USNEWS_ORIGINS = [
-    "https://www.usnews.com",
-    "https://premium.usnews.com",
-]
+
+# JSON API responses saved next to the HTML when DownloaderConfig.capture_api_json is on
+# { page_type: { output filename: URL regex (JavaScript RegExp syntax) } }
+DEFAULT_API_CAPTURES: Dict[str, Dict[str, str]] = {
+    "applying": {"admissions_calculator.json": literal_pattern(ADMISSIONS_API_PREFIX)},
+}
+
+# JSON recording mode default: every US News API call made by the page
+DEFAULT_JSON_RECORD_PATTERNS = [r"\.usnews\.com\/.*\/api\/"]
+
+
+# Static HTML extraction timeout (seconds) used until a page type has latency history
+DEFAULT_CONTENT_TIMEOUT = 30
+
 
 # Compiled regex for canonical link extraction
 CANONICAL_RE = re.compile(r'<link[^>]+rel="canonical"[^>]+href="([^"]+)', re.IGNORECASE)
@@ -53,6 +83,55 @@ class DownloaderConfig:
     wait_skip_seconds: int = 15
     page_type_overrides: Optional[Dict[str, Dict[str, int]]] = None
     preserve_login_from_existing: bool = False
+    # Volatile-content normalization rules for the semantic hash (None = defaults)
+    volatile_rules: Optional[List[VolatileRule]] = None
+    # Crawl state file (None = <downloads_dir>/crawl_state.json)
+    crawl_state_file: Optional[str] = None
+    # Corpus manifest maintained at write time (None = <downloads_dir>/manifest.jsonl)
+    manifest_file: Optional[str] = None
+    # Skip rewriting a page whose semantic hash matches the previous crawl
+    skip_unchanged: bool = True
+    # Incremental re-crawl: conditional requests + skip pages that did not change
+    incremental: bool = False
+    # Crash-safe writes: commit (sync + rename + directory fsync) once per N files or per time window
+    fsync_batch_size: int = 20
+    fsync_interval_seconds: float = 10.0
+    # Per page-type widget markers ("main" = main page; unlisted types use markers.WIDGET_MARKERS)
+    widget_markers_by_page_type: Optional[Dict[str, List[str]]] = None
+    # Check every page (login / error page / upsell) before saving; failing pages are re-queued
+    inline_check: bool = True
+    check_failure_classes: Tuple[str, ...] = DEFAULT_FAILURE_CLASSES
+    # Record configured JSON API responses during the page's own navigation (no second visit)
+    capture_api_json: bool = False
+    api_captures: Optional[Dict[str, Dict[str, str]]] = None  # None = DEFAULT_API_CAPTURES
+    api_capture_wait_seconds: float = 10.0
+    # Record every JSON response matching these URL regexes to downloads/<slug>/api_responses.jsonl
+    record_json: bool = False
+    json_record_patterns: Optional[List[str]] = None  # None = DEFAULT_JSON_RECORD_PATTERNS
+    # Schedule only the subpages linked from the school's main page (recorded in the crawl state)
+    discover_page_types: bool = True
+    page_types_ttl_hours: float = 7 * 24  # a recorded list older than this is ignored until the main page is re-read
+    # Skip pages that redirected to main / 404'd / hit a CDN error until the class TTL expires
+    negative_cache_file: Optional[str] = None  # None = <downloads_dir>/negative_cache.json
+    negative_ttl_hours: Optional[Dict[str, float]] = None  # per-class overrides of DEFAULT_NEGATIVE_TTL_HOURS
+    reprobe_negative: bool = False  # ignore cached failures and probe every page again
+    # Derive page-load / extraction timeouts per page type from recorded latencies (p99 × factor, clamped);
+    # a "timeout" in page_type_overrides still wins
+    adaptive_timeouts: bool = True
+    latency_stats_file: Optional[str] = None  # None = <downloads_dir>/latency_stats.json
+    # Failed navigations go to a deferred retry queue (jittered backoff per error class) instead of
+    # blocking the worker; False = retry inline, still with the per-class backoff
+    defer_retries: bool = True
+    backoff_rules: Optional[Dict[str, BackoffRule]] = None  # per-class overrides of DEFAULT_BACKOFF_RULES
+    # Per-host circuit breaker: N failures within the window stop requests to that host for a cool-down
+    circuit_failure_threshold: int = 5
+    circuit_open_seconds: float = 180.0
+    # Hedged navigation: a page not ready by its type's p95 load time is requested again in a second tab
+    # and the first tab to finish wins; hedges are capped at hedge_budget × navigations
+    # (skipped for pages with API capture / JSON recording, whose hooks live in the first tab).
+    # Starts the driver with page_load_strategy "none" so a loading tab does not block the others
+    hedge_navigation: bool = False
+    hedge_budget: float = DEFAULT_HEDGE_BUDGET
 
 
 class HTMLDownloader(SeleniumBase):
@@ -77,6 +156,7 @@ class HTMLDownloader(SeleniumBase):
         self.downloads_dir = dc.downloads_dir
         self.universities_json = universities_json
         self.universities = []
+        self.catalog = UniversityCatalog([])
         self.preserve_login_from_existing = dc.preserve_login_from_existing
         # Inter-download wait times
         self.wait_success_seconds = dc.wait_success_seconds
@@ -87,8 +167,58 @@ class HTMLDownloader(SeleniumBase):
         self.redirect_retry_max = 1
         # Supported page types
         self.page_types = list(PAGE_TYPES)
-        # Per-university dedupe store (reset per university in download_all_pages)
+        # Per-university dedupe store of semantic hashes (reset per university in download_all_pages)
         self._current_university_hashes: set[str] = set()
+        # Volatile-content normalization and persistent crawl state
+        self.normalizer = ContentNormalizer(dc.volatile_rules)
+        self.skip_unchanged = dc.skip_unchanged
+        self.incremental = dc.incremental
+        # Crash-safe writer; remove temp files orphaned by an interrupted run before loading state
+        self.file_writer = AtomicFileWriter(dc.fsync_batch_size, dc.fsync_interval_seconds)
+        recover_orphaned_temp_files(self.downloads_dir)
+        self.crawl_state = CrawlState(dc.crawl_state_file or os.path.join(self.downloads_dir, "crawl_state.json"))
+        self.manifest = CorpusManifest(dc.manifest_file or os.path.join(self.downloads_dir, "manifest.jsonl"))
+        self.negative_cache = NegativeCache(
+            dc.negative_cache_file or os.path.join(self.downloads_dir, "negative_cache.json"), dc.negative_ttl_hours
+        )
+        self.negative_cache.purge_expired()
+        self.reprobe_negative = dc.reprobe_negative
+        self.latency = LatencyTracker(dc.latency_stats_file or os.path.join(self.downloads_dir, "latency_stats.json"))
+        self.adaptive_timeouts = dc.adaptive_timeouts
+        # Retry policy: per-class backoff, per-host circuit breaker, deferred retry queue of (slug, page_type)
+        self.retry_policy = RetryPolicy(dc.backoff_rules)
+        self.circuit = CircuitBreaker(failure_threshold=dc.circuit_failure_threshold,
+                                      open_seconds=dc.circuit_open_seconds)
+        self.deferred = DeferredRetryQueue()
+        self.defer_retries = dc.defer_retries
+        self.navigation_manager.retry_delay = functools.partial(self.retry_policy.delay, ERR_DRIVER)
+        self.hedge_navigation = dc.hedge_navigation
+        self.hedge_budget = HedgeBudget(dc.hedge_budget)
+        if self.hedge_navigation:
+            # 로딩 중인 탭이 명령을 붙잡지 않도록 (일반 네비게이션은 load_page가 직접 준비 상태를 기다림)
+            self.config.page_load_strategy = "none"
+        # Widget cut finders per page type (built once from the marker lists)
+        self.widget_finders: Dict[str, WidgetCutFinder] = {
+            page_key(ptype): WidgetCutFinder(markers)
+            for ptype, markers in (dc.widget_markers_by_page_type or {}).items()
+        }
+        # Pre-save quality check and retry queue: (university slug, page_type) -> university info
+        self.page_checker = PageChecker()
+        self.inline_check = dc.inline_check
+        self.check_failure_classes = tuple(dc.check_failure_classes)
+        self.pending_retries: Dict[Tuple[str, str], Dict] = {}
+        self._final_attempt = False
+        # JSON API capture during navigation: page_type -> {filename: URL regex}
+        self.api_captures: Dict[str, Dict[str, str]] = (
+            (dc.api_captures if dc.api_captures is not None else DEFAULT_API_CAPTURES) if dc.capture_api_json else {}
+        )
+        self.api_capture_wait_seconds = dc.api_capture_wait_seconds
+        # JSON recording mode: responses go to a per-university store next to the HTML
+        self.api_store = ApiResponseStore(self.downloads_dir)
+        self.discover_page_types = dc.discover_page_types
+        self.page_types_ttl_hours = dc.page_types_ttl_hours
+        if dc.record_json:
+            self.start_json_recording(dc.json_record_patterns or DEFAULT_JSON_RECORD_PATTERNS)
         
         # Load universities from JSON file
         self.load_universities()
@@ -115,6 +245,8 @@ class HTMLDownloader(SeleniumBase):
         except Exception as e:
             logger.error(f"❌ Error loading universities JSON: {e}")
             self.universities = []
+        # Build the lookup indexes once (link / school_id / slug / name / trigrams)
+        self.catalog = UniversityCatalog(self.universities)
     
 
     
@@ -122,27 +254,24 @@ class HTMLDownloader(SeleniumBase):
         """
         Find university information by name.
         
+        Exact name, slug, link or school_id matches win; otherwise the best
+        ranked fuzzy match from the catalog (acronyms like "MIT" included).
+        
         Args:
-            university_name: Name of the university to search for
+            university_name: Name (or partial name, slug, link, school_id) of the university
             
         Returns:
-            Dictionary with university info (name, link, id) or None if not found
+            Dictionary with university info (name, link) or None if not found
         """
-        university_name_lower = university_name.lower()
-        
-        for university in self.universities:
-            if university_name_lower in university['name'].lower():
-                return {
-                    'name': university['name'],
-                    'link': university['link'],
-                }
-        
-        logger.error(f"❌ University '{university_name}' not found in the universities list")
-        return None
+        entry = self.catalog.resolve(university_name)
+        if entry is None:
+            logger.error(f"❌ University '{university_name}' not found in the universities list")
+            return None
+        return entry.as_info()
     
     def list_all_universities(self) -> List[str]:
         """Return a list of all university names."""
-        return [university['name'] for university in self.universities]
+        return [entry.name for entry in self.catalog]
         
     def construct_url_from_link(self, link: str, page_type: str) -> str:
         """
@@ -206,9 +335,7 @@ class HTMLDownloader(SeleniumBase):
 
     def _slugify_name(self, name: str) -> str:
         """Normalize university name to a safe directory slug."""
-        normalized = name.replace(' ', '_').replace('&', 'and').replace(',', '').replace('.', '')
-        normalized = ''.join(c for c in normalized if c.isalnum() or c in '_-')
-        return normalized
+        return slugify_name(name)
     
     def download_university_page(self, university_name: str, page_type: str, university_info: Optional[Dict] = None) -> Optional[str]:
         """
@@ -235,6 +362,7 @@ class HTMLDownloader(SeleniumBase):
         
         university_link = university_info['link']
         actual_name = university_info['name']
+        api_capture: Optional[NetworkCapture] = None
         
         try:
             # ---- 작은 헬퍼들로 로직 분리 ----
@@ -253,7 +381,7 @@ class HTMLDownloader(SeleniumBase):
                     original_timeout_local = self.config.page_load_timeout
                     self.config.page_load_timeout = int(timeout_override)
                 try:
-                    return self.navigate_to(url, wait_time=wait_seconds)
+                    return self.navigate_to(url, wait_time=wait_seconds, inline_retries=not self.defer_retries)
                 finally:
                     if original_timeout_local is not None:
                         self.config.page_load_timeout = original_timeout_local
@@ -275,35 +403,53 @@ class HTMLDownloader(SeleniumBase):
                         return True
                 return False
 
-            def _save_html(html_text: str, uni_name: str, ptype: str, display_name: str) -> Optional[str]:
+            def _save_html(data: bytes, end: int, suffix: bytes, uni_name: str, ptype: str, display_name: str, logged_in: Optional[bool] = None) -> Optional[str]:
+                """data[:end] + suffix를 저장합니다. 해시와 쓰기는 하나의 인코딩 버퍼에서 청크 단위로 처리."""
                 try:
                     logger.info(f"💾 {display_name} 파일 저장 중...")
                     self.create_downloads_directory()
                     university_dir_local, filename_local = self.generate_filename_and_path(uni_name, ptype)
                     os.makedirs(university_dir_local, exist_ok=True)
                     file_path_local = os.path.join(university_dir_local, filename_local)
+                    kept = memoryview(data)[:end]
                     
-                    # 해시 계산 (중복 검사용)
+                    # 시맨틱 해시: 휘발성 요소 제거 후 계산 (중복 검사용)
                     try:
-                        content_hash_local = hashlib.sha256(html_text.encode('utf-8')).hexdigest()
+                        semantic_hash_local = self.normalizer.semantic_hash(kept)
                     except Exception as e:
                         logger.warning(f"⚠️ 해시 계산 실패: {e}")
-                        content_hash_local = None
+                        semantic_hash_local = None
                     
-                    # 중복 검사
-                    if content_hash_local and content_hash_local in self._current_university_hashes:
+                    # 중복 검사 (같은 학교 내 다른 페이지와 동일한 콘텐츠)
+                    if semantic_hash_local and semantic_hash_local in self._current_university_hashes:
                         logger.info(f"⏭️ {display_name} 중복 콘텐츠 감지 - 저장 건너뜀")
                         return None
                     
-                    # 파일 저장
-                    with open(file_path_local, 'w', encoding='utf-8') as f:
-                        f.write(html_text)
+                    if semantic_hash_local:
+                        self._current_university_hashes.add(semantic_hash_local)
+                    
+                    # 이전 크롤과 시맨틱 해시가 같으면 파일 재작성 생략
+                    state_key = os.path.basename(university_dir_local)
+                    if (self.skip_unchanged and os.path.exists(file_path_local)
+                            and self.crawl_state.is_unchanged(state_key, ptype, semantic_hash_local)):
+                        checked_at = datetime.now().isoformat()
+                        self.crawl_state.update_page(state_key, ptype, checked_at=checked_at)
+                        if self.manifest.touch(state_key, ptype, logged_in, checked_at) is None:
+                            page_state = self.crawl_state.get_page(state_key, ptype) or {}
+                            self.manifest.record(state_key, ptype, file_path_local, os.path.getsize(file_path_local),
+                                                 page_state.get("raw_hash"), semantic_hash_local, logged_in)
+                        logger.info(f"⏭️ {display_name} 변경 없음 (시맨틱 해시 동일) - 기존 파일 유지")
+                        return file_path_local
                     
-                    # 해시 저장
-                    if content_hash_local:
-                        self._current_university_hashes.add(content_hash_local)
+                    # 파일 저장 (임시 파일 + 배치 rename, 원본 해시는 쓰면서 계산)
+                    # 해시 저장 (원본 + 시맨틱)과 매니페스트 갱신은 rename이 확정된 뒤에 (그 전에는 저장 안 된 페이지)
+                    def _on_commit(raw_hash_local: str, size_local: int) -> None:
+                        self.crawl_state.record_content(state_key, ptype, raw_hash_local, semantic_hash_local, size_local)
+                        self.manifest.record(state_key, ptype, file_path_local, size_local, raw_hash_local, semantic_hash_local, logged_in)
+
+                    _, size_local = self.file_writer.write_hashed(file_path_local, kept, suffix, on_commit=_on_commit)
                     
-                    logger.info(f"✅ 저장 완료: {filename_local} ({len(html_text):,}자)")
+                    logger.info(f"✅ 저장 완료: {filename_local} ({size_local:,}바이트)")
                     return file_path_local
                     
                 except Exception as e:
@@ -323,34 +469,83 @@ class HTMLDownloader(SeleniumBase):
             redirect_retry_left = 1
             nav_wait_seconds = getattr(self.config, 'post_render_wait_seconds', 10)
 
+            # 페이지 유형별 타임아웃: 수동 설정 > 지연 시간 기록 기반 > 기본값
+            if "timeout" in override:
+                timeout_override = int(override["timeout"])
+            elif self.adaptive_timeouts:
+                timeout_override = self.latency.timeout_for(page_type, STAGE_LOAD, self.config.page_load_timeout)
+            else:
+                timeout_override = None
+            load_timeout = timeout_override if timeout_override is not None else self.config.page_load_timeout
+            host = urlparse(page_url).netloc
+            slug = self._slugify_name(actual_name)
+
             while retry_count <= max_retries:
-                timeout_override = int(override["timeout"]) if "timeout" in override else None
-                nav_ok = _navigate_with_timeout_override(page_url, timeout_override, nav_wait_seconds)
+                # 회로가 열린 호스트는 네비게이션 없이 나중으로 미룸 (재시도 횟수는 소모하지 않음)
+                if not self.circuit.allow(host):
+                    self.deferred.push((slug, page_type), self.circuit.retry_after(host), "circuit_open",
+                                       count_attempt=False)
+                    logger.warning(f"🔌 {host} 회로 차단 중 - {page_display_name} 페이지 {self.circuit.retry_after(host):.0f}초 후로 연기")
+                    return None
+                # API 응답 캡처 훅은 네비게이션 전에 설치 (드라이버 재시작 후에도 다시 설치)
+                if page_type in self.api_captures:
+                    if api_capture is not None:
+                        api_capture.uninstall()
+                    api_capture = self._start_api_capture(page_type)
+                hedge_after = self._hedge_delay(page_type, load_timeout)
+                if hedge_after is not None and self.hedge_budget.allow():
+                    nav_ok, hedged = self.navigate_hedged(page_url, hedge_after, load_timeout)
+                else:
+                    nav_ok, hedged = _navigate_with_timeout_override(page_url, timeout_override, nav_wait_seconds), False
+                self.hedge_budget.record_navigation(hedged)
+                self._record_load_latency(page_type, load_timeout)
                 if not nav_ok:
+                    self.circuit.record_failure(host)
+                    if self.defer_retries:
+                        self._defer_retry(slug, page_type, ERR_TIMEOUT, max_retries)
                     return None
 
                 if self.is_error_response():
-                    error_type = self.get_error_type()
+                    error_info = self.get_error_info()
+                    error_type = error_info.get("type")
                     if self.is_permanent_error():
                         logger.warning(f"⚠️ {page_display_name} 페이지 건너뜀 - {error_type}")
+                        failure_class = NEG_CDN_ERROR if error_type and "Akamai" in error_type else NEG_NOT_FOUND
+                        self._record_negative(slug, page_type, failure_class, error_type or "")
+                        if failure_class == NEG_CDN_ERROR:
+                            self.circuit.record_failure(host)
+                        return None
+                    error_class = classify_error(error_info.get("status"), error_type)
+                    self.circuit.record_failure(host)
+                    if self.defer_retries:
+                        # 대기하지 않고 다음 작업으로 넘어감 - 재시도는 지연 대기열에서
+                        self._defer_retry(slug, page_type, error_class, max_retries, error_type)
                         return None
                     if retry_count < max_retries:
+                        backoff = self.retry_policy.delay(error_class, retry_count)
                         retry_count += 1
-                        backoff = getattr(self.config, 'retry_backoff_seconds', 60)
-                        logger.warning(f"⚠️ {page_display_name} 페이지 에러 ({error_type}) - {backoff}초 후 재시도 ({retry_count}/{max_retries})")
+                        logger.warning(f"⚠️ {page_display_name} 페이지 에러 ({error_type}) - {backoff:.0f}초 후 재시도 ({retry_count}/{max_retries})")
                         time.sleep(backoff)
                         logger.info("🔄 드라이버 재시작 중...")
                         self._restart_chrome()
                         continue
                     logger.error(f"❌ {page_display_name} 페이지 재시도 실패 - {error_type}")
                     return None
+                self.circuit.record_success(host)
                 break
 
             # HTML 콘텐츠 가져오기 (타임아웃 및 재시도 로직 추가)
             html_content = None
             content_retry_count = 0
             max_content_retries = 2
-            content_timeout = 30  # 30초 타임아웃
+            content_timeout = (self.latency.timeout_for(page_type, STAGE_EXTRACT, DEFAULT_CONTENT_TIMEOUT)
+                               if self.adaptive_timeouts else DEFAULT_CONTENT_TIMEOUT)
+
+            def _content_retry_pause(error_class: str) -> None:
+                # 이미 로드된 페이지에서 추출만 다시 하므로 짧게 기다림 (지연 대기열로 넘기면 재로드가 필요)
+                backoff = self.retry_policy.delay(error_class, content_retry_count - 1)
+                logger.warning(f"⚠️ HTML 콘텐츠 추출 재시도 ({content_retry_count}/{max_content_retries}) - {backoff:.1f}초 후")
+                time.sleep(backoff)
             
             while content_retry_count <= max_content_retries:
                 try:
@@ -365,17 +560,23 @@ class HTMLDownloader(SeleniumBase):
                     signal.signal(signal.SIGALRM, timeout_handler)
                     signal.alarm(content_timeout)
                     
+                    extract_started = time.monotonic()
                     try:
-                        html_content = self.get_page_source()
+                        html_content = self.get_page_source(timeout=content_timeout)
                     finally:
                         signal.alarm(0)  # 타임아웃 해제
+                    extract_seconds = time.monotonic() - extract_started
+                    if html_content:
+                        self.latency.record(page_type, STAGE_EXTRACT, extract_seconds)
+                    elif extract_seconds >= content_timeout - 1:
+                        # get_page_source 내부 타임아웃 (None 반환)
+                        self.latency.record(page_type, STAGE_EXTRACT, content_timeout, timed_out=True)
                     
                     if not html_content:
                         logger.error("❌ HTML 콘텐츠가 비어있습니다")
                         if content_retry_count < max_content_retries:
                             content_retry_count += 1
-                            logger.warning(f"⚠️ HTML 콘텐츠 추출 재시도 ({content_retry_count}/{max_content_retries})")
-                            time.sleep(5)
+                            _content_retry_pause(ERR_DRIVER)
                             continue
                         return None
                     
@@ -386,11 +587,11 @@ class HTMLDownloader(SeleniumBase):
                     break  # 성공 시 루프 탈출
                     
                 except TimeoutError:
+                    self.latency.record(page_type, STAGE_EXTRACT, content_timeout, timed_out=True)
                     logger.warning(f"⚠️ HTML 콘텐츠 추출 타임아웃 ({content_timeout}초)")
                     if content_retry_count < max_content_retries:
                         content_retry_count += 1
-                        logger.warning(f"⚠️ HTML 콘텐츠 추출 재시도 ({content_retry_count}/{max_content_retries})")
-                        time.sleep(5)
+                        _content_retry_pause(ERR_TIMEOUT)
                         continue
                     else:
                         logger.error(f"❌ HTML 콘텐츠 추출 최종 실패 - 타임아웃")
@@ -400,8 +601,7 @@ class HTMLDownloader(SeleniumBase):
                     logger.error(f"❌ HTML 콘텐츠 추출 실패: {str(e)}")
                     if content_retry_count < max_content_retries:
                         content_retry_count += 1
-                        logger.warning(f"⚠️ HTML 콘텐츠 추출 재시도 ({content_retry_count}/{max_content_retries})")
-                        time.sleep(5)
+                        _content_retry_pause(ERR_DRIVER)
                         continue
                     else:
                         return None
@@ -417,12 +617,15 @@ class HTMLDownloader(SeleniumBase):
                         try:
                             if self.preserve_login_from_existing and not self.use_existing_chrome:
                                 self.apply_session_to_current_driver(USNEWS_ORIGINS)
-                            if not self.navigate_to(page_url, wait_time=nav_wait_seconds, do_precheck=True):
+                            if not self.navigate_to(page_url, wait_time=nav_wait_seconds, do_precheck=True,
+                                                    inline_retries=not self.defer_retries):
+                                if self.defer_retries:
+                                    self._defer_retry(slug, page_type, ERR_TIMEOUT, max_retries)
                                 return None
                             try:
                                 current_url = self.driver.current_url if self.driver else ""
                                 logger.info("📄 리다이렉트 후 HTML 콘텐츠 재추출 중...")
-                                html_content = self.get_page_source()
+                                html_content = self.get_page_source(timeout=content_timeout)
                                 if not html_content:
                                     logger.error("❌ 리다이렉트 후 HTML 콘텐츠가 비어있습니다")
                                     return None
@@ -434,10 +637,13 @@ class HTMLDownloader(SeleniumBase):
                             redirect_retry_left -= 1
                     if _redirected_to_main(current_url, html_content, page_type):
                         logger.info(f"⏭️ Skipping save for '{page_type}' - redirected to main page (avoiding duplicate).")
+                        self._record_negative(self._slugify_name(actual_name), page_type, NEG_REDIRECT, current_url)
+                        self._discard_captures(api_capture)
                         return None
 
-            # 로그인 상태 확인
-            is_logged_in = self._check_login_status(html_content)
+            # 로그인 상태 확인 (에러/업셀 판정도 같은 스캔에서 수행)
+            page_check = self.page_checker.check(html_content)
+            is_logged_in = page_check.is_logged_in
             if not is_logged_in:
                 logger.warning(f"⚠️ {page_display_name} 페이지가 로그인되지 않은 상태로 다운로드됨")
                 logger.info("🔄 Chrome 재시작 및 로그인 재시도 중...")
@@ -449,10 +655,12 @@ class HTMLDownloader(SeleniumBase):
                     nav_ok = _navigate_with_timeout_override(page_url, timeout_override, nav_wait_seconds)
                     if nav_ok:
                         try:
-                            html_content = self.get_page_source()
+                            html_content = self.get_page_source(timeout=content_timeout)
                             if html_content:
                                 # 재로그인 후 로그인 상태 재확인
-                                is_logged_in_retry = self._check_login_status(html_content)
+                                page_check = self.page_checker.check(html_content)
+                                is_logged_in_retry = page_check.is_logged_in
+                                is_logged_in = is_logged_in_retry
                                 if is_logged_in_retry:
                                     logger.info(f"✅ {page_display_name} 페이지 재로그인 성공")
                                 else:
@@ -468,36 +676,76 @@ class HTMLDownloader(SeleniumBase):
             else:
                 logger.info(f"✅ {page_display_name} 페이지 로그인 상태 확인됨")
 
-            # 위젯 제거 처리
+            # 저장 전 품질 검사: 실패한 페이지는 저장하지 않고 실행 끝의 재시도 대기열로
+            problems: List[str] = []
+            if self.inline_check:
+                problems = [p for p in page_check.problems if p in self.check_failure_classes]
+                if problems and not self._handle_check_failure(university_info, page_type, problems):
+                    self._discard_captures(api_capture)
+                    return None
+
+            # 한 번만 인코딩하고 이후 처리는 오프셋/메모리뷰 기반으로 (문자열 사본 생성 방지)
+            html_bytes = html_content.encode('utf-8')
+            html_content = None
+            cut_end = len(html_bytes)
+            cut_suffix = b""
+
+            # 위젯 제거 처리 (잘라낼 위치만 계산)
             try:
                 if self.truncate_at_widget:
                     logger.info("✂️ 추천 위젯 제거 확인 중...")
-                    cut_index = self._find_widget_cut_index(html_content)
-                    if cut_index is not None and cut_index > 0:
-                        original_length = len(html_content)
-                        html_content = html_content[:cut_index] + "\n<!-- Truncated before recommendations widget -->\n"
-                        logger.info(f"✂️ 추천 위젯 제거됨 ({original_length:,}자 → {len(html_content):,}자)")
+                    cut = self._find_widget_cut(html_bytes, page_type)
+                    if cut is not None and cut[0] > 0:
+                        cut_end = cut[0]
+                        cut_suffix = TRUNCATION_SUFFIX
+                        logger.info(f"✂️ 추천 위젯 제거됨 [{cut[1]}] ({len(html_bytes):,}바이트 → {cut_end + len(cut_suffix):,}바이트)")
                     else:
                         logger.info("✅ 추천 위젯 없음 - 원본 콘텐츠 유지")
             except Exception as e:
                 logger.warning(f"⚠️ 위젯 제거 중 오류 (원본 유지): {str(e)}")
 
             # 파일 저장
-            return _save_html(html_content, actual_name, page_type, page_display_name)
+            saved_path = _save_html(html_bytes, cut_end, cut_suffix, actual_name, page_type, page_display_name, is_logged_in)
+            # 같은 네비게이션에서 받은 JSON API 응답 저장 (HTML 옆에) - 비로그인/에러/업셀 판정이 없는 로드만
+            if saved_path and not page_check.problems:
+                if api_capture is not None and api_capture.driver is self.driver:
+                    self._save_api_captures(actual_name, page_type, api_capture)
+                if self.json_record_patterns:
+                    self._store_recorded_json(actual_name, page_type)
+            else:
+                self._discard_captures(api_capture)
+            if saved_path:
+                self.negative_cache.clear(slug, page_type)
+                self.deferred.forget((slug, page_type))
+            if saved_path and self.inline_check:
+                state_key = self._slugify_name(actual_name)
+                self.crawl_state.record_check(state_key, page_type, problems)
+                if not problems:
+                    self.pending_retries.pop((state_key, page_type), None)
+            return saved_path
 
         except Exception as e:
             logger.error(f"❌ Error downloading {page_type} page: {str(e)}")
-            backoff = getattr(self.config, 'retry_backoff_seconds', 60)
-            logger.info(f"⏰ 에러 발생으로 인한 {backoff}초 대기...")
+            max_retries_on_error = int(self.page_type_overrides.get(page_type, {}).get("retries", 3))
+            if self.defer_retries:
+                self._defer_retry(self._slugify_name(actual_name), page_type, ERR_DRIVER, max_retries_on_error, str(e))
+                return None
+            backoff = self.retry_policy.delay(ERR_DRIVER, 0)
+            logger.info(f"⏰ 에러 발생으로 인한 {backoff:.0f}초 대기...")
             time.sleep(backoff)
             return None
+        finally:
+            # 같은 드라이버의 다음 페이지에는 훅을 남기지 않음
+            if api_capture is not None:
+                api_capture.uninstall()
     
-    def download_all_pages(self, university_name: str) -> List[str]:
+    def download_all_pages(self, university_name: str, university_info: Optional[Dict] = None) -> List[str]:
         """
         Download HTML content from all supported university pages.
         
         Args:
             university_name: Name of the university (will be searched in universities.json)
+            university_info: Catalog entry info to skip the name lookup (batch crawls)
             
         Returns:
             List of paths to saved HTML files
@@ -505,9 +753,10 @@ class HTMLDownloader(SeleniumBase):
         downloaded_files = []
         
         # Find university information first
-        university_info = self.find_university_by_name(university_name)
-        if not university_info:
-            return downloaded_files
+        if university_info is None:
+            university_info = self.find_university_by_name(university_name)
+            if not university_info:
+                return downloaded_files
         
         try:
             # ---- 작은 헬퍼들 ----
@@ -570,11 +819,24 @@ class HTMLDownloader(SeleniumBase):
                     logger.error("❌ 최종 드라이버 재시작 실패")
                 return False
 
-            # 대학교 폴더 존재 여부 확인
+            # 대학교 폴더 존재 여부 확인 (증분 모드에서는 페이지 단위로 변경 여부 판단)
             university_dir, _ = self.generate_filename_and_path(university_info['name'], "")
-            if os.path.exists(university_dir):
+            slug = os.path.basename(university_dir)
+            # 이전 실행에서 메인 페이지 링크로 확인한 페이지 목록 (없으면 전체 유형 시도)
+            available: Optional[List[str]] = self._known_page_types(slug)
+            # 네거티브 캐시: 만료 전까지 리다이렉트/404/CDN 에러가 기록된 페이지는 건너뜀
+            cached_failures = {} if self.reprobe_negative else {
+                p: entry for p in self.page_types
+                for entry in [self.negative_cache.lookup(slug, p)] if entry
+            }
+            if "" in cached_failures:
+                entry = cached_failures[""]
+                logger.info(f"⏭️ {university_info['name']} 메인 페이지 실패 캐시됨 ({entry['class']}, {entry['expires_at'][:16]}까지) - 스킵")
+                return downloaded_files
+            if os.path.exists(university_dir) and not self.incremental:
                 existing_files = [f for f in os.listdir(university_dir) if f.endswith('.html')]
-                expected_pages = len(self.page_types)
+                expected_pages = len([p for p in (available if available is not None else self.page_types)
+                                      if p not in cached_failures])
                 
                 if len(existing_files) >= expected_pages:
                     logger.info(f"⏭️ {university_info['name']} 이미 완전히 다운로드됨 - 스킵")
@@ -596,16 +858,53 @@ class HTMLDownloader(SeleniumBase):
             # Reset per-university dedupe store
             self._current_university_hashes = set()
 
+            unchanged_count = 0
             for i, page_type in enumerate(self.page_types, 1):
                 page_display_name = "main" if page_type == "" else page_type
+                if available is not None and page_type not in available:
+                    logger.info(f"⏭️ {page_display_name} 페이지 - 메인 페이지에 링크 없음 - 스킵")
+                    continue
+                if page_type in cached_failures:
+                    entry = cached_failures[page_type]
+                    logger.info(f"⏭️ {page_display_name} 페이지 - 실패 캐시됨 ({entry['class']}, {entry['expires_at'][:16]}까지) - 스킵")
+                    continue
                 logger.info(f"\n📖 [{i}/{len(self.page_types)}] Downloading {page_display_name} page...")
                 logger.info("-" * 40)
                 
-                # API 수집 로직 제거됨
+                # 증분 모드: 조건부 요청으로 변경 없는 페이지는 네비게이션/후처리/저장 모두 생략
+                validators: Dict[str, Optional[str]] = {}
+                if self.incremental:
+                    unchanged_path, validators = self._check_not_modified(university_info, page_type)
+                    if unchanged_path:
+                        logger.info(f"⏭️ {page_display_name} 페이지 변경 없음 (조건부 요청) - 스킵")
+                        downloaded_files.append(unchanged_path)
+                        unchanged_count += 1
+                        if page_type == "" and self.discover_page_types:
+                            available = self._discover_available_pages(slug, university_info, unchanged_path) or available
+                        continue
                 
                 file_path = self.download_university_page(university_name, page_type, university_info)
+                if page_type == "" and file_path and self.discover_page_types:
+                    available = self._discover_available_pages(slug, university_info, file_path) or available
                 if file_path:
                     downloaded_files.append(file_path)
+                    if validators:
+                        self.crawl_state.update_page(os.path.basename(university_dir), page_type, **validators)
+                elif (os.path.basename(university_dir), page_type) in self.pending_retries:
+                    # 품질 검사 실패 - 이 페이지만 실행 끝에서 재시도 (메인 페이지여도 학교 전체를 건너뛰지 않음)
+                    logger.info(f"🔁 {page_display_name} 페이지 재시도 대기열에 추가됨")
+                elif (slug, page_type) in self.deferred:
+                    if page_type == "":
+                        # 메인 페이지가 미뤄지면 학교 전체(하위 페이지 포함)를 나중에 다시 시도
+                        self.deferred.replace((slug, ""), (slug, ALL_PAGES))
+                        main_retries = int(self.page_type_overrides.get("", {}).get("retries", 3))
+                        if self.deferred.attempts_for((slug, ALL_PAGES)) > main_retries:
+                            logger.error(f"❌ {university_info['name']} 메인 페이지 재시도 모두 실패 - 포기")
+                            self.deferred.forget((slug, ALL_PAGES))
+                        else:
+                            logger.info(f"⏳ {university_info['name']} 메인 페이지 재시도 예약 - 학교 전체를 나중에 다시 시도")
+                        break
+                    logger.info(f"⏳ {page_display_name} 페이지 재시도 예약됨 - 다음 페이지로 진행")
                 else:
                     logger.info(f"⏭️ {page_display_name} 페이지 건너뜀 (페이지가 존재하지 않거나 오류 발생)")
                     
@@ -614,19 +913,24 @@ class HTMLDownloader(SeleniumBase):
                         logger.warning(f"⚠️ {university_info['name']} 메인 페이지 에러 - 해당 대학교 전체 스킵")
                         break
 
-                # Delay between downloads (shorter if skipped)
-                if i < len(self.page_types):
+                # Delay between downloads (shorter if skipped); none after the last scheduled page
+                if any((available is None or p in available) and p not in cached_failures for p in self.page_types[i:]):
                     wait_seconds = self.wait_success_seconds if file_path else self.wait_skip_seconds
                     logger.info(f"⏳ Waiting {wait_seconds} seconds before next download...")
                     time.sleep(wait_seconds)
             
             logger.info(f"\n🎉 Download Summary:")
-            logger.info(f"✅ Successfully downloaded: {len(downloaded_files)}/{len(self.page_types)} pages")
+            scheduled_count = len([p for p in (available if available is not None else self.page_types)
+                                   if p not in cached_failures])
+            logger.info(f"✅ Successfully downloaded: {len(downloaded_files)}/{scheduled_count} pages")
+            if self.incremental:
+                logger.info(f"⏭️ Unchanged (skipped): {unchanged_count}/{scheduled_count} pages")
             
             # 학교 전체 다운로드 완료 후 최종 캐시 정리
             logger.info(f"🧹 {university_info['name']} 학교 다운로드 완료 - 최종 캐시 정리 중...")
             if self.driver:
                 self.clear_cache_and_data()
+            self.crawl_state.save()
             
             return downloaded_files
             
@@ -637,27 +941,411 @@ class HTMLDownloader(SeleniumBase):
         finally:
             self.close()
 
-    def _find_widget_cut_index(self, html_content: str):
-        """Return the index to cut HTML before the recommendations widget, or None if not found."""
-        # 여러 종류의 추천 위젯을 찾아서 가장 먼저 나타나는 것 선택
-        markers = [
-            '<div id="blueshift-recommendations-widget"',
-            'id="blueshift-recommendations-widget"',
-            'blueshift-recommendations-widget',
-            '<div id="null-recommendations-widget"',
-            'id="null-recommendations-widget"',
-            'null-recommendations-widget',
-            'SailthruRecommend__Container'
-        ]
+    def _record_negative(self, slug: str, page_type: str, failure_class: str, detail: str) -> None:
+        """Cache a failed page; a page that no longer exists (404 / redirect) also leaves the manifest."""
+        self.negative_cache.record(slug, page_type, failure_class, detail)
+        if failure_class in (NEG_NOT_FOUND, NEG_REDIRECT) and self.manifest.get(slug, page_type):
+            # 파일은 지우지 않음 - 매니페스트(--status)는 사이트에 현재 있는 페이지만 보여줌
+            self.manifest.remove(slug, page_type)
+
+    def _record_load_latency(self, page_type: str, load_timeout: int) -> None:
+        """
+        Record the last navigation in the page type's load-latency window.
+
+        The driver.get time is measured by the navigation manager, so neither the
+        post-render wait nor restart backoff ends up in the sample; attempts that hit
+        the page-load timeout are recorded as censored entries.
+        """
+        navigation = self.navigation_manager
+        for _ in range(navigation.last_load_timeouts):
+            self.latency.record(page_type, STAGE_LOAD, load_timeout, timed_out=True)
+        if navigation.last_load_seconds is not None:
+            self.latency.record(page_type, STAGE_LOAD, navigation.last_load_seconds)
+
+    def _hedge_delay(self, page_type: str, load_timeout: int) -> Optional[float]:
+        """Seconds after which a still-loading page gets a second request (None = do not hedge)."""
+        if not self.hedge_navigation or page_type in self.api_captures or self.json_record_patterns:
+            return None
+        if self.config.page_load_strategy != "none":
+            return None
+        p95 = self.latency.percentile(page_type, STAGE_LOAD, HEDGE_PERCENTILE)
+        if p95 is None or p95 >= load_timeout:
+            return None
+        return p95
+
+    def _defer_retry(self, slug: str, page_type: str, error_class: str, max_retries: int,
+                     detail: Optional[str] = None) -> bool:
+        """
+        Schedule a failed page on the deferred retry queue with the class backoff.
+
+        Returns:
+            False if the page already used up ``max_retries`` (given up)
+        """
+        key = (slug, page_type)
+        attempt = self.deferred.attempts_for(key)
+        page_display_name = page_type or "main"
+        if attempt >= max_retries:
+            logger.error(f"❌ {slug}/{page_display_name} 재시도 {attempt}회 모두 실패 ({error_class}) - 포기")
+            self.deferred.forget(key)
+            return False
+        delay = self.retry_policy.delay(error_class, attempt)
+        self.deferred.push(key, delay, error_class)
+        logger.warning(f"⏳ {slug}/{page_display_name} {error_class}{f' ({detail})' if detail else ''}"
+                       f" - {delay:.0f}초 후 재시도 예약 ({attempt + 1}/{max_retries})")
+        return True
+
+    def run_due_retries(self, batch_size: int = 50) -> Dict[str, int]:
+        """Re-download deferred pages whose backoff has elapsed (no waiting); call between universities."""
+        due = self.deferred.pop_due()
+        if not due:
+            return {"requested": 0, "saved": 0, "failed": 0, "unknown": 0}
+        logger.info(f"\n⏳ 지연 재시도 {len(due)}건 실행 (대기열 남은 {len(self.deferred)}건)")
+        return self.recrawl_pages(due, batch_size=batch_size)
+
+    def drain_deferred_retries(self, batch_size: int = 50) -> Dict[str, int]:
+        """Run the deferred queue to completion, sleeping only when nothing is due yet (end of a run)."""
+        totals = {"requested": 0, "saved": 0, "failed": 0, "unknown": 0}
+        while len(self.deferred):
+            wait = self.deferred.next_due_in() or 0.0
+            if wait > 0:
+                logger.info(f"⏳ 다음 지연 재시도까지 {wait:.0f}초 대기 (대기열 {len(self.deferred)}건)")
+                time.sleep(wait)
+            stats = self.run_due_retries(batch_size=batch_size)
+            for key in totals:
+                totals[key] += stats[key]
+        return totals
+
+    def _known_page_types(self, slug: str) -> Optional[List[str]]:
+        """Subpages recorded from the main page, or None (discovery off, never discovered or expired)."""
+        if not self.discover_page_types:
+            return None
+        return self.crawl_state.get_page_types(slug, max_age_hours=self.page_types_ttl_hours)
+
+    def _discover_available_pages(self, slug: str, university_info: Dict, main_path: str) -> Optional[List[str]]:
+        """Read the saved main page, find the linked subpages and record them in the crawl state."""
+        try:
+            # 배치 rename 전이면 아직 임시 파일에 있음
+            with open(self.file_writer.current_path(main_path), 'r', encoding='utf-8', errors='ignore') as f:
+                html_text = f.read()
+        except OSError as e:
+            logger.warning(f"⚠️ 메인 페이지 읽기 실패 (하위 페이지 탐색 생략): {e}")
+            return None
+        available = discover_page_types(html_text, university_info['link'], self.page_types)
+        if available is None:
+            logger.info("🔎 메인 페이지에서 하위 페이지 링크를 찾지 못함 - 모든 페이지 유형 시도")
+            return None
+        missing = [p for p in self.page_types if p not in available]
+        logger.info(f"🔎 메인 페이지 링크 기준 페이지 {len(available)}개 예정" +
+                    (f" (없음: {', '.join(missing)})" if missing else ""))
+        self.crawl_state.record_page_types(slug, available)
+        return available
+
+    def close(self):
+        """Flush pending writes, persist crawl state and shut down the WebDriver."""
+        self.file_writer.flush()
+        self.crawl_state.save()
+        self.negative_cache.save()
+        self.latency.save()
+        self.manifest.maybe_compact()
+        super().close()
+
+    def _check_not_modified(self, university_info: Dict, page_type: str) -> Tuple[Optional[str], Dict[str, Optional[str]]]:
+        """
+        Issue a conditional request for a page using the ETag/Last-Modified from the previous crawl.
         
-        earliest_index = None
-        for marker in markers:
-            idx = html_content.find(marker)
-            if idx != -1:
-                if earliest_index is None or idx < earliest_index:
-                    earliest_index = idx
+        Args:
+            university_info: University info dict (name, link)
+            page_type: Page type to check
+            
+        Returns:
+            (path of the existing file if the page is unchanged else None, fresh validators to record)
+        """
+        university_dir, filename = self.generate_filename_and_path(university_info['name'], page_type)
+        file_path = os.path.join(university_dir, filename)
+        record = self.crawl_state.get_page(os.path.basename(university_dir), page_type) or {}
+        etag = record.get("etag")
+        last_modified = record.get("last_modified")
         
-        return earliest_index
+        if not self.driver:
+            return None, {}
+        probe = self.conditional_probe(self.construct_url_from_link(university_info['link'], page_type), etag, last_modified)
+        if not probe:
+            return None, {}
+        validators = {"etag": probe.get("etag") or etag, "last_modified": probe.get("last_modified") or last_modified}
+        
+        if not os.path.exists(file_path) or not record.get("semantic_hash"):
+            return None, validators
+        status = probe.get("status")
+        not_modified = status == 304 or (
+            status == 200 and (
+                (etag and probe.get("etag") == etag)
+                or (last_modified and probe.get("last_modified") == last_modified)
+            )
+        )
+        if not_modified:
+            checked_at = datetime.now().isoformat()
+            self._current_university_hashes.add(record["semantic_hash"])
+            self.crawl_state.update_page(os.path.basename(university_dir), page_type, checked_at=checked_at, **validators)
+            self.manifest.touch(os.path.basename(university_dir), page_type, fetched_at=checked_at)
+            return file_path, validators
+        return None, validators
+
+    def _handle_check_failure(self, university_info: Dict, page_type: str, problems: List[str]) -> bool:
+        """
+        Record a failed pre-save check and queue the page for the end-of-run retry.
+
+        Returns:
+            True if the page should be saved anyway (final retry and no existing file), False otherwise
+        """
+        university_dir, filename = self.generate_filename_and_path(university_info['name'], page_type)
+        state_key = os.path.basename(university_dir)
+        page_display_name = "main" if page_type == "" else page_type
+        self.crawl_state.record_check(state_key, page_type, problems)
+        if not self._final_attempt:
+            self.pending_retries[(state_key, page_type)] = university_info
+            logger.warning(f"⚠️ {page_display_name} 페이지 품질 검사 실패 ({', '.join(problems)}) - 저장하지 않고 재시도 대기열에 추가")
+            return False
+        if os.path.exists(os.path.join(university_dir, filename)):
+            logger.warning(f"⚠️ {page_display_name} 페이지 재시도 후에도 검사 실패 ({', '.join(problems)}) - 기존 파일 유지")
+            return False
+        logger.warning(f"⚠️ {page_display_name} 페이지 재시도 후에도 검사 실패 ({', '.join(problems)}) - 실패 상태로 저장")
+        return True
+
+    def retry_failed_pages(self, include_previous: bool = True) -> Dict[str, int]:
+        """
+        Re-download only the pages that failed the pre-save check, in one browser session.
+
+        Args:
+            include_previous: Also retry pages still marked failed in the crawl state from earlier runs
+
+        Returns:
+            {"queued": n, "recovered": n, "failed": n}
+        """
+        queue: Dict[Tuple[str, str], Dict] = dict(self.pending_retries)
+        if include_previous:
+            by_slug = self._universities_by_slug()
+            for slug, key in self.crawl_state.failed_pages():
+                page_type = "" if key == "main" else key
+                if slug in by_slug and page_type in self.page_types:
+                    queue.setdefault((slug, page_type), by_slug[slug])
+        stats = {"queued": len(queue), "recovered": 0, "failed": 0}
+        if not queue:
+            return stats
+
+        logger.info(f"\n🔁 품질 검사 실패 페이지 재시도: {len(queue)}개")
+        logger.info("=" * 60)
+        self._final_attempt = True
+        try:
+            self.setup_driver()
+            if self.preserve_login_from_existing and not self.use_existing_chrome:
+                try:
+                    self.apply_session_to_current_driver(USNEWS_ORIGINS)
+                except Exception as e:
+                    logger.warning(f"⚠️ 로그인 세션 적용 실패: {e}")
+            for i, ((slug, page_type), university_info) in enumerate(queue.items(), 1):
+                page_display_name = "main" if page_type == "" else page_type
+                logger.info(f"🔁 [{i}/{len(queue)}] {university_info['name']} - {page_display_name}")
+                # 재시도는 페이지 단위이므로 학교 내 중복 검사는 적용하지 않음
+                self._current_university_hashes = set()
+                self.download_university_page(university_info['name'], page_type, university_info)
+                record = self.crawl_state.get_page(slug, page_type) or {}
+                if record.get("check_status") == "ok":
+                    stats["recovered"] += 1
+                else:
+                    stats["failed"] += 1
+                self.pending_retries.pop((slug, page_type), None)
+                if i < len(queue):
+                    time.sleep(self.wait_skip_seconds)
+        finally:
+            self._final_attempt = False
+            self.close()
+        logger.info(f"🔁 재시도 결과: 복구 {stats['recovered']}개 / 실패 {stats['failed']}개")
+        return stats
+
+    def _universities_by_slug(self) -> Dict[str, Dict]:
+        """Map of download directory slug -> university info."""
+        return {slug: entry.as_info() for slug, entry in self.catalog.by_slug.items()}
+
+    def recrawl_pages(self, targets: List[RecrawlTarget], batch_size: int = 50) -> Dict[str, int]:
+        """
+        Re-download only the given (university slug, page_type) pages.
+
+        Targets are grouped by university and split into batches; each batch
+        runs in one browser session (login applied once). Saved pages replace
+        the old files atomically through the regular save path.
+
+        Args:
+            targets: (slug, page_type) pairs, page_type "" = main, ALL_PAGES = every page type
+            batch_size: Pages per browser session
+
+        Returns:
+            {"requested": n, "saved": n, "failed": n, "unknown": n}
+        """
+        by_slug = self._universities_by_slug()
+        # 카탈로그 변경분 대상("*")은 학교의 모든 페이지 유형으로 확장
+        targets = [(slug, ptype) for slug, page_type in targets
+                   for ptype in ((self._known_page_types(slug) or self.page_types)
+                                 if page_type == ALL_PAGES else [page_type])]
+        known = [t for t in targets if t[0] in by_slug and t[1] in self.page_types]
+        stats = {"requested": len(targets), "saved": 0, "failed": 0, "unknown": len(targets) - len(known)}
+        known_set = set(known)
+        for slug, page_type in targets:
+            if (slug, page_type) not in known_set:
+                logger.warning(f"⚠️ 알 수 없는 대상 건너뜀: {slug}/{page_type or 'main'}")
+
+        batches = batch_targets(known, batch_size)
+        done = 0
+        for batch_index, batch in enumerate(batches, 1):
+            logger.info(f"\n🎯 재크롤 배치 [{batch_index}/{len(batches)}] - 페이지 {len(batch)}개")
+            logger.info("=" * 60)
+            try:
+                self.setup_driver()
+                if self.preserve_login_from_existing and not self.use_existing_chrome:
+                    try:
+                        self.apply_session_to_current_driver(USNEWS_ORIGINS)
+                    except Exception as e:
+                        logger.warning(f"⚠️ 로그인 세션 적용 실패: {e}")
+                current_slug = None
+                for i, (slug, page_type) in enumerate(batch, 1):
+                    university_info = by_slug[slug]
+                    if slug != current_slug:
+                        # 학교가 바뀔 때만 학교 내 중복 검사 저장소 초기화
+                        self._current_university_hashes = set()
+                        current_slug = slug
+                    done += 1
+                    logger.info(f"🎯 [{done}/{len(known)}] {university_info['name']} - {page_type or 'main'}")
+                    file_path = self.download_university_page(university_info['name'], page_type, university_info)
+                    if file_path:
+                        stats["saved"] += 1
+                    else:
+                        stats["failed"] += 1
+                    if i < len(batch):
+                        time.sleep(self.wait_success_seconds if file_path else self.wait_skip_seconds)
+            finally:
+                self.close()
+        logger.info(f"🎯 재크롤 결과: 저장 {stats['saved']}개 / 실패 {stats['failed']}개 / 알 수 없음 {stats['unknown']}개")
+        return stats
+
+    def refresh_catalog(self, source: str = SOURCE_API, prune: bool = False, dry_run: bool = False,
+                        diff_path: str = DEFAULT_CATALOG_DIFF) -> Optional[CatalogDiff]:
+        """
+        Re-fetch the rankings listing, merge it into universities.json by school_id and write the diff.
+
+        Args:
+            source: "api" (listing JSON API, HTML fallback) or "html"
+            prune: Drop schools that are no longer listed (kept by default)
+            dry_run: Only write the diff; leave universities.json untouched
+            diff_path: Where to write the diff (input for --recrawl-from)
+
+        Returns:
+            The diff, or None if the listing could not be fetched completely (nothing is written then)
+        """
+        try:
+            self.setup_driver()
+            if self.preserve_login_from_existing and not self.use_existing_chrome:
+                try:
+                    self.apply_session_to_current_driver(USNEWS_ORIGINS)
+                except Exception as e:
+                    logger.warning(f"⚠️ 로그인 세션 적용 실패: {e}")
+            fresh = fetch_ranking_entries(self, source)
+        finally:
+            self.close()
+        if not fresh:
+            logger.error("❌ 랭킹 목록을 가져오지 못했습니다. universities.json을 유지합니다.")
+            return None
+        if prune and len(fresh) < len(self.catalog) // 2:
+            # 차단 등으로 목록이 중간에 끊긴 경우 대량 삭제 방지
+            logger.warning(f"⚠️ 가져온 학교 수({len(fresh)})가 기존({len(self.catalog)})의 절반 미만 → 삭제(prune) 생략")
+            prune = False
+
+        diff = diff_catalog(self.catalog, fresh)
+        write_json(diff_path, diff.to_dict())
+        logger.info(f"🗂️ 카탈로그 비교 결과 저장: {diff_path}")
+        if not dry_run:
+            # 변경이 없어도 다시 써서 순위 순서를 최신으로 유지
+            write_json(self.universities_json, merge_catalog(self.catalog, fresh, prune=prune))
+            logger.info(f"💾 {self.universities_json} 갱신")
+            self.load_universities()
+        return diff
+
+    def _start_api_capture(self, page_type: str) -> Optional[NetworkCapture]:
+        """Install the capture hook for the JSON endpoints configured for ``page_type``."""
+        capture = self.start_network_capture(list(self.api_captures[page_type].values()))
+        if capture is None:
+            logger.warning("⚠️ API 응답 캡처 훅 설치 실패 - HTML만 저장합니다")
+        return capture
+
+    def _save_api_captures(self, university_name: str, page_type: str, capture: NetworkCapture) -> List[str]:
+        """
+        Save the JSON responses captured during the page load next to the page's HTML.
+        
+        Responses that already arrived are taken from the buffer; missing ones are
+        awaited for at most ``api_capture_wait_seconds`` in total.
+        
+        Returns:
+            Paths of the saved JSON files
+        """
+        university_dir, _ = self.generate_filename_and_path(university_name, page_type)
+        captured = capture.drain()
+        deadline = time.monotonic() + self.api_capture_wait_seconds
+        saved: List[str] = []
+        for filename, pattern in self.api_captures.get(page_type, {}).items():
+            regex = re.compile(pattern)
+            response = next((r for r in captured if r.status == 200 and regex.search(r.url)), None)
+            if response is None:
+                response = capture.wait_for(timeout=max(0.0, deadline - time.monotonic()), status=200, url_pattern=pattern)
+            if response is None:
+                logger.info(f"⏭️ API 응답 캡처 없음: {filename}")
+                continue
+            if response.truncated:
+                logger.warning(f"⚠️ API 응답이 잘려서 저장하지 않음: {filename} ({len(response.body):,}자)")
+                continue
+            try:
+                data = response.json()
+            except ValueError:
+                logger.warning(f"⚠️ API 응답이 JSON이 아님: {filename} ({response.content_type})")
+                continue
+            try:
+                os.makedirs(university_dir, exist_ok=True)
+                path = os.path.join(university_dir, filename)
+                self.file_writer.write_text(path, dump_admissions_json(data))
+            except Exception as e:
+                logger.error(f"❌ API 응답 저장 실패 ({filename}): {e}")
+                continue
+            logger.info(f"📡 API 응답 저장: {filename} ({len(response.body):,}자, {response.elapsed_ms}ms)")
+            saved.append(path)
+        return saved
+
+    def _discard_captures(self, capture: Optional[NetworkCapture]) -> None:
+        """Drop the responses buffered during a rejected load so a later attempt does not save them."""
+        if capture is not None and capture.driver is self.driver:
+            capture.drain()
+        if self.json_record_patterns:
+            self.collect_recorded_json()
+
+    def _store_recorded_json(self, university_name: str, page_type: str) -> int:
+        """Append the JSON responses recorded during this page load to the university's API store."""
+        responses = self.collect_recorded_json()
+        if not responses:
+            return 0
+        try:
+            count = self.api_store.append(self._slugify_name(university_name), page_type, responses)
+        except Exception as e:
+            logger.error(f"❌ API 응답 기록 저장 실패: {e}")
+            return 0
+        total_bytes = sum(len(r.body) for r in responses)
+        logger.info(f"📡 JSON 응답 {count}개 기록 ({total_bytes:,}자) → {self.api_store.filename}")
+        return count
+
+    def _find_widget_cut(self, html_content, page_type: str = "") -> Optional[Tuple[int, str]]:
+        """Return (offset, marker) of the earliest recommendations widget marker for ``page_type`` (str or bytes), or None."""
+        finder = self.widget_finders.get(page_key(page_type), DEFAULT_WIDGET_FINDER)
+        return finder.find(html_content)
+
+    def _find_widget_cut_index(self, html_content, page_type: str = ""):
+        """Return the index (str or bytes offset) to cut HTML before the recommendations widget, or None if not found."""
+        cut = self._find_widget_cut(html_content, page_type)
+        return cut[0] if cut else None
 
     def _check_login_status(self, html_content: str) -> bool:
         """
@@ -669,29 +1357,7 @@ class HTMLDownloader(SeleniumBase):
         Returns:
             True if logged in, False if not logged in
         """
-        # Canonical URL 기준으로 우선 판단
-        canonical_match = CANONICAL_RE.search(html_content)
-        if canonical_match:
-            canonical_url = canonical_match.group(1)
-            if 'premium.usnews.com' in canonical_url:
-                return True  # Premium host = logged in
-            elif 'www.usnews.com' in canonical_url:
-                return False  # www host = not logged in
-        
-        # Sign out/Log out markers
-        sign_out_patterns = [r'\bSign out\b', r'\bLog out\b']
-        for pattern in sign_out_patterns:
-            if re.search(pattern, html_content, re.IGNORECASE):
-                return True
-        
-        # Sign in/Log in markers
-        sign_in_patterns = [r'\bSign in\b', r'\bLog in\b']
-        for pattern in sign_in_patterns:
-            if re.search(pattern, html_content, re.IGNORECASE):
-                return False
-        
-        # Default to not logged in if unclear
-        return False
+        return self.page_checker.check(html_content).is_logged_in
 
     def _restart_chrome_and_relogin(self) -> bool:
         """
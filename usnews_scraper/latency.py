@@ -0,0 +1,177 @@
+"""
+Adaptive Timeouts
+
+Records page-load and HTML-extraction latencies per page type in a rolling
+window persisted across runs (``downloads/latency_stats.json``) and derives
+timeouts from them: ``p99 × factor``, clamped per stage. Page types that are
+always fast fail fast on a hang instead of waiting out a fixed 20-30 s, and
+known-slow page types get the headroom they need. Until a page type has
+enough samples the configured static timeout is used.
+
+A timed-out attempt only says "slower than the timeout", so it is kept in the
+window as a censored entry (``null``) rather than as a latency: percentiles
+are taken over completed attempts, and a high timeout share adds a bounded
+``CENSORED_HEADROOM`` on top of the completed p99. The learned timeout is
+therefore never derived from itself and cannot ratchet up to the clamp.
+
+The same history drives hedged navigation: a page still loading at its type's
+p95 gets a second request, limited by a ``HedgeBudget``.
+"""
+
+import os
+import json
+import math
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from .crawl_state import page_key
+from .storage import TEMP_SUFFIX
+
+logger = logging.getLogger("usnews_scraper.latency")
+
+
+# ===================== Module-level Constants =====================
+# Stages
+STAGE_LOAD = "load"         # driver.get() until the load event (page_load_timeout)
+STAGE_EXTRACT = "extract"   # driver.page_source (content / page-source alarms)
+
+# Samples kept per (page type, stage); the oldest are dropped first
+LATENCY_WINDOW = 200
+
+# Samples needed before a learned timeout replaces the static one
+MIN_SAMPLES = 20
+
+TIMEOUT_PERCENTILE = 0.99
+TIMEOUT_FACTOR = 1.5
+
+# Extra factor when more than CENSORED_SHARE of the window timed out (still relative to the completed p99)
+CENSORED_SHARE = 0.05
+CENSORED_HEADROOM = 1.5
+
+# Hedged navigation: second request at this load percentile, hedges capped at a fraction of navigations
+HEDGE_PERCENTILE = 0.95
+DEFAULT_HEDGE_BUDGET = 0.05
+
+# (min, max) seconds a learned timeout is clamped to
+TIMEOUT_BOUNDS: Dict[str, Tuple[int, int]] = {
+    STAGE_LOAD: (8, 60),
+    STAGE_EXTRACT: (5, 45),
+}
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..1) of a non-empty sample list."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class LatencyTracker:
+    """JSON-backed store: { page_key: { stage: [seconds | null, ...] } } (null = timed out) plus the derived timeouts."""
+
+    def __init__(self, path: str, window: int = LATENCY_WINDOW, min_samples: int = MIN_SAMPLES,
+                 factor: float = TIMEOUT_FACTOR, bounds: Optional[Dict[str, Tuple[int, int]]] = None):
+        self.path = path
+        self.window = window
+        self.min_samples = min_samples
+        self.factor = factor
+        self.bounds = dict(TIMEOUT_BOUNDS)
+        self.bounds.update(bounds or {})
+        self.samples: Dict[str, Dict[str, List[Optional[float]]]] = {}
+        self._dirty = False
+        self.load()
+
+    def load(self) -> None:
+        """Load samples from disk (missing or corrupt file = no history)."""
+        if not os.path.exists(self.path):
+            self.samples = {}
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.samples = data.get("samples", {}) if isinstance(data, dict) else {}
+        except Exception as e:
+            logger.warning(f"⚠️ 지연 시간 기록 읽기 실패 (기록 없이 시작): {e}")
+            self.samples = {}
+
+    def save(self) -> None:
+        """Write samples and the current learned timeouts if anything was recorded."""
+        if not self._dirty:
+            return
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            data = {"updated_at": datetime.now().isoformat(), "timeouts": self.learned_timeouts(),
+                    "samples": self.samples}
+            tmp_path = f"{self.path}{TEMP_SUFFIX}"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"⚠️ 지연 시간 기록 저장 실패: {e}")
+
+    def record(self, page_type: str, stage: str, seconds: float, timed_out: bool = False) -> None:
+        """Add one latency sample; a timed-out attempt is kept as a censored entry, not as a latency."""
+        window = self.samples.setdefault(page_key(page_type), {}).setdefault(stage, [])
+        window.append(None if timed_out else round(max(0.0, seconds), 3))
+        if len(window) > self.window:
+            del window[:len(window) - self.window]
+        self._dirty = True
+
+    def completed(self, page_type: str, stage: str) -> List[float]:
+        """Latencies of the attempts in the window that finished (timed-out entries excluded)."""
+        return [s for s in self.samples.get(page_key(page_type), {}).get(stage, []) if s is not None]
+
+    def timed_out_share(self, page_type: str, stage: str) -> float:
+        """Fraction of the window that timed out (0.0 without history)."""
+        window = self.samples.get(page_key(page_type), {}).get(stage, [])
+        return sum(1 for s in window if s is None) / len(window) if window else 0.0
+
+    def percentile(self, page_type: str, stage: str, q: float) -> Optional[float]:
+        """Latency percentile of completed attempts for a page type, or None below min_samples."""
+        window = self.completed(page_type, stage)
+        if len(window) < self.min_samples:
+            return None
+        return percentile(window, q)
+
+    def timeout_for(self, page_type: str, stage: str, default: int) -> int:
+        """Learned timeout (completed p99 × factor, clamped) for a page type, or ``default`` without enough history."""
+        p99 = self.percentile(page_type, stage, TIMEOUT_PERCENTILE)
+        if p99 is None:
+            return int(default)
+        timeout = p99 * self.factor
+        if self.timed_out_share(page_type, stage) > CENSORED_SHARE:
+            timeout *= CENSORED_HEADROOM
+        low, high = self.bounds.get(stage, (1, max(1, int(default))))
+        return int(min(high, max(low, math.ceil(timeout))))
+
+    def learned_timeouts(self) -> Dict[str, Dict[str, int]]:
+        """{ page_key: { stage: seconds } } for every page type with enough samples."""
+        result: Dict[str, Dict[str, int]] = {}
+        for key, stages in self.samples.items():
+            for stage in stages:
+                if self.percentile(key, stage, TIMEOUT_PERCENTILE) is not None:
+                    result.setdefault(key, {})[stage] = self.timeout_for(key, stage, 0)
+        return result
+
+
+class HedgeBudget:
+    """Caps hedged (duplicate) navigations at ``fraction`` of all navigations in a run, plus ``burst``."""
+
+    def __init__(self, fraction: float = DEFAULT_HEDGE_BUDGET, burst: int = 1):
+        self.fraction = max(0.0, fraction)
+        self.burst = burst
+        self.navigations = 0
+        self.hedges = 0
+
+    def allow(self) -> bool:
+        """True if one more hedge stays within the budget."""
+        return self.hedges < self.fraction * self.navigations + self.burst
+
+    def record_navigation(self, hedged: bool = False) -> None:
+        self.navigations += 1
+        if hedged:
+            self.hedges += 1
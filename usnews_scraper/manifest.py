@@ -0,0 +1,196 @@
+"""
+Corpus Manifest
+
+Append-only JSONL manifest of every saved page, maintained at write time by
+HTMLDownloader. Each line records university, page type, path, size, raw and
+semantic hashes, login state and timestamps (``saved_at``: content last
+changed, ``fetched_at``: page last confirmed, including unchanged re-fetches);
+pages that stop existing get a tombstone line. The latest line per
+(university, page_type) wins. Status questions ("which universities are
+missing campus-info", "how big is the corpus", "what changed since
+yesterday") are answered from the in-memory index instead of a directory walk.
+"""
+
+import os
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .crawl_state import page_key
+from .storage import TEMP_SUFFIX
+
+logger = logging.getLogger("usnews_scraper.manifest")
+
+
+class CorpusManifest:
+    """JSONL-backed index keyed by (university_slug, page_key)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.by_page_type: Dict[str, Set[str]] = {}
+        self._line_count = 0
+        self.load()
+
+    # ========== 로드/저장 ==========
+    def load(self) -> None:
+        """Load the manifest, keeping the latest record per page."""
+        self.entries = {}
+        self.by_page_type = {}
+        self._line_count = 0
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 중단된 쓰기로 잘린 마지막 줄은 무시
+                    continue
+                self._line_count += 1
+                self._index(record)
+
+    def _index(self, record: Dict[str, Any]) -> None:
+        key = (record.get("university", ""), record.get("page_type", ""))
+        if record.get("deleted"):
+            self.entries.pop(key, None)
+            self.by_page_type.get(key[1], set()).discard(key[0])
+            return
+        self.entries[key] = record
+        self.by_page_type.setdefault(key[1], set()).add(key[0])
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._line_count += 1
+        self._index(record)
+
+    def record(self, university: str, page_type: str, path: str, size: int,
+               raw_hash: Optional[str], semantic_hash: Optional[str],
+               logged_in: Optional[bool], saved_at: Optional[str] = None) -> Dict[str, Any]:
+        """Append a record for a page that was just written."""
+        saved_at = saved_at or datetime.now().isoformat()
+        record = {
+            "university": university,
+            "page_type": page_key(page_type),
+            "path": path,
+            "size": size,
+            "raw_hash": raw_hash,
+            "semantic_hash": semantic_hash,
+            "logged_in": logged_in,
+            "saved_at": saved_at,
+            "fetched_at": saved_at,
+        }
+        self._append(record)
+        return record
+
+    def touch(self, university: str, page_type: str, logged_in: Optional[bool] = None,
+              fetched_at: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Record a fetch that left the file unchanged: new ``fetched_at`` and,
+        if known, the login state (``saved_at`` keeps the last content change).
+
+        Returns:
+            The updated record, or None if the page is not in the manifest
+        """
+        current = self.entries.get((university, page_key(page_type)))
+        if current is None:
+            return None
+        record = dict(current)
+        record["fetched_at"] = fetched_at or datetime.now().isoformat()
+        if logged_in is not None:
+            record["logged_in"] = logged_in
+        self._append(record)
+        return record
+
+    def remove(self, university: str, page_type: str) -> None:
+        """Append a tombstone for a page that no longer exists."""
+        if (university, page_key(page_type)) in self.entries:
+            self._append({
+                "university": university,
+                "page_type": page_key(page_type),
+                "deleted": True,
+                "saved_at": datetime.now().isoformat(),
+            })
+
+    def compact(self) -> None:
+        """Rewrite the manifest with one line per live page."""
+        tmp_path = f"{self.path}{TEMP_SUFFIX}"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in self.entries.values():
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+        self._line_count = len(self.entries)
+
+    def maybe_compact(self) -> None:
+        """Compact when superseded lines outnumber live ones."""
+        if self._line_count > 2 * max(1, len(self.entries)):
+            self.compact()
+
+    def rebuild(self, downloads_dir: str) -> int:
+        """One-time directory walk to seed the manifest from an existing corpus (hashes/login unknown)."""
+        self.entries = {}
+        self.by_page_type = {}
+        if os.path.isdir(downloads_dir):
+            for uni_entry in os.scandir(downloads_dir):
+                if not uni_entry.is_dir():
+                    continue
+                for file_entry in os.scandir(uni_entry.path):
+                    if not file_entry.name.endswith('.html'):
+                        continue
+                    stem = file_entry.name[:-len('.html')]
+                    stat = file_entry.stat()
+                    self._index({
+                        "university": uni_entry.name,
+                        "page_type": stem.replace('_', '-'),
+                        "path": file_entry.path,
+                        "size": stat.st_size,
+                        "raw_hash": None,
+                        "semantic_hash": None,
+                        "logged_in": None,
+                        "saved_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                    })
+        self.compact()
+        return len(self.entries)
+
+    # ========== 조회 ==========
+    def get(self, university: str, page_type: str) -> Optional[Dict[str, Any]]:
+        return self.entries.get((university, page_key(page_type)))
+
+    def universities(self) -> Set[str]:
+        return {university for university, _ in self.entries}
+
+    def missing(self, page_type: str, universities: Iterable[str]) -> List[str]:
+        """Universities (slugs) from ``universities`` that have no saved ``page_type`` page."""
+        present = self.by_page_type.get(page_key(page_type), set())
+        return [u for u in universities if u not in present]
+
+    def total_size(self) -> int:
+        return sum(int(r.get("size") or 0) for r in self.entries.values())
+
+    def changed_since(self, since: datetime) -> List[Dict[str, Any]]:
+        """Records saved (i.e. content changed) at or after ``since``."""
+        threshold = since.isoformat()
+        return sorted(
+            (r for r in self.entries.values() if (r.get("saved_at") or "") >= threshold),
+            key=lambda r: r.get("saved_at") or "",
+        )
+
+    def not_logged_in(self) -> List[Dict[str, Any]]:
+        return [r for r in self.entries.values() if r.get("logged_in") is False]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "universities": len(self.universities()),
+            "pages": len(self.entries),
+            "total_bytes": self.total_size(),
+            "pages_by_type": {ptype: len(unis) for ptype, unis in sorted(self.by_page_type.items())},
+            "not_logged_in": len(self.not_logged_in()),
+        }
@@ -0,0 +1,346 @@
+"""
+Page Marker Matching
+
+Shared, precompiled matcher for the sign-in / sign-out / error / upsell /
+widget markers used by both the downloader (login check) and the offline
+validator (scripts/check_html_status.py).
+
+Instead of running every pattern with ``re.search(..., re.IGNORECASE)`` over
+the whole document, the matcher lowercases the document once and jumps
+between occurrences of each distinct literal anchor with ``str.find``; the
+full regexes sharing that anchor are only evaluated at those candidate
+offsets. One ``scan()`` reports the category, pattern and offset of every
+marker found, optionally restricted to the regions where markers can appear.
+
+This is one ``find`` sweep per distinct anchor rather than a single combined
+automaton on purpose: in CPython a combined alternation regex over the
+anchors (or a pure-Python Aho-Corasick loop) runs per character in the
+interpreter / backtracking engine and measured well over an order of
+magnitude slower than the memchr-backed ``find`` sweeps on 600 KiB pages
+(``scripts/bench_marker_matcher.py`` prints both).
+
+``WidgetCutFinder`` locates the earliest recommendations-widget marker (the
+point where saved pages are cut) without re-scanning the page once per marker.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence, Tuple
+
+
+# ===================== Module-level Constants =====================
+# 로그인/프리미엄 판별 관련 텍스트
+SIGN_IN_MARKERS = [r'\bSign in\b', r'\bLog in\b', r'로그인']
+SIGN_OUT_MARKERS = [r'\bSign out\b', r'\bLog out\b', r'로그아웃']
+ACCOUNT_MARKERS = [r'My Account', r'Profile', r'Settings']
+
+# 비로그인/업셀/락 표시 (비로그인 힌트)
+UPSELL_OR_LOCK_PATTERNS = [
+    r'\bTry it now\b',
+    r'compass.*unlock',
+    r'premium.*unlock',
+    r'College Compass',
+]
+
+# 에러/차단/빈 페이지 판별(일반적인 텍스트 + USNews 일부 패턴)
+ERROR_PATTERNS = [
+    r'404 Not Found',
+    r'403 Forbidden',
+    r'401 Unauthorized',
+    r'We hit a snag',
+    r'An error occurred',
+    r'Access Denied',
+    r'akamai error',
+    r'cf-error',
+    r'Captcha|captcha',
+]
+
+# 추천 위젯 시작 마커 (이 지점 앞에서 HTML을 자름)
+WIDGET_MARKERS = [
+    '<div id="blueshift-recommendations-widget"',
+    'id="blueshift-recommendations-widget"',
+    'blueshift-recommendations-widget',
+    '<div id="null-recommendations-widget"',
+    'id="null-recommendations-widget"',
+    'null-recommendations-widget',
+    'SailthruRecommend__Container',
+]
+
+# Marker appended to pages cut before the recommendations widget
+TRUNCATION_SUFFIX = b"\n<!-- Truncated before recommendations widget -->\n"
+
+DEFAULT_MARKER_CATEGORIES: Dict[str, List[str]] = {
+    "sign_in": SIGN_IN_MARKERS,
+    "sign_out": SIGN_OUT_MARKERS,
+    "account": ACCOUNT_MARKERS,
+    "upsell": UPSELL_OR_LOCK_PATTERNS,
+    "error": ERROR_PATTERNS,
+    "widget": [re.escape(m) for m in WIDGET_MARKERS],
+}
+
+_REGEX_META = set('.^$*+?{}[]|()\\')
+
+
+@dataclass(frozen=True)
+class MarkerHit:
+    category: str
+    pattern: str
+    offset: int
+
+
+@dataclass
+class MarkerScan:
+    """Result of one scan: the first hit of every pattern that occurs in the scanned regions."""
+    hits: List[MarkerHit] = field(default_factory=list)
+    # category -> patterns in declaration order (for list-order semantics)
+    order: Dict[str, List[str]] = field(default_factory=dict)
+
+    def has(self, category: str) -> bool:
+        return any(hit.category == category for hit in self.hits)
+
+    def first(self, category: str) -> Optional[str]:
+        """The first pattern *in declaration order* that matched (same answer as a sequential any-match loop)."""
+        matched = {hit.pattern for hit in self.hits if hit.category == category}
+        for pattern in self.order.get(category, []):
+            if pattern in matched:
+                return pattern
+        return None
+
+    def earliest(self, category: str) -> Optional[MarkerHit]:
+        """The hit with the lowest offset in ``category``."""
+        candidates = [hit for hit in self.hits if hit.category == category]
+        return min(candidates, key=lambda h: h.offset) if candidates else None
+
+
+def _split_top_level_alternation(pattern: str) -> List[str]:
+    """'a|b' -> ['a', 'b'] (only splits on '|' outside groups/classes)."""
+    parts, depth, in_class, escaped, start = [], 0, False, False, 0
+    for i, ch in enumerate(pattern):
+        if escaped:
+            escaped = False
+            continue
+        if ch == '\\':
+            escaped = True
+        elif in_class:
+            if ch == ']':
+                in_class = False
+        elif ch == '[':
+            in_class = True
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == '|' and depth == 0:
+            parts.append(pattern[start:i])
+            start = i + 1
+    parts.append(pattern[start:])
+    return parts
+
+
+def _literal_anchor(pattern: str) -> str:
+    """Leading literal text of ``pattern`` (after a leading \\b), unescaped and lowercased."""
+    if pattern.startswith(r'\b'):
+        pattern = pattern[2:]
+    literal, i = [], 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == '\\' and i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+            literal.append(pattern[i + 1])
+            i += 2
+            continue
+        if ch in _REGEX_META:
+            # 수량자가 붙은 마지막 글자는 필수가 아니므로 제외
+            if ch in '*?{' and literal:
+                literal.pop()
+            break
+        literal.append(ch)
+        i += 1
+    return ''.join(literal).lower()
+
+
+def _gap_literals(pattern: str) -> Optional[Tuple[str, str]]:
+    """'compass.*unlock' -> ('compass', 'unlock'); None if the pattern is not of that shape."""
+    head, sep, tail = pattern.partition('.*')
+    if not sep or not head or not tail:
+        return None
+    if any(ch in _REGEX_META for ch in head + tail):
+        return None
+    return head.lower(), tail.lower()
+
+
+class MarkerMatcher:
+    """Precompiled multi-pattern matcher over named categories."""
+
+    def __init__(self, categories: Optional[Dict[str, Sequence[str]]] = None, flags: int = re.IGNORECASE):
+        self.categories: Dict[str, List[str]] = {
+            name: list(patterns) for name, patterns in (categories or DEFAULT_MARKER_CATEGORIES).items()
+        }
+        # (category, original pattern, anchor literal or "", "A.*B" literals or None, compiled alternative)
+        self._entries: List[Tuple[str, str, str, Optional[Tuple[str, str]], Pattern[str]]] = []
+        for category, patterns in self.categories.items():
+            for pattern in patterns:
+                for alternative in _split_top_level_alternation(pattern):
+                    gap = _gap_literals(alternative) if flags & re.IGNORECASE and not flags & re.DOTALL else None
+                    self._entries.append((category, pattern, _literal_anchor(alternative), gap, re.compile(alternative, flags)))
+        # 같은 앵커를 쓰는 패턴은 한 번의 find 순회로 함께 검사 (앵커 -> 엔트리 목록, 선언 순서 유지)
+        self._anchor_groups: Dict[str, List[Tuple[str, str, Pattern[str]]]] = {}
+        for category, pattern, anchor, gap, compiled in self._entries:
+            if anchor and gap is None:
+                self._anchor_groups.setdefault(anchor, []).append((category, pattern, compiled))
+
+    def scan(self, text: str, categories: Optional[Iterable[str]] = None,
+             regions: Optional[Sequence[Tuple[int, int]]] = None) -> MarkerScan:
+        """
+        Find the first occurrence of every marker (one ``find`` sweep per distinct anchor).
+
+        Args:
+            text: Document to scan
+            categories: Restrict to these categories (default: all)
+            regions: (start, end) offsets to search; default is the whole document
+
+        Returns:
+            MarkerScan with one MarkerHit per matched pattern
+        """
+        wanted = set(categories) if categories is not None else None
+        spans = list(regions) if regions else [(0, len(text))]
+        lowered = text.lower()
+        # lower()가 길이를 바꾸는 드문 문자가 있으면 오프셋이 어긋나므로 원문 기준으로 검사
+        haystack = lowered if len(lowered) == len(text) else None
+
+        result = MarkerScan(order={c: p for c, p in self.categories.items() if wanted is None or c in wanted})
+        # (category, pattern) -> earliest offset (한 패턴의 여러 대안 중 가장 앞선 위치)
+        offsets: Dict[Tuple[str, str], int] = {}
+
+        def _hit(category: str, pattern: str, offset: int) -> None:
+            key = (category, pattern)
+            if key not in offsets or offset < offsets[key]:
+                offsets[key] = offset
+
+        if haystack is not None:
+            for anchor, group in self._anchor_groups.items():
+                group = [g for g in group if wanted is None or g[0] in wanted]
+                if group:
+                    for category, pattern, offset in self._first_offsets(text, haystack, anchor, group, spans):
+                        _hit(category, pattern, offset)
+        for category, pattern, anchor, gap, compiled in self._entries:
+            if wanted is not None and category not in wanted:
+                continue
+            if gap is not None and haystack is not None:
+                offset = self._first_gap_offset(haystack, gap, spans)
+            elif anchor and haystack is not None:
+                continue  # 앵커 그룹에서 처리됨
+            else:
+                offset = self._first_search(text, compiled, spans)
+            if offset is not None:
+                _hit(category, pattern, offset)
+        result.hits = sorted((MarkerHit(c, p, off) for (c, p), off in offsets.items()), key=lambda h: h.offset)
+        return result
+
+    @staticmethod
+    def _first_offsets(text: str, lowered: str, anchor: str, group: List[Tuple[str, str, Pattern[str]]],
+                       spans: Sequence[Tuple[int, int]]) -> List[Tuple[str, str, int]]:
+        """First offset of every regex sharing ``anchor``, from one sweep over the anchor's occurrences."""
+        pending = list(group)
+        hits: List[Tuple[str, str, int]] = []
+        for start, end in spans:
+            pos = lowered.find(anchor, start, end)
+            while pos != -1 and pending:
+                still = []
+                for category, pattern, compiled in pending:
+                    if compiled.match(text, pos, end):
+                        hits.append((category, pattern, pos))
+                    else:
+                        still.append((category, pattern, compiled))
+                pending = still
+                pos = lowered.find(anchor, pos + 1, end)
+        return hits
+
+    @staticmethod
+    def _first_search(text: str, compiled: Pattern[str], spans: Sequence[Tuple[int, int]]) -> Optional[int]:
+        for start, end in spans:
+            m = compiled.search(text, start, end)
+            if m:
+                return m.start()
+        return None
+
+    @staticmethod
+    def _first_gap_offset(lowered: str, gap: Tuple[str, str], spans: Sequence[Tuple[int, int]]) -> Optional[int]:
+        """First match of 'A.*B' (same line) without re-scanning each line once per A occurrence."""
+        head, tail = gap
+        for start, end in spans:
+            pos = lowered.find(head, start, end)
+            while pos != -1:
+                tail_pos = lowered.find(tail, pos + len(head), end)
+                if tail_pos == -1:
+                    break
+                newline = lowered.find('\n', pos + len(head), tail_pos)
+                if newline == -1:
+                    return pos
+                # 이 줄의 나머지 A는 같은 B를 찾으므로 다음 줄부터 다시 검색
+                pos = lowered.find(head, newline + 1, end)
+        return None
+
+
+class WidgetCutFinder:
+    """
+    Finds the earliest widget marker in one forward sweep.
+
+    Markers that contain another marker (e.g. '<div id="x-widget"' contains
+    'x-widget') are not searched separately: only the "core" markers are
+    located with ``find``, and the longer markers are checked in place around
+    each core hit. Once a hit is known, later searches stop at that offset.
+    """
+
+    def __init__(self, markers: Sequence[str]):
+        self.markers: List[str] = list(dict.fromkeys(markers))
+        # 다른 마커를 포함하지 않는 최소 마커(core)만 실제로 검색
+        cores = [m for m in self.markers if not any(o != m and o in m for o in self.markers)]
+        # core -> [(marker, offset of core inside marker)], 긴 마커 우선
+        self._expansions: Dict[str, List[Tuple[str, int]]] = {core: [] for core in cores}
+        for marker in sorted(self.markers, key=len, reverse=True):
+            for core in cores:
+                offset = marker.find(core)
+                if offset != -1:
+                    self._expansions[core].append((marker, offset))
+                    break
+        self._max_offset = max((off for exp in self._expansions.values() for _, off in exp), default=0)
+        self._encoded = {
+            core.encode('utf-8'): [(m.encode('utf-8'), off) for m, off in exp]
+            for core, exp in self._expansions.items()
+        }
+
+    def find(self, content, end: Optional[int] = None) -> Optional[Tuple[int, str]]:
+        """
+        Args:
+            content: str or bytes page content
+            end: Only consider markers that end at or before this offset (default: whole content)
+
+        Returns:
+            (cut index, matched marker) for the earliest marker, or None
+        """
+        is_text = isinstance(content, str)
+        expansions = self._expansions if is_text else self._encoded
+        best: Optional[Tuple[int, object]] = None
+        length = len(content) if end is None else min(end, len(content))
+        for core, candidates in expansions.items():
+            # 이미 찾은 위치보다 앞에서 시작할 수 없는 구간은 검색하지 않음
+            limit = length if best is None else min(length, best[0] + self._max_offset + len(core))
+            pos = content.find(core, 0, limit)
+            first = pos
+            while pos != -1 and pos <= first + self._max_offset:
+                for marker, offset in candidates:
+                    start = pos - offset
+                    if start >= 0 and content.startswith(marker, start, length):
+                        if best is None or start < best[0] or (start == best[0] and len(marker) > len(best[1])):
+                            best = (start, marker)
+                        break
+                pos = content.find(core, pos + 1, limit)
+        if best is None:
+            return None
+        marker = best[1] if is_text else best[1].decode('utf-8')
+        return best[0], marker
+
+
+# 기본 카테고리로 미리 컴파일된 공유 인스턴스
+DEFAULT_MATCHER = MarkerMatcher()
+DEFAULT_WIDGET_FINDER = WidgetCutFinder(WIDGET_MARKERS)
@@ -0,0 +1,137 @@
+"""
+Negative Result Cache
+
+Remembers pages that failed in a way retrying right away will not fix (the
+subpage redirects to the main profile, 404/410, Akamai CDN "Reference #"
+errors), keyed by university slug and page type, with a per-failure-class
+TTL. The scheduler skips cached pages until the entry expires, so repeated
+full crawls do not pay a navigation, redirect check and retries per
+known-absent page. A successful save clears the entry.
+"""
+
+import os
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from .crawl_state import page_key
+from .storage import TEMP_SUFFIX
+
+logger = logging.getLogger("usnews_scraper.negative_cache")
+
+
+# ===================== Module-level Constants =====================
+# Failure classes
+NEG_REDIRECT = "redirect_to_main"   # subpage resolves to the main profile (page does not exist)
+NEG_NOT_FOUND = "not_found"         # 404 / 410
+NEG_CDN_ERROR = "cdn_error"         # Akamai edge error page ("Reference #", errors.edgesuite.net)
+
+# Hours until a cached failure is probed again
+DEFAULT_NEGATIVE_TTL_HOURS: Dict[str, float] = {
+    NEG_REDIRECT: 30 * 24,
+    NEG_NOT_FOUND: 14 * 24,
+    NEG_CDN_ERROR: 24,
+}
+
+
+class NegativeCache:
+    """JSON-backed store: { "<slug>/<page_key>": {"class", "detail", "recorded_at", "expires_at", "count"} }"""
+
+    def __init__(self, path: str, ttl_hours: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            path: Cache file (e.g. downloads/negative_cache.json)
+            ttl_hours: Per-class TTL overrides merged over DEFAULT_NEGATIVE_TTL_HOURS
+        """
+        self.path = path
+        self.ttl_hours = dict(DEFAULT_NEGATIVE_TTL_HOURS)
+        self.ttl_hours.update(ttl_hours or {})
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self.load()
+
+    @staticmethod
+    def _key(university: str, page_type: str) -> str:
+        return f"{university}/{page_key(page_type)}"
+
+    def load(self) -> None:
+        """Load the cache from disk (missing or corrupt file = empty cache)."""
+        if not os.path.exists(self.path):
+            self.entries = {}
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.entries = data.get("entries", {}) if isinstance(data, dict) else {}
+        except Exception as e:
+            logger.warning(f"⚠️ 네거티브 캐시 읽기 실패 (빈 캐시로 시작): {e}")
+            self.entries = {}
+
+    def save(self) -> None:
+        """Write the cache to disk if anything changed since the last save."""
+        if not self._dirty:
+            return
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}{TEMP_SUFFIX}"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"entries": self.entries}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"⚠️ 네거티브 캐시 저장 실패: {e}")
+
+    def record(self, university: str, page_type: str, failure_class: str, detail: str = "") -> Dict[str, Any]:
+        """Cache a failure; the entry expires after the class TTL."""
+        now = datetime.now()
+        key = self._key(university, page_type)
+        previous = self.entries.get(key) or {}
+        entry = {
+            "class": failure_class,
+            "detail": detail,
+            "recorded_at": now.isoformat(),
+            "expires_at": (now + timedelta(hours=self.ttl_hours.get(failure_class, 24))).isoformat(),
+            "count": int(previous.get("count", 0)) + 1,
+        }
+        self.entries[key] = entry
+        self._dirty = True
+        return entry
+
+    def lookup(self, university: str, page_type: str, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """The cached failure for a page, or None if there is none or it expired."""
+        entry = self.entries.get(self._key(university, page_type))
+        if not entry:
+            return None
+        try:
+            expires_at = datetime.fromisoformat(entry["expires_at"])
+        except (KeyError, ValueError):
+            return None
+        return entry if (now or datetime.now()) < expires_at else None
+
+    def clear(self, university: str, page_type: str) -> None:
+        """Forget a page (it was saved successfully)."""
+        if self.entries.pop(self._key(university, page_type), None) is not None:
+            self._dirty = True
+
+    def purge_expired(self) -> int:
+        """Drop expired entries; returns how many were removed."""
+        now = datetime.now()
+        expired = [key for key in self.entries if self.lookup(*key.rsplit('/', 1), now=now) is None]
+        for key in expired:
+            del self.entries[key]
+        if expired:
+            self._dirty = True
+        return len(expired)
+
+    def active(self) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """(university, page_key, entry) for every unexpired entry."""
+        now = datetime.now()
+        result = []
+        for key, entry in self.entries.items():
+            university, key_page = key.rsplit('/', 1)
+            if self.lookup(university, key_page, now=now):
+                result.append((university, key_page, entry))
+        return result
@@ -0,0 +1,134 @@
+"""
+Content Normalization
+
+US News pages embed per-request nonces, ad slot IDs, timestamps and tracking
+tokens, so two fetches of unchanged content never hash the same. This module
+strips those volatile fragments before hashing to produce a "semantic hash"
+that is stable across fetches and can drive dedupe / skip-if-unchanged logic.
+"""
+
+import re
+import hashlib
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple, Pattern, Union
+
+
+@dataclass(frozen=True)
+class VolatileRule:
+    """A single normalization rule: every match of ``pattern`` is replaced by ``replacement``."""
+    name: str
+    pattern: str
+    replacement: str = ""
+    flags: int = re.IGNORECASE
+
+
+# ===================== Module-level Constants =====================
+# Default rules (all rules run in one pass; when matches overlap the leftmost wins, then list order)
+DEFAULT_VOLATILE_RULES: List[VolatileRule] = [
+    # CSP nonces on <script>/<style>
+    VolatileRule("nonce", r'\bnonce="[^"]*"', 'nonce=""'),
+    # CSRF / request tokens in meta tags and hidden inputs
+    VolatileRule(
+        "csrf_token",
+        r'((?:name|id)="(?:csrf[-_]?token|_csrf|authenticity_token)"\s+(?:content|value)=")[^"]*(")',
+        r'\1\2',
+    ),
+    # Google Publisher Tag ad slot IDs (div-gpt-ad-1695812345678-0)
+    VolatileRule("ad_slot", r'\bdiv-gpt-ad-[\w-]+', 'div-gpt-ad'),
+    VolatileRule("ad_slot_attr", r'(data-(?:ad-)?slot(?:-id)?=")[^"]*(")', r'\1\2'),
+    # Correlation / request / trace IDs in inline JSON
+    VolatileRule(
+        "request_id",
+        r'("(?:requestId|request_id|traceId|trace_id|correlationId|sessionId|pageViewId)"\s*:\s*")[^"]*(")',
+        r'\1\2',
+    ),
+    # Epoch timestamps in inline JSON (seconds or milliseconds)
+    VolatileRule(
+        "epoch_timestamp",
+        r'("(?:timestamp|ts|time|serverTime|requestTime|generatedAt|renderedAt)"\s*:\s*)\d{10,13}',
+        r'\g<1>0',
+    ),
+    # ISO-8601 datetimes (render/build times, cache stamps)
+    VolatileRule(
+        "iso_timestamp",
+        r'\b\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?',
+        'TIMESTAMP',
+    ),
+    # Tracking / cache-busting query parameters
+    VolatileRule(
+        "tracking_params",
+        r'([?&](?:utm_[a-z]+|_gl|gclid|fbclid|correlator|cachebuster|cb|_)=)[^&"\'\s<>]*',
+        r'\1',
+    ),
+]
+
+
+class ContentNormalizer:
+    """Applies a list of VolatileRule to HTML and computes raw/semantic hashes."""
+
+    def __init__(self, rules: Optional[List[VolatileRule]] = None):
+        self.rules: List[VolatileRule] = list(rules) if rules is not None else list(DEFAULT_VOLATILE_RULES)
+        # Per-rule patterns (str and UTF-8 bytes) used to expand each rule's replacement
+        self._compiled: List[Tuple[Pattern[str], str]] = [
+            (re.compile(rule.pattern, rule.flags), rule.replacement) for rule in self.rules
+        ]
+        self._compiled_bytes: List[Tuple[Pattern[bytes], bytes]] = [
+            (re.compile(rule.pattern.encode('utf-8'), rule.flags), rule.replacement.encode('utf-8')) for rule in self.rules
+        ]
+        # One alternation over all rules so the document is scanned once
+        combined = "|".join(
+            f"(?P<r{i}>(?{_inline_flags(rule.flags)}:{rule.pattern}))" if _inline_flags(rule.flags)
+            else f"(?P<r{i}>{rule.pattern})"
+            for i, rule in enumerate(self.rules)
+        )
+        self._combined: Optional[Pattern[str]] = re.compile(combined) if self.rules else None
+        self._combined_bytes: Optional[Pattern[bytes]] = re.compile(combined.encode('utf-8')) if self.rules else None
+
+    def _iter_normalized(self, content) -> Iterator:
+        """Yield the normalized content piecewise (unchanged spans are slices, never a full copy)."""
+        is_text = isinstance(content, str)
+        combined = self._combined if is_text else self._combined_bytes
+        compiled = self._compiled if is_text else self._compiled_bytes
+        if not is_text:
+            content = memoryview(content)
+        if combined is None:
+            yield content
+            return
+        last = 0
+        for match in combined.finditer(content):
+            rule_index = int(match.lastgroup[1:])
+            pattern, replacement = compiled[rule_index]
+            # Re-match the (short) hit alone to expand group references in the replacement
+            rule_match = pattern.fullmatch(match.group())
+            if rule_match is None:
+                continue
+            yield content[last:match.start()]
+            yield rule_match.expand(replacement)
+            last = match.end()
+        yield content[last:]
+
+    def normalize(self, html_text: Union[str, bytes, memoryview]) -> Union[str, bytes]:
+        """Return the content with all volatile fragments replaced (str in, str out; bytes-like in, bytes out)."""
+        pieces = self._iter_normalized(html_text)
+        if isinstance(html_text, str):
+            return "".join(pieces)
+        return b"".join(pieces)
+
+    def semantic_hash(self, html_text: Union[str, bytes, memoryview]) -> str:
+        """SHA256 of the normalized content, computed without materializing it."""
+        digest = hashlib.sha256()
+        for piece in self._iter_normalized(html_text):
+            digest.update(piece.encode('utf-8') if isinstance(piece, str) else piece)
+        return digest.hexdigest()
+
+
+def _inline_flags(flags: int) -> str:
+    """Translate re flags to scoped inline flag letters."""
+    letters = ""
+    if flags & re.IGNORECASE:
+        letters += "i"
+    if flags & re.MULTILINE:
+        letters += "m"
+    if flags & re.DOTALL:
+        letters += "s"
+    return letters
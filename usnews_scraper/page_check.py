@@ -0,0 +1,132 @@
+"""
+Page Quality Check
+
+In-process version of the offline validator's per-file check
+(scripts/check_html_status.py): login state from the canonical host or
+sign-in/sign-out markers, error pages, and upsell/lock hints. HTMLDownloader
+runs it on every page before writing it, so logged-out or error pages are
+re-queued instead of being saved as successful downloads.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import urlparse
+
+from .markers import (
+    MarkerMatcher, SIGN_IN_MARKERS, SIGN_OUT_MARKERS, UPSELL_OR_LOCK_PATTERNS, ERROR_PATTERNS,
+)
+
+
+# ===================== Module-level Constants =====================
+CANONICAL_LINK_RE = re.compile(r'<link[^>]+rel=["\']canonical["\'][^>]+href=["\']([^"\']+)', re.IGNORECASE)
+
+# Failure classes reported by PageCheck.problems
+PROBLEM_NOT_LOGGED_IN = "not_logged_in"
+PROBLEM_ERROR_PAGE = "error_page"
+PROBLEM_UPSELL = "upsell"
+DEFAULT_FAILURE_CLASSES = (PROBLEM_NOT_LOGGED_IN, PROBLEM_ERROR_PAGE, PROBLEM_UPSELL)
+
+
+@dataclass
+class PageCheck:
+    is_logged_in: bool
+    is_premium: bool
+    is_error_page: bool
+    canonical: Optional[str] = None
+    error_hit: Optional[str] = None
+    upsell_hit: Optional[str] = None
+    issues: List[str] = field(default_factory=list)
+
+    @property
+    def problems(self) -> List[str]:
+        """Failure classes for this page (empty = OK to save)."""
+        problems = []
+        if not self.is_logged_in:
+            problems.append(PROBLEM_NOT_LOGGED_IN)
+        if self.is_error_page:
+            problems.append(PROBLEM_ERROR_PAGE)
+        # 프리미엄(로그인) 페이지의 "College Compass" 등은 정상 내비게이션이므로 제외
+        if self.upsell_hit and not self.is_premium:
+            problems.append(PROBLEM_UPSELL)
+        return problems
+
+
+def extract_canonical(content: str) -> Optional[str]:
+    m = CANONICAL_LINK_RE.search(content)
+    return m.group(1) if m else None
+
+
+def is_premium_canonical(canonical_url: Optional[str]) -> bool:
+    if not canonical_url:
+        return False
+    try:
+        host = urlparse(canonical_url).hostname or ''
+    except Exception:
+        return False
+    return host.startswith('premium.usnews.com')
+
+
+class PageChecker:
+    """Login / error / upsell classification of a single page."""
+
+    def __init__(self, categories: Optional[Dict[str, Sequence[str]]] = None):
+        """
+        Args:
+            categories: Marker lists keyed by 'sign_out', 'sign_in', 'error', 'upsell' (default: markers module lists)
+        """
+        self.matcher = MarkerMatcher(categories or {
+            'sign_out': SIGN_OUT_MARKERS,
+            'sign_in': SIGN_IN_MARKERS,
+            'error': ERROR_PATTERNS,
+            'upsell': UPSELL_OR_LOCK_PATTERNS,
+        })
+
+    def check(self, content: str) -> PageCheck:
+        issues: List[str] = []
+        markers = self.matcher.scan(content)
+
+        # canonical 검사로 premium 여부 우선 판정
+        canonical = extract_canonical(content)
+        is_premium = is_premium_canonical(canonical)
+        if canonical:
+            issues.append(f'canonical:{canonical}')
+        if is_premium:
+            issues.append('premium_by_canonical')
+
+        # 로그인 여부: canonical URL 기준으로 우선 판단
+        if is_premium:
+            is_logged_in = True
+            issues.append('login_hit:premium_host')
+        elif canonical and 'www.usnews.com' in canonical:
+            is_logged_in = False
+            issues.append('not_logged_in:www_host')
+        elif markers.first('sign_out'):
+            is_logged_in = True
+            issues.append('login_hit:signout')
+        elif markers.first('sign_in'):
+            is_logged_in = False
+            issues.append('login_hint:signin_present')
+        else:
+            is_logged_in = False
+            issues.append('not_logged_in:no_canonical_or_unknown_host')
+
+        # 에러페이지 판단
+        error_hit = markers.first('error')
+        if error_hit:
+            issues.append(f'error_hit:{error_hit}')
+
+        # 업셀/락 힌트
+        upsell_hit = markers.first('upsell')
+        if upsell_hit:
+            issues.append(f'upsell:{upsell_hit}')
+
+        return PageCheck(
+            is_logged_in=is_logged_in,
+            is_premium=is_premium,
+            is_error_page=bool(error_hit),
+            canonical=canonical,
+            error_hit=error_hit,
+            upsell_hit=upsell_hit,
+            issues=issues,
+        )
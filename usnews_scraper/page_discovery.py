@@ -0,0 +1,46 @@
+"""
+Subpage Discovery
+
+Finds which profile subpages (applying, paying, campus-info, ...) a school
+actually has by reading the section links of its already-downloaded main page,
+so the crawler does not navigate to pages that only redirect back to the main
+profile.
+"""
+
+import re
+import logging
+from typing import Iterable, List, Optional
+
+from .catalog import normalize_link
+
+logger = logging.getLogger("usnews_scraper.page_discovery")
+
+
+def discover_page_types(html_text: str, university_link: str, page_types: Iterable[str]) -> Optional[List[str]]:
+    """
+    Page types linked from a university's main page.
+
+    Matches ``href`` values of the form ``[https://host]<university_link>/<page_type>``
+    (www and premium hosts, optional query/fragment).
+
+    Args:
+        html_text: Main page HTML
+        university_link: Catalog link, e.g. /best-colleges/princeton-university-2627
+        page_types: Candidate page types in crawl order ("" = main)
+
+    Returns:
+        The linked page types in ``page_types`` order (main always included),
+        or None if the page links to none of the candidate subpages
+        (navigation missing, partly rendered or markup changed), in which case
+        callers should try every page type
+    """
+    link = normalize_link(university_link)
+    if not link or not html_text:
+        return None
+    pattern = re.compile(
+        r'href=["\'](?:https?://[^/"\']+)?' + re.escape(link) + r'/([A-Za-z0-9-]+)/?(?:[?#][^"\']*)?["\']'
+    )
+    linked = {match.group(1).lower() for match in pattern.finditer(html_text)}
+    if not any(p in linked for p in page_types if p != ""):
+        return None
+    return [p for p in page_types if p == "" or p in linked]
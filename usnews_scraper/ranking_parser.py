@@ -0,0 +1,98 @@
+"""
+Ranking Page Parser
+
+Streaming extractor for US News ranking listings (saved ``data/ranking.html``
+or pages fetched live). Fixed-size chunks are scanned for ``<div>``/``<a>``
+start tags only, and each ranking card ``<div ... name="...">`` is paired with
+the first ``/best-colleges/...`` link that follows it, in one pass with memory
+bounded by the chunk size. This replaces a whole-file ``re.findall`` whose
+``.*?`` DOTALL span needs the full document in memory and pairs a card
+without a link with the next card's link.
+"""
+
+import re
+import html
+import logging
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional
+
+from .catalog import school_id_from_link
+
+logger = logging.getLogger("usnews_scraper.ranking_parser")
+
+
+# ===================== Module-level Constants =====================
+UNIVERSITY_LINK_PREFIX = "/best-colleges/"
+
+READ_CHUNK_SIZE = 64 * 1024
+
+# A partial tag longer than this at a chunk boundary is treated as garbage
+MAX_CARRY = 64 * 1024
+
+# Only ranking cards and profile links match; every other tag is skipped inside the regex engine.
+# Case-sensitive on purpose: saved pages are DOM serializations (lowercase tags and attributes),
+# and IGNORECASE roughly doubles the scan time.
+_TAG_RE = re.compile(
+    r'<(?:div\b[^>]*?\sname\s*=\s*"([^"]+)"|a\b[^>]*?\shref\s*=\s*"(' + re.escape(UNIVERSITY_LINK_PREFIX) + r'[^"]*)")'
+)
+
+
+@dataclass
+class RankingEntry:
+    name: str
+    link: str
+    school_id: str
+
+
+def iter_ranking_entries(chunks: Iterable[str]) -> Iterator[RankingEntry]:
+    """
+    Yield ranking entries from HTML text chunks, in page order.
+
+    Only card ``<div name=...>`` and profile ``<a href=...>`` tags are matched; a tag split
+    across chunks is carried over to the next one. A card without a profile
+    link is dropped when the next card starts (never paired with its link).
+    Links are stripped of their query string; names are HTML-unescaped.
+    Duplicates are not removed here (see parse_ranking_file).
+    """
+    pending_name: Optional[str] = None
+    carry = ""
+    for chunk in chunks:
+        buf = carry + chunk
+        # 마지막 '<' 이후에 '>'가 없으면 태그가 청크 경계에서 잘린 것 → 다음 청크로 넘김
+        cut = buf.rfind('<')
+        if cut != -1 and buf.find('>', cut) == -1:
+            carry, buf = buf[cut:], buf[:cut]
+            if len(carry) > MAX_CARRY:
+                carry = ""
+        else:
+            carry = ""
+        for name, href in _TAG_RE.findall(buf):
+            if name:
+                pending_name = html.unescape(name)
+            elif pending_name is not None:
+                href = html.unescape(href)
+                yield RankingEntry(name=pending_name, link=href.split('?')[0],
+                                   school_id=school_id_from_link(href))
+                pending_name = None
+
+
+def read_chunks(path: str, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[str]:
+    """Decode a file incrementally (UTF-8, invalid bytes ignored)."""
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def parse_ranking_file(path: str, chunk_size: int = READ_CHUNK_SIZE) -> List[RankingEntry]:
+    """All entries of a saved ranking page, first occurrence per name kept."""
+    seen = set()
+    entries: List[RankingEntry] = []
+    for entry in iter_ranking_entries(read_chunks(path, chunk_size)):
+        if entry.name in seen:
+            continue
+        seen.add(entry.name)
+        entries.append(entry)
+    return entries
@@ -0,0 +1,65 @@
+"""
+Rate Limiting
+
+Thread-safe token-bucket limiter shared by everything that talks to US News
+outside of the page-by-page crawl (direct API calls, parallel tabs), so the
+combined request rate stays bounded no matter how many workers are running.
+"""
+
+import time
+import threading
+import logging
+
+logger = logging.getLogger("usnews_scraper.rate_limit")
+
+
+class RateLimiter:
+    """Token bucket: ``rate`` requests per second on average, bursts up to ``burst``."""
+
+    def __init__(self, rate: float = 2.0, burst: int = 1):
+        """
+        Args:
+            rate: Sustained requests per second (<= 0 disables limiting)
+            burst: Requests that may be issued back-to-back before waiting
+        """
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                else:
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return waited
+                    delay = (1.0 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for ``seconds`` (e.g. after a 429 with Retry-After)."""
+        with self._lock:
+            until = time.monotonic() + max(0.0, seconds)
+            if until > self._paused_until:
+                self._paused_until = until
+                self._tokens = 0.0
+                self._updated = until
+        logger.info(f"⏸️ 요청 속도 제한: {seconds:.1f}초 대기")
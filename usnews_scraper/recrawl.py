@@ -0,0 +1,92 @@
+"""
+Targeted Re-crawl Targets
+
+Turns a validator report (``html_quality_report.json`` from
+scripts/check_html_status.py) or the corpus manifest into the list of
+(university_slug, page_type) pairs to fetch again, so problem pages can be
+re-crawled without deleting folders or re-running whole universities.
+"""
+
+import os
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .crawl_state import page_type_from_filename
+from .manifest import CorpusManifest
+
+logger = logging.getLogger("usnews_scraper.recrawl")
+
+# (university slug, page_type) — page_type "" = main
+RecrawlTarget = Tuple[str, str]
+
+# page_type wildcard: every page type of the university (catalog diff targets)
+ALL_PAGES = "*"
+
+
+def _target_from_path(path: str) -> RecrawlTarget:
+    """downloads/<slug>/<page>.html -> (slug, page_type)"""
+    return os.path.basename(os.path.dirname(path)), page_type_from_filename(path)
+
+
+def _target_from_record(record: Dict[str, Any]) -> RecrawlTarget:
+    if record.get("university") and "page_type" in record:
+        key = record["page_type"]
+        return record["university"], "" if key == "main" else key
+    return _target_from_path(record["path"])
+
+
+def load_recrawl_targets(path: str) -> List[RecrawlTarget]:
+    """
+    Load re-crawl targets from a report or manifest file.
+
+    Supported inputs:
+      - validator JSON report: ``problem_pages`` as file paths (or records with ``path``)
+      - validator JSONL report (check_html_status.py --jsonl): problem rows only
+      - manifest JSONL: pages whose latest record was saved without login
+      - catalog diff JSON (main.py --refresh-catalog): every page of ``changed_slugs``
+      - other JSONL: one record per line with ``path`` or ``university``/``page_type``
+
+    Returns:
+        Unique targets in file order
+    """
+    targets: List[RecrawlTarget] = []
+    if path.endswith('.jsonl'):
+        records = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        if any("saved_at" in r for r in records):
+            # 매니페스트: 페이지별 최신 줄 기준으로 비로그인 저장 페이지만 대상
+            records = CorpusManifest(path).not_logged_in()
+        for record in records:
+            # 검증기 JSONL 리포트 줄은 문제 페이지(비로그인/에러)만 대상
+            if "is_logged_in" in record and record["is_logged_in"] and not record.get("is_error_page"):
+                continue
+            if record.get("path") or record.get("university"):
+                targets.append(_target_from_record(record))
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict) and "changed_slugs" in data:
+            return [(slug, ALL_PAGES) for slug in dict.fromkeys(data["changed_slugs"])]
+        entries: Iterable = data.get("problem_pages", []) if isinstance(data, dict) else data
+        for entry in entries:
+            targets.append(_target_from_path(entry) if isinstance(entry, str) else _target_from_record(entry))
+    return list(dict.fromkeys(targets))
+
+
+def batch_targets(targets: List[RecrawlTarget], batch_size: int) -> List[List[RecrawlTarget]]:
+    """Group targets by university (keeping first-seen order) and split into browser-session batches."""
+    by_university: Dict[str, List[RecrawlTarget]] = {}
+    for target in targets:
+        by_university.setdefault(target[0], []).append(target)
+    ordered = [t for group in by_university.values() for t in group]
+    size = max(1, batch_size)
+    return [ordered[i:i + size] for i in range(0, len(ordered), size)]
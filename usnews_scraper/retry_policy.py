@@ -0,0 +1,206 @@
+"""
+Retry Policy
+
+Replaces the fixed ``time.sleep(retry_backoff_seconds)`` (60 s) after every
+failure with three pieces:
+
+- ``RetryPolicy``: jittered exponential backoff per error class (a crashed
+  driver needs a restart, not a minute of sleep; a 429 needs a long pause)
+- ``CircuitBreaker``: per-host breaker that opens on a burst of failures so
+  the crawler stops hammering a host that is erroring, then lets one trial
+  request through after a cool-down
+- ``DeferredRetryQueue``: failed pages are scheduled for a later time instead
+  of blocking the worker, which moves on to other universities meanwhile
+"""
+
+import time
+import random
+import logging
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger("usnews_scraper.retry_policy")
+
+
+# ===================== Module-level Constants =====================
+# Error classes
+ERR_NETWORK = "network"          # no status / chrome-error:// pages
+ERR_TIMEOUT = "timeout"          # navigation did not finish within page_load_timeout
+ERR_RATE_LIMIT = "rate_limit"    # 429
+ERR_SERVER = "server"            # 5xx
+ERR_AUTH = "auth"                # 401 / 403
+ERR_CLIENT = "client"            # other 4xx (408 etc.)
+ERR_DRIVER = "driver"            # WebDriver / unexpected exception (restart is the fix)
+
+
+@dataclass(frozen=True)
+class BackoffRule:
+    base: float      # delay before the first retry (seconds)
+    cap: float       # upper bound of the delay
+    factor: float = 2.0
+
+
+DEFAULT_BACKOFF_RULES: Dict[str, BackoffRule] = {
+    ERR_NETWORK: BackoffRule(5, 120),
+    ERR_TIMEOUT: BackoffRule(2, 60),
+    ERR_RATE_LIMIT: BackoffRule(60, 900),
+    ERR_SERVER: BackoffRule(10, 300),
+    ERR_AUTH: BackoffRule(5, 60),
+    ERR_CLIENT: BackoffRule(10, 120),
+    ERR_DRIVER: BackoffRule(1, 15),
+}
+
+# Circuit breaker defaults
+BREAKER_FAILURE_THRESHOLD = 5      # failures ...
+BREAKER_WINDOW_SECONDS = 120.0     # ... within this window open the circuit
+BREAKER_OPEN_SECONDS = 180.0       # first cool-down; doubled on each failed trial
+BREAKER_MAX_OPEN_SECONDS = 1800.0
+
+
+def classify_error(status: Optional[int], error_type: Optional[str] = None) -> str:
+    """Map NavigationManager.get_error_info() output to an error class."""
+    if error_type and "Akamai" in error_type:
+        return ERR_SERVER
+    if status is None or status == 0:
+        return ERR_NETWORK
+    if status == 429:
+        return ERR_RATE_LIMIT
+    if status in (401, 403):
+        return ERR_AUTH
+    if status >= 500:
+        return ERR_SERVER
+    return ERR_CLIENT
+
+
+class RetryPolicy:
+    """Jittered exponential backoff per error class."""
+
+    def __init__(self, rules: Optional[Dict[str, BackoffRule]] = None, rng: Optional[random.Random] = None):
+        self.rules = dict(DEFAULT_BACKOFF_RULES)
+        self.rules.update(rules or {})
+        self.rng = rng or random.Random()
+
+    def delay(self, error_class: str, attempt: int) -> float:
+        """
+        Seconds to wait before retry number ``attempt`` (0-based).
+
+        ``base × factor^attempt`` scaled by a random factor in [0.5, 1.5)
+        (so simultaneous failures do not retry in lockstep), capped.
+        """
+        rule = self.rules.get(error_class, self.rules[ERR_NETWORK])
+        raw = rule.base * (rule.factor ** max(0, attempt))
+        return min(rule.cap, raw * (0.5 + self.rng.random()))
+
+
+class CircuitBreaker:
+    """Per-host closed → open → half-open breaker."""
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 window_seconds: float = BREAKER_WINDOW_SECONDS,
+                 open_seconds: float = BREAKER_OPEN_SECONDS,
+                 max_open_seconds: float = BREAKER_MAX_OPEN_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        # host -> recent failure timestamps / open-until / current cool-down / trial in flight
+        self._failures: Dict[str, List[float]] = {}
+        self._open_until: Dict[str, float] = {}
+        self._cooldown: Dict[str, float] = {}
+        self._trial: Dict[str, bool] = {}
+
+    def allow(self, host: str) -> bool:
+        """True if a request to ``host`` may go out now (a single trial is let through after the cool-down)."""
+        open_until = self._open_until.get(host)
+        if open_until is None:
+            return True
+        if time.monotonic() < open_until or self._trial.get(host):
+            return False
+        self._trial[host] = True
+        logger.info(f"🔌 {host} 회로 반개방 - 시험 요청 1회 허용")
+        return True
+
+    def retry_after(self, host: str) -> float:
+        """Seconds until ``host`` accepts requests again (0 if closed)."""
+        open_until = self._open_until.get(host)
+        return max(0.0, open_until - time.monotonic()) if open_until else 0.0
+
+    def record_success(self, host: str) -> None:
+        if host in self._open_until:
+            logger.info(f"🔌 {host} 회로 닫힘 (시험 요청 성공)")
+        self._failures.pop(host, None)
+        self._open_until.pop(host, None)
+        self._cooldown.pop(host, None)
+        self._trial.pop(host, None)
+
+    def record_failure(self, host: str) -> None:
+        now = time.monotonic()
+        if self._trial.pop(host, False):
+            # 시험 요청 실패 → 더 길게 다시 차단
+            cooldown = min(self.max_open_seconds, self._cooldown.get(host, self.open_seconds) * 2)
+            self._trip(host, now, cooldown)
+            return
+        recent = [t for t in self._failures.get(host, []) if now - t <= self.window_seconds]
+        recent.append(now)
+        self._failures[host] = recent
+        if len(recent) >= self.failure_threshold and host not in self._open_until:
+            self._trip(host, now, self.open_seconds)
+
+    def _trip(self, host: str, now: float, cooldown: float) -> None:
+        self._cooldown[host] = cooldown
+        self._open_until[host] = now + cooldown
+        self._failures[host] = []
+        logger.warning(f"🔌 {host} 회로 차단 - 연속 실패로 {cooldown:.0f}초 동안 요청 중단")
+
+
+class DeferredRetryQueue:
+    """Items scheduled for a later retry, with per-item attempt counts kept until ``forget``."""
+
+    def __init__(self):
+        # key -> (ready_at monotonic, error class)
+        self.pending: Dict[Hashable, Tuple[float, str]] = {}
+        self.attempts: Dict[Hashable, int] = {}
+
+    def push(self, key: Hashable, delay: float, error_class: str, count_attempt: bool = True) -> int:
+        """
+        Schedule ``key`` after ``delay`` seconds; returns its attempt number (1-based).
+        ``count_attempt=False`` reschedules without using up an attempt (e.g. circuit open).
+        """
+        if count_attempt or key not in self.attempts:
+            self.attempts[key] = self.attempts.get(key, 0) + int(count_attempt)
+        self.pending[key] = (time.monotonic() + max(0.0, delay), error_class)
+        return self.attempts[key]
+
+    def attempts_for(self, key: Hashable) -> int:
+        return self.attempts.get(key, 0)
+
+    def replace(self, old_key: Hashable, new_key: Hashable) -> None:
+        """Re-key a pending item, keeping its schedule; attempts already made under ``new_key`` carry over."""
+        if old_key in self.pending:
+            self.pending[new_key] = self.pending.pop(old_key)
+            self.attempts[new_key] = max(self.attempts.pop(old_key, 1), self.attempts.get(new_key, 0) + 1)
+
+    def pop_due(self) -> List[Hashable]:
+        """Remove and return every item whose time has come, earliest first."""
+        now = time.monotonic()
+        due = sorted((ready, key) for key, (ready, _) in self.pending.items() if ready <= now)
+        for _, key in due:
+            del self.pending[key]
+        return [key for _, key in due]
+
+    def next_due_in(self) -> Optional[float]:
+        """Seconds until the earliest pending item is due (None if empty)."""
+        if not self.pending:
+            return None
+        return max(0.0, min(ready for ready, _ in self.pending.values()) - time.monotonic())
+
+    def forget(self, key: Hashable) -> None:
+        """Drop an item and its attempt count (saved, or given up)."""
+        self.pending.pop(key, None)
+        self.attempts.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.pending
+
+    def __len__(self) -> int:
+        return len(self.pending)
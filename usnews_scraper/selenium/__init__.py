@@ -9,6 +9,7 @@ from .chrome_setup import ChromeSetup
 from .navigation import NavigationManager
 from .session_manager import SessionManager
 from .health_check import HealthChecker
+from .network_capture import NetworkCapture, CapturedResponse, literal_pattern
 
 __all__ = [
     'SeleniumConfig',
@@ -17,4 +18,7 @@ __all__ = [
     'NavigationManager', 
     'SessionManager',
     'HealthChecker',
+    'NetworkCapture',
+    'CapturedResponse',
+    'literal_pattern',
 ]
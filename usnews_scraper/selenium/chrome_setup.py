@@ -39,6 +39,8 @@ class ChromeSetup:
         if use_existing_chrome:
             # 기존 Chrome에 연결하기 위한 설정
             chrome_options.add_experimental_option("debuggerAddress", self.config.debugger_address)
+            if self.config.page_load_strategy == "none":
+                chrome_options.page_load_strategy = "none"
             logger.info("🔗 기존 Chrome 브라우저에 연결합니다...")
         else:
             if headless:
@@ -75,8 +77,8 @@ class ChromeSetup:
             }
             chrome_options.add_experimental_option("prefs", prefs)
 
-            # 페이지 로드 전략: eager (DOMContentLoaded 까지 대기)
-            chrome_options.page_load_strategy = 'eager'
+            # 페이지 로드 전략: 기본 eager (DOMContentLoaded 까지 대기), 헤지 네비게이션은 none
+            chrome_options.page_load_strategy = self.config.page_load_strategy
 
             # 인증서 관련 이슈 완화
             chrome_options.set_capability("acceptInsecureCerts", True)
@@ -61,6 +61,7 @@ class SeleniumConfig:
     """Holds timeouts and behavior flags for SeleniumBase."""
     implicit_wait: int = DEFAULT_IMPLICIT_WAIT
     page_load_timeout: int = 20
+    page_source_timeout: int = 20  # driver.page_source 타임아웃 (SIGALRM)
     response_slow_threshold: int = 10
     startup_healthcheck_timeout: int = 10
     pre_nav_healthcheck_timeout: int = 30
@@ -68,6 +69,9 @@ class SeleniumConfig:
     healthcheck_before_navigation: bool = False
     origin_nav_timeout: int = 30  # 세션 캡처시 사이트 방문 타임아웃
     post_render_wait_seconds: int = 4
+    # "eager": chromedriver이 DOMContentLoaded까지 대기 / "none": 명령이 로드를 기다리지 않음
+    # (헤지 네비게이션용 - 이때 navigate_to 등은 load_page로 직접 준비 상태를 확인)
+    page_load_strategy: str = "eager"
     navigate_retry_count: int = 1
     retry_backoff_seconds: int = 60
     debugger_address: str = "127.0.0.1:9222"
@@ -6,7 +6,8 @@ URL 네비게이션과 에러 처리를 담당합니다.
 
 import time
 import logging
-from typing import Optional, Dict
+from urllib.parse import urlparse
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
@@ -15,13 +16,76 @@ from .config import SeleniumConfig, NETWORK_ERROR_URL_INDICATORS, PERMANENT_STAT
 logger = logging.getLogger("usnews_scraper.selenium.navigation")
 
 
+# ===================== Module-level Constants =====================
+# Lightweight same-origin document loaded before a same-origin XHR (conditional probe / fetch_text)
+ORIGIN_LANDING_PATH = "/robots.txt"
+
+# Hedged navigation: tabs are polled round-robin at this interval
+HEDGE_POLL_SECONDS = 0.25
+
+# load_page under the "none" strategy: readiness poll interval
+READY_POLL_SECONDS = 0.1
+
+# Non-blocking navigation; the marker lives on the old document only, so "no marker" = new document
+MARK_NAVIGATION_JS = "window.__usnewsNavPending = true;"
+START_NAVIGATION_JS = MARK_NAVIGATION_JS + " window.location.assign(arguments[0]);"
+# Same readiness point as the eager strategy: DOMContentLoaded (readyState != "loading")
+NAVIGATION_READY_JS = "return !window.__usnewsNavPending && document.readyState !== 'loading';"
+
+
+def is_navigation_ready(driver: webdriver.Chrome) -> bool:
+    """
+    Non-blocking readiness check of the current tab (requires the "none" page load strategy,
+    under which execute_script does not wait for the pending load).
+    A document being swapped out may reject the script; that counts as not ready yet.
+    """
+    try:
+        return bool(driver.execute_script(NAVIGATION_READY_JS))
+    except WebDriverException:
+        return False
+
+
+def load_page(driver: webdriver.Chrome, url: str, page_load_strategy: str, timeout: float) -> None:
+    """
+    ``driver.get`` that waits for DOMContentLoaded under every page load strategy.
+
+    Under "eager"/"normal" chromedriver does the waiting (TimeoutException after
+    page_load_timeout). Under "none" ``driver.get`` returns once the navigation has
+    started, so the old document is marked first and the new one is polled; a load
+    not ready within ``timeout`` is stopped and raised as TimeoutException, as
+    chromedriver would.
+    """
+    if page_load_strategy != "none":
+        driver.get(url)
+        return
+    try:
+        driver.execute_script(MARK_NAVIGATION_JS)
+    except WebDriverException:
+        pass
+    driver.get(url)
+    deadline = time.monotonic() + timeout
+    while not is_navigation_ready(driver):
+        if time.monotonic() >= deadline:
+            try:
+                driver.execute_script("window.stop();")
+            except WebDriverException:
+                pass
+            raise TimeoutException(f"page not ready within {timeout:.0f}s: {url}")
+        time.sleep(READY_POLL_SECONDS)
+
+
 class NavigationManager:
     """URL 네비게이션과 에러 처리를 담당하는 클래스"""
     
     def __init__(self, config: SeleniumConfig):
         self.config = config
+        # 재시작 후 대기 시간 함수 (attempt 0부터) - None이면 config.retry_backoff_seconds 고정
+        self.retry_delay: Optional[Callable[[int], float]] = None
+        # 마지막 네비게이션의 실제 로드 시간(렌더 대기·재시작 제외)과 그 전에 타임아웃된 시도 수
+        self.last_load_seconds: Optional[float] = None
+        self.last_load_timeouts = 0
     
-    def navigate_to(self, driver: webdriver.Chrome, url: str, wait_time: int = 3, do_precheck: Optional[bool] = None, health_checker=None, driver_container=None) -> bool:
+    def navigate_to(self, driver: webdriver.Chrome, url: str, wait_time: int = 3, do_precheck: Optional[bool] = None, health_checker=None, driver_container=None, inline_retries: bool = True) -> bool:
         """
         지정된 URL로 이동합니다.
         
@@ -31,6 +95,8 @@ class NavigationManager:
             wait_time: 페이지 로드 후 대기 시간 (기본값: 3초)
             do_precheck: 사전 응답성 체크 여부
             health_checker: 헬스체크 매니저 인스턴스
+            inline_retries: False면 대기 후 재시도하지 않고 바로 실패를 반환 (호출자가 재시도 예약).
+                드라이버 오류였다면 다음 네비게이션을 위해 재시작만 하고 대기하지 않습니다.
             
         Returns:
             성공 여부
@@ -51,15 +117,25 @@ class NavigationManager:
             driver.set_page_load_timeout(self.config.page_load_timeout)
             
             attempts = 0
+            self.last_load_seconds = None
+            self.last_load_timeouts = 0
             while True:
                 try:
-                    driver.get(url)
+                    load_started = time.monotonic()
+                    load_page(driver, url, self.config.page_load_strategy, self.config.page_load_timeout)
+                    self.last_load_seconds = time.monotonic() - load_started
                     logger.info("✅ 페이지 로딩 완료")
                     time.sleep(self.config.post_render_wait_seconds)
                     break
                 except (TimeoutException, WebDriverException) as e:
                     attempts += 1
+                    if isinstance(e, TimeoutException):
+                        self.last_load_timeouts += 1
                     logger.warning(f"⚠️ 네비게이션 예외({attempts}/{self.config.navigate_retry_count + 1}): {e}")
+                    if not inline_retries:
+                        if not isinstance(e, TimeoutException) and health_checker and driver_container:
+                            health_checker.restart_chrome(driver_container)
+                        return False
                     if attempts > self.config.navigate_retry_count:
                         return False
                     if health_checker and driver_container and not health_checker.restart_chrome(driver_container):
@@ -68,7 +144,7 @@ class NavigationManager:
                         driver.set_page_load_timeout(self.config.page_load_timeout)
                     except Exception:
                         pass
-                    time.sleep(self.config.retry_backoff_seconds)
+                    time.sleep(self.retry_delay(attempts - 1) if self.retry_delay else self.config.retry_backoff_seconds)
             
             return True
             
@@ -76,12 +152,95 @@ class NavigationManager:
             logger.error(f"❌ URL 이동 중 오류: {str(e)}")
             return False
     
-    def get_page_source(self, driver: webdriver.Chrome) -> Optional[str]:
+    def navigate_hedged(self, driver: webdriver.Chrome, url: str, hedge_after: float, timeout: float) -> Tuple[bool, bool]:
+        """
+        지연 꼬리를 줄이는 헤지 네비게이션.
+
+        현재 탭에서 비동기로 이동을 시작하고, ``hedge_after``초 안에 준비되지 않으면 새 탭에서
+        같은 URL을 한 번 더 요청합니다. 먼저 준비된 탭을 남기고 나머지는 취소(닫기/로딩 중단)하며,
+        드라이버는 이긴 탭으로 전환된 상태로 반환됩니다. 재시작 재시도는 하지 않습니다.
+
+        드라이버가 ``page_load_strategy="none"``으로 만들어져 있어야 합니다. eager/normal에서는
+        chromedriver가 로딩 중인 탭의 모든 명령(이동 시작 스크립트 포함)을 로드가 끝날 때까지
+        붙잡아 두므로 두 번째 요청이 제때 나갈 수 없습니다.
+        
+        Args:
+            driver: Chrome WebDriver 인스턴스
+            url: 이동할 URL
+            hedge_after: 두 번째 요청을 시작할 시점(초)
+            timeout: 전체 제한 시간(초)
+            
+        Returns:
+            (로드 성공 여부, 두 번째 요청을 보냈는지 여부)
+        """
+        if not driver:
+            logger.error("❌ WebDriver가 없습니다.")
+            return False, False
+        primary = driver.current_window_handle
+        tabs = [primary]
+        winner: Optional[str] = None
+        started = time.monotonic()
+        self.last_load_seconds = None
+        self.last_load_timeouts = 0
+        try:
+            driver.execute_script(START_NAVIGATION_JS, url)
+            while time.monotonic() - started < timeout:
+                for handle in tabs:
+                    driver.switch_to.window(handle)
+                    if is_navigation_ready(driver):
+                        winner = handle
+                        self.last_load_seconds = time.monotonic() - started
+                        break
+                if winner:
+                    break
+                if len(tabs) == 1 and time.monotonic() - started >= hedge_after:
+                    driver.switch_to.new_window("tab")
+                    driver.execute_script(START_NAVIGATION_JS, url)
+                    tabs.append(driver.current_window_handle)
+                    logger.info(f"🪢 {hedge_after:.1f}초 내 로딩 미완료 - 두 번째 탭에서 같은 페이지 요청")
+                time.sleep(HEDGE_POLL_SECONDS)
+        except WebDriverException as e:
+            logger.warning(f"⚠️ 헤지 네비게이션 예외: {e}")
+        finally:
+            self._cancel_hedge_tabs(driver, tabs, keep=winner or primary, stop_keep=winner is None)
+
+        hedged = len(tabs) > 1
+        if not winner:
+            self.last_load_timeouts = 1
+            logger.warning(f"⚠️ {timeout:.0f}초 내 로딩 미완료{' (헤지 포함)' if hedged else ''}")
+            return False, hedged
+        if hedged:
+            logger.info(f"✅ 페이지 로딩 완료 ({'두 번째' if winner != primary else '첫 번째'} 탭 우선)")
+        else:
+            logger.info("✅ 페이지 로딩 완료")
+        time.sleep(self.config.post_render_wait_seconds)
+        return True, hedged
+
+    def _cancel_hedge_tabs(self, driver: webdriver.Chrome, tabs: List[str], keep: str, stop_keep: bool) -> None:
+        """keep 이외의 탭은 로딩을 중단하고 닫은 뒤 keep 탭으로 전환합니다 (stop_keep: 시간 초과 시 keep도 중단)."""
+        for handle in tabs:
+            if handle == keep:
+                continue
+            try:
+                driver.switch_to.window(handle)
+                driver.execute_script("window.stop();")
+                driver.close()
+            except Exception:
+                pass
+        try:
+            driver.switch_to.window(keep)
+            if stop_keep:
+                driver.execute_script("window.stop();")
+        except Exception:
+            pass
+
+    def get_page_source(self, driver: webdriver.Chrome, timeout: Optional[int] = None) -> Optional[str]:
         """
         현재 페이지의 HTML 소스를 가져옵니다.
         
         Args:
             driver: Chrome WebDriver 인스턴스
+            timeout: 타임아웃(초), None이면 config.page_source_timeout
             
         Returns:
             HTML 소스 또는 None
@@ -96,7 +255,8 @@ class NavigationManager:
                 raise TimeoutError("페이지 소스 가져오기 타임아웃")
             
             signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(20)  # 20초 타임아웃
+            timeout_seconds = max(1, int(timeout or self.config.page_source_timeout))
+            signal.alarm(timeout_seconds)
             
             try:
                 page_source = driver.page_source
@@ -105,7 +265,7 @@ class NavigationManager:
                 signal.alarm(0)  # 타임아웃 해제
                 
         except TimeoutError:
-            logger.warning("⚠️ 페이지 소스 가져오기 타임아웃 (20초)")
+            logger.warning(f"⚠️ 페이지 소스 가져오기 타임아웃 ({timeout_seconds}초)")
             return None
         except Exception as e:
             logger.warning(f"❌ 페이지 소스 가져오기 중 오류: {str(e)}")
@@ -147,6 +307,100 @@ class NavigationManager:
                 logger.warning(f"⚠️ 상태 코드 확인 실패: {str(e)}")
                 return None
 
+    def ensure_same_origin(self, driver: webdriver.Chrome, url: str) -> bool:
+        """
+        XHR가 같은 오리진 요청이 되도록 필요하면 url의 오리진으로 먼저 이동합니다.
+        (새 드라이버의 about:blank, 세션 적용 후 premium.usnews.com 등에서는 교차 오리진이라 항상 실패)
+        
+        Returns:
+            이미 같은 오리진이거나 이동에 성공하면 True
+        """
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        try:
+            if driver.execute_script("return window.location.origin;") == origin:
+                return True
+            driver.set_page_load_timeout(self.config.origin_nav_timeout)
+            try:
+                load_page(driver, origin + ORIGIN_LANDING_PATH, self.config.page_load_strategy,
+                          self.config.origin_nav_timeout)
+            finally:
+                driver.set_page_load_timeout(self.config.page_load_timeout)
+            return driver.execute_script("return window.location.origin;") == origin
+        except Exception as e:
+            logger.debug(f"오리진 이동 실패 ({origin}): {e}")
+            return False
+
+    def conditional_probe(self, driver: webdriver.Chrome, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        조건부 HEAD 요청(If-None-Match / If-Modified-Since)으로 페이지 변경 여부를 확인합니다.
+        브라우저 쿠키가 그대로 사용되도록 필요하면 먼저 같은 오리진으로 이동합니다 (ensure_same_origin).
+        
+        Args:
+            driver: Chrome WebDriver 인스턴스
+            url: 확인할 URL
+            etag: 이전에 기록된 ETag
+            last_modified: 이전에 기록된 Last-Modified
+            
+        Returns:
+            {"status": int, "etag": str|None, "last_modified": str|None} 또는 확인 불가 시 None
+        """
+        try:
+            if not driver or not self.ensure_same_origin(driver, url):
+                return None
+            result = driver.execute_script("""
+                var req = new XMLHttpRequest();
+                req.open('HEAD', arguments[0], false);
+                if (arguments[1]) { req.setRequestHeader('If-None-Match', arguments[1]); }
+                if (arguments[2]) { req.setRequestHeader('If-Modified-Since', arguments[2]); }
+                req.send();
+                return {
+                    status: req.status,
+                    etag: req.getResponseHeader('ETag'),
+                    last_modified: req.getResponseHeader('Last-Modified')
+                };
+            """, url, etag, last_modified)
+            if not isinstance(result, dict) or not result.get("status"):
+                return None
+            return result
+        except Exception as e:
+            logger.debug(f"조건부 요청 불가: {e}")
+            return None
+
+    def fetch_text(self, driver: webdriver.Chrome, url: str, accept: str = "application/json") -> Optional[Dict[str, Any]]:
+        """
+        현재 브라우저 세션(쿠키 포함)으로 GET 요청을 보내 응답 본문을 가져옵니다.
+        conditional_probe와 마찬가지로 필요하면 먼저 같은 오리진으로 이동합니다.
+        
+        Args:
+            driver: Chrome WebDriver 인스턴스
+            url: 요청할 URL
+            accept: Accept 헤더
+            
+        Returns:
+            {"status": int, "content_type": str|None, "text": str} 또는 요청 불가 시 None
+        """
+        try:
+            if not driver or not self.ensure_same_origin(driver, url):
+                return None
+            result = driver.execute_script("""
+                var req = new XMLHttpRequest();
+                req.open('GET', arguments[0], false);
+                req.setRequestHeader('Accept', arguments[1]);
+                req.send();
+                return {
+                    status: req.status,
+                    content_type: req.getResponseHeader('Content-Type'),
+                    text: req.responseText
+                };
+            """, url, accept)
+            if not isinstance(result, dict) or not result.get("status"):
+                return None
+            return result
+        except Exception as e:
+            logger.debug(f"GET 요청 불가: {e}")
+            return None
+
     def get_error_info(self, driver: webdriver.Chrome) -> Dict[str, Optional[str]]:
         """
         상태코드와 해석된 에러 타입을 함께 반환합니다.
@@ -0,0 +1,252 @@
+"""
+Network Capture Module
+
+URL 패턴에 맞는 fetch/XHR 응답을 페이지 안에서 바로 잡아내는 이벤트 기반 캡처.
+
+performance 로그를 주기적으로 비우고 전부 JSON 파싱하는 대신, 네비게이션 전에
+``Page.addScriptToEvaluateOnNewDocument``로 fetch/XMLHttpRequest 훅을 심어 두고,
+패턴에 맞는 응답이 끝까지 로드되는 순간 ``execute_async_script`` 대기를 깨웁니다.
+"""
+
+import re
+import json
+import time
+import logging
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from selenium import webdriver
+
+logger = logging.getLogger("usnews_scraper.selenium.network_capture")
+
+
+# 페이지에 주입되는 훅. 버퍼 키/패턴/최대 본문 크기는 설치 시 JSON으로 치환됩니다.
+# 캡처마다 버퍼 키가 달라 같은 문서에 여러 훅(예: API 저장 + JSON 기록)이 공존할 수 있습니다.
+_HOOK_TEMPLATE = r"""
+(function () {
+  var key = __KEY__;
+  if (window[key]) { return; }
+  var patterns = __PATTERNS__.map(function (p) { return new RegExp(p); });
+  var maxBody = __MAX_BODY__;
+  var cap = window[key] = { seq: 0, entries: [], waiters: [] };
+  function matches(url) {
+    for (var i = 0; i < patterns.length; i++) { if (patterns[i].test(url)) { return true; } }
+    return false;
+  }
+  function record(url, status, contentType, body, started) {
+    var truncated = body.length > maxBody;
+    var entry = {
+      // 문서가 바뀌어도 증가하도록 시각 기반 시퀀스 사용
+      seq: Date.now() * 1000 + (cap.seq++ % 1000), url: url, status: status, content_type: contentType || "",
+      body: truncated ? body.slice(0, maxBody) : body, truncated: truncated,
+      elapsed_ms: Date.now() - started
+    };
+    cap.entries.push(entry);
+    var pending = cap.waiters; cap.waiters = [];
+    for (var i = 0; i < pending.length; i++) {
+      try { if (!pending[i](entry)) { cap.waiters.push(pending[i]); } } catch (e) {}
+    }
+  }
+  var origFetch = window.fetch;
+  if (origFetch) {
+    window.fetch = function (input, init) {
+      var url = (typeof input === "string") ? input : (input && input.url) || "";
+      var started = Date.now();
+      var promise = origFetch.apply(this, arguments);
+      try { url = new URL(url, location.href).href; } catch (e) {}
+      if (matches(url)) {
+        promise.then(function (resp) {
+          resp.clone().text().then(function (text) {
+            record(resp.url || url, resp.status, resp.headers.get("content-type"), text, started);
+          }, function () {});
+        }, function () {});
+      }
+      return promise;
+    };
+  }
+  var origOpen = XMLHttpRequest.prototype.open;
+  var origSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.open = function (method, url) {
+    try { this.__captureUrl = new URL(url, location.href).href; } catch (e) { this.__captureUrl = String(url); }
+    return origOpen.apply(this, arguments);
+  };
+  XMLHttpRequest.prototype.send = function () {
+    var xhr = this;
+    if (xhr.__captureUrl && matches(xhr.__captureUrl)) {
+      var started = Date.now();
+      xhr.addEventListener("loadend", function () {
+        var text = "";
+        try {
+          if (xhr.responseType === "" || xhr.responseType === "text") { text = xhr.responseText || ""; }
+          else if (xhr.responseType === "json") { text = JSON.stringify(xhr.response); }
+        } catch (e) {}
+        record(xhr.responseURL || xhr.__captureUrl, xhr.status, xhr.getResponseHeader("content-type"), text, started);
+      });
+    }
+    return origSend.apply(this, arguments);
+  };
+})();
+"""
+
+# 조건에 맞는 응답이 이미 버퍼에 있으면 즉시, 아니면 도착하는 순간 반환
+_WAIT_SCRIPT = r"""
+var done = arguments[arguments.length - 1];
+var timeoutMs = arguments[0], afterSeq = arguments[1], status = arguments[2], urlPattern = arguments[3];
+var cap = window[arguments[4]];
+if (!cap) { done({ hook_missing: true }); return; }
+var re = urlPattern ? new RegExp(urlPattern) : null;
+function ok(e) { return e.seq > afterSeq && (status === null || e.status === status) && (!re || re.test(e.url)); }
+for (var i = 0; i < cap.entries.length; i++) { if (ok(cap.entries[i])) { done(cap.entries[i]); return; } }
+var finished = false;
+var timer = setTimeout(function () { finished = true; done(null); }, timeoutMs);
+cap.waiters.push(function (e) {
+  if (finished) { return true; }
+  if (!ok(e)) { return false; }
+  finished = true; clearTimeout(timer); done(e); return true;
+});
+"""
+
+_DRAIN_SCRIPT = r"""
+var cap = window[arguments[0]];
+if (!cap) { return null; }
+var out = cap.entries; cap.entries = [];
+return out;
+"""
+
+
+def literal_pattern(text: str) -> str:
+    """Escape ``text`` so it matches literally as a JavaScript RegExp (e.g. an API URL prefix)."""
+    return re.sub(r'([.*+?^${}()|\[\]\\/])', r'\\\1', text)
+
+
+@dataclass
+class CapturedResponse:
+    url: str
+    status: int
+    content_type: str = ""
+    body: str = ""
+    truncated: bool = False
+    elapsed_ms: int = 0
+    seq: int = 0
+    captured_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_entry(cls, entry: Dict[str, Any]) -> "CapturedResponse":
+        return cls(
+            url=str(entry.get("url", "")),
+            status=int(entry.get("status") or 0),
+            content_type=str(entry.get("content_type") or ""),
+            body=str(entry.get("body") or ""),
+            truncated=bool(entry.get("truncated")),
+            elapsed_ms=int(entry.get("elapsed_ms") or 0),
+            seq=int(entry.get("seq") or 0),
+        )
+
+    @property
+    def is_json(self) -> bool:
+        """Content-Type이 JSON이거나 본문이 JSON 객체/배열로 시작하는지"""
+        return "json" in self.content_type.lower() or self.body.lstrip()[:1] in ("{", "[")
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class NetworkCapture:
+    """URL 패턴(정규식)에 맞는 fetch/XHR 응답을 페이지 내부 훅으로 캡처하는 클래스"""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, driver: webdriver.Chrome, patterns: Sequence[str], max_body_bytes: int = 5 * 1024 * 1024):
+        """
+        Args:
+            driver: Chrome WebDriver 인스턴스 (CDP 지원 필요)
+            patterns: 캡처할 URL 정규식 목록 (JavaScript RegExp 문법)
+            max_body_bytes: 응답 본문 최대 보관 길이 (넘으면 잘라서 truncated=True)
+        """
+        self.driver = driver
+        self.patterns: List[str] = list(patterns)
+        self.max_body_bytes = max_body_bytes
+        self._script_id: Optional[str] = None
+        self._last_seq = 0
+        self.key = f"__usnewsCapture{next(self._ids)}"
+        self._source = (
+            _HOOK_TEMPLATE
+            .replace("__KEY__", json.dumps(self.key))
+            .replace("__PATTERNS__", json.dumps(self.patterns))
+            .replace("__MAX_BODY__", str(int(max_body_bytes)))
+        )
+
+    @property
+    def installed(self) -> bool:
+        return self._script_id is not None
+
+    def install(self) -> bool:
+        """
+        다음 문서부터 훅이 자동 주입되도록 등록합니다 (네비게이션 전에 호출).
+        현재 문서에도 즉시 주입해 SPA 내부 요청도 잡습니다.
+        """
+        if self.installed:
+            return True
+        try:
+            result = self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": self._source})
+            self._script_id = result.get("identifier") if isinstance(result, dict) else None
+        except Exception as e:
+            logger.warning(f"⚠️ 네트워크 캡처 훅 등록 실패: {e}")
+            return False
+        try:
+            self.driver.execute_script(self._source)
+        except Exception:
+            pass
+        logger.debug(f"📡 네트워크 캡처 훅 등록: {self.patterns}")
+        return self._script_id is not None
+
+    def uninstall(self) -> None:
+        """등록된 훅을 제거합니다 (이미 로드된 문서의 훅은 다음 네비게이션까지 유지)."""
+        if not self._script_id:
+            return
+        try:
+            self.driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": self._script_id})
+        except Exception:
+            pass
+        self._script_id = None
+
+    def wait_for(self, timeout: float = 30.0, status: Optional[int] = 200, url_pattern: Optional[str] = None) -> Optional[CapturedResponse]:
+        """
+        조건에 맞는 다음 응답이 로드 완료될 때까지 대기합니다.
+
+        Args:
+            timeout: 최대 대기 시간(초)
+            status: 이 HTTP 상태만 허용 (None = 모두)
+            url_pattern: 설치 패턴 중 추가로 좁힐 정규식 (None = 모두)
+
+        Returns:
+            CapturedResponse 또는 None (타임아웃/훅 없음)
+        """
+        timeout_ms = int(max(0.0, timeout) * 1000)
+        try:
+            self.driver.set_script_timeout(timeout + 5)
+            entry = self.driver.execute_async_script(_WAIT_SCRIPT, timeout_ms, self._last_seq, status, url_pattern, self.key)
+        except Exception as e:
+            logger.warning(f"⚠️ 네트워크 캡처 대기 실패: {e}")
+            return None
+        if not entry:
+            return None
+        if entry.get("hook_missing"):
+            logger.warning("⚠️ 현재 문서에 네트워크 캡처 훅이 없습니다 (install()을 네비게이션 전에 호출하세요)")
+            return None
+        response = CapturedResponse.from_entry(entry)
+        self._last_seq = max(self._last_seq, response.seq)
+        return response
+
+    def drain(self) -> List[CapturedResponse]:
+        """현재 문서에서 지금까지 캡처된 응답을 모두 꺼내고 버퍼를 비웁니다."""
+        try:
+            entries = self.driver.execute_script(_DRAIN_SCRIPT, self.key) or []
+        except Exception as e:
+            logger.warning(f"⚠️ 네트워크 캡처 수집 실패: {e}")
+            return []
+        responses = [CapturedResponse.from_entry(e) for e in entries if isinstance(e, dict)]
+        if responses:
+            self._last_seq = max(self._last_seq, max(r.seq for r in responses))
+        return responses
@@ -12,6 +12,7 @@ from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 
 from .config import SeleniumConfig
+from .navigation import load_page
 
 logger = logging.getLogger("usnews_scraper.selenium.session_manager")
 
@@ -25,6 +26,8 @@ class SessionManager:
         self.session_cookies: List[Dict[str, Any]] = []
         self.local_storage_items: Dict[str, str] = {}
         self.session_storage_items: Dict[str, str] = {}
+        # 캡처한 브라우저의 User-Agent (HTTP 클라이언트에서 같은 세션으로 보이도록 재사용)
+        self.user_agent: Optional[str] = None
     
     def _create_temp_driver_connected_to_existing(self) -> Optional[webdriver.Chrome]:
         """디버그 포트로 실행 중인 기존 Chrome에 연결하는 임시 드라이버를 생성합니다."""
@@ -118,6 +121,11 @@ class SessionManager:
                     logger.warning(f"❌ {origin} 방문 실패: {e}")
                     continue
 
+            try:
+                self.user_agent = temp_driver.execute_script("return navigator.userAgent;") or None
+            except Exception:
+                self.user_agent = None
+
             self.session_cookies = collected_cookies
             self.local_storage_items = collected_local
             self.session_storage_items = collected_session
@@ -165,7 +173,7 @@ class SessionManager:
 
             for origin in unique_origins:
                 try:
-                    driver.get(origin)
+                    load_page(driver, origin, self.config.page_load_strategy, self.config.origin_nav_timeout)
                     time.sleep(1)
 
                     # localStorage 적용
@@ -6,11 +6,11 @@ Selenium Base Module (Refactored)
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from .selenium import (
     SeleniumConfig, setup_basic_logging,
-    ChromeSetup, NavigationManager, SessionManager, HealthChecker
+    ChromeSetup, NavigationManager, SessionManager, HealthChecker, NetworkCapture, CapturedResponse
 )
 
 logger = logging.getLogger("usnews_scraper.selenium_base")
@@ -53,6 +53,10 @@ class SeleniumBase:
         
         # 순환 참조 설정
         self.health_checker.set_chrome_setup(self.chrome_setup)
+        
+        # JSON 응답 기록 모드 (start_json_recording으로 활성화)
+        self.json_record_patterns: List[str] = []
+        self.json_recorder: Optional[NetworkCapture] = None
     
     # ========== Chrome 설정 및 드라이버 관리 ==========
     def setup_chrome_options(self):
@@ -77,10 +81,13 @@ class SeleniumBase:
             self.health_checker.ensure_responsive_or_restart(self, timeout_seconds=self.config.startup_healthcheck_timeout)
     
     # ========== 네비게이션 및 에러 처리 ==========
-    def navigate_to(self, url: str, wait_time: int = 3, do_precheck: Optional[bool] = None) -> bool:
-        """지정된 URL로 이동합니다."""
+    def navigate_to(self, url: str, wait_time: int = 3, do_precheck: Optional[bool] = None,
+                    inline_retries: bool = True) -> bool:
+        """지정된 URL로 이동합니다. (inline_retries=False: 대기 후 재시도 없이 실패 반환)"""
         if not self.driver:
             self.setup_driver()
+        if self.json_record_patterns:
+            self._ensure_json_recorder()
             
         return self.navigation_manager.navigate_to(
             driver=self.driver,
@@ -88,17 +95,32 @@ class SeleniumBase:
             wait_time=wait_time,
             do_precheck=do_precheck,
             health_checker=self.health_checker,
-            driver_container=self
+            driver_container=self,
+            inline_retries=inline_retries
         )
     
-    def get_page_source(self) -> Optional[str]:
-        """현재 페이지의 HTML 소스를 가져옵니다."""
-        return self.navigation_manager.get_page_source(self.driver)
+    def navigate_hedged(self, url: str, hedge_after: float, timeout: float) -> Tuple[bool, bool]:
+        """hedge_after초 안에 준비되지 않으면 두 번째 탭에서도 요청해 먼저 끝난 쪽을 사용합니다. (로드 성공, 헤지 여부)"""
+        if not self.driver:
+            self.setup_driver()
+        return self.navigation_manager.navigate_hedged(self.driver, url, hedge_after, timeout)
+    
+    def get_page_source(self, timeout: Optional[int] = None) -> Optional[str]:
+        """현재 페이지의 HTML 소스를 가져옵니다. (timeout: None이면 config.page_source_timeout)"""
+        return self.navigation_manager.get_page_source(self.driver, timeout)
     
     def get_response_status_code(self) -> Optional[int]:
         """현재 페이지의 HTTP 응답 상태 코드를 가져옵니다."""
         return self.navigation_manager.get_response_status_code(self.driver)
     
+    def conditional_probe(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """조건부 HEAD 요청으로 변경 여부(304)와 ETag/Last-Modified를 확인합니다."""
+        return self.navigation_manager.conditional_probe(self.driver, url, etag, last_modified)
+    
+    def fetch_text(self, url: str, accept: str = "application/json") -> Optional[Dict[str, Any]]:
+        """현재 세션 쿠키로 같은 오리진 GET 요청을 보내 상태코드와 본문을 가져옵니다."""
+        return self.navigation_manager.fetch_text(self.driver, url, accept)
+    
     def get_error_info(self) -> Dict[str, Optional[str]]:
         """상태코드와 해석된 에러 타입을 함께 반환합니다."""
         return self.navigation_manager.get_error_info(self.driver)
@@ -115,6 +137,49 @@ class SeleniumBase:
         """영구적인 에러인지 확인합니다."""
         return self.navigation_manager.is_permanent_error(self.driver)
     
+    # ========== 네트워크 캡처 ==========
+    def start_network_capture(self, patterns: List[str], max_body_bytes: int = 5 * 1024 * 1024) -> Optional[NetworkCapture]:
+        """
+        URL 패턴(정규식)에 맞는 fetch/XHR 응답 캡처를 시작합니다.
+        네비게이션 전에 호출해야 하며, 드라이버를 다시 만들면 다시 호출해야 합니다.
+        """
+        if not self.driver:
+            return None
+        capture = NetworkCapture(self.driver, patterns, max_body_bytes)
+        return capture if capture.install() else None
+    
+    # ========== JSON 응답 기록 ==========
+    def start_json_recording(self, patterns: List[str]) -> None:
+        """
+        URL 패턴(정규식)에 맞는 JSON 응답 기록 모드를 켭니다.
+        이후 navigate_to마다 훅이 보장되며 (드라이버 재시작 포함), collect_recorded_json()으로 꺼냅니다.
+        """
+        self.json_record_patterns = list(patterns)
+        self._ensure_json_recorder()
+    
+    def stop_json_recording(self) -> None:
+        """JSON 응답 기록 모드를 끕니다."""
+        self.json_record_patterns = []
+        if self.json_recorder is not None:
+            self.json_recorder.uninstall()
+            self.json_recorder = None
+    
+    def collect_recorded_json(self) -> List[CapturedResponse]:
+        """현재 문서에서 지금까지 기록된 JSON 응답을 꺼냅니다 (JSON이 아닌 응답은 제외)."""
+        if self.json_recorder is None or self.json_recorder.driver is not self.driver:
+            return []
+        return [r for r in self.json_recorder.drain() if r.is_json]
+    
+    def _ensure_json_recorder(self) -> None:
+        """현재 드라이버에 기록 훅이 없으면 설치합니다."""
+        if not self.driver or not self.json_record_patterns:
+            return
+        if self.json_recorder is not None and self.json_recorder.driver is self.driver and self.json_recorder.installed:
+            return
+        self.json_recorder = self.start_network_capture(self.json_record_patterns)
+        if self.json_recorder is None:
+            logger.warning("⚠️ JSON 응답 기록 훅 설치 실패")
+    
     # ========== 세션 관리 ==========
     def capture_session_from_existing(self, origins: List[str]) -> bool:
         """실행 중인 Chrome에서 쿠키 및 스토리지를 수집합니다."""
@@ -184,3 +249,4 @@ class SeleniumBase:
             finally:
                 self.driver = None
                 self.wait = None
+                self.json_recorder = None
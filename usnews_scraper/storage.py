@@ -0,0 +1,253 @@
+"""
+Crash-safe File Storage
+
+Writes go to a temp file in the destination directory and stay pending
+there; every N files or per time window the batch is flushed: the temp files
+are synced (fdatasync), renamed over their final paths, and each directory is
+fsynced once. A crash or Ctrl+C therefore never leaves a truncated ``.html``
+under the final name, durability costs one sync pass per batch instead of one
+fsync per page, and a page that was still pending simply counts as not saved
+(resume checks only see final names; manifest/state updates run on commit).
+``recover_orphaned_temp_files`` removes temp files left by an interrupted run
+(only those of dead processes, or stale ones).
+"""
+
+import os
+import time
+import hashlib
+import logging
+from typing import Callable, List, Optional, Tuple
+
+logger = logging.getLogger("usnews_scraper.storage")
+
+
+# ===================== Module-level Constants =====================
+# Suffix for in-progress writes (never matches "*.html" resume checks)
+TEMP_SUFFIX = ".part"
+
+# Chunk size for streaming hash-and-write
+WRITE_CHUNK_SIZE = 64 * 1024
+
+# Temp files older than this are removed even if their owner cannot be determined
+STALE_TEMP_SECONDS = 60 * 60
+
+
+def _sync_fd(fd: int) -> None:
+    # 데이터만 필요 (크기 변경은 fdatasync도 반영)
+    if hasattr(os, "fdatasync"):
+        os.fdatasync(fd)
+    else:
+        os.fsync(fd)
+
+
+def _fsync_path(path: str, directory: bool = False) -> None:
+    flags = os.O_RDONLY
+    if directory and hasattr(os, "O_DIRECTORY"):
+        flags |= os.O_DIRECTORY
+    fd = os.open(path, flags)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class AtomicFileWriter:
+    """Temp-file + rename writer: renames are deferred and committed in batches (sync, rename, directory fsync)."""
+
+    def __init__(self, fsync_batch_size: int = 20, fsync_interval_seconds: float = 10.0, sync_data: bool = True):
+        """
+        Args:
+            fsync_batch_size: Flush after this many files (0 = never by count)
+            fsync_interval_seconds: Flush when the oldest pending write is older than this (0 = never by time)
+            sync_data: Batch and sync writes (False = rename at once without any fsync; benchmarks / scratch output only)
+        """
+        self.fsync_batch_size = fsync_batch_size
+        self.fsync_interval_seconds = fsync_interval_seconds
+        self.sync_data = sync_data
+        # (final path, temp path, on_commit) in write order
+        self._pending_files: List[Tuple[str, str, Optional[Callable[[], None]]]] = []
+        self._oldest_pending: float = 0.0
+
+    def write_text(self, path: str, text: str, encoding: str = 'utf-8',
+                   on_commit: Optional[Callable[[str, int], None]] = None) -> None:
+        """Atomically replace ``path`` with ``text``."""
+        self.write_bytes(path, text.encode(encoding), on_commit=on_commit)
+
+    def write_bytes(self, path: str, data, on_commit: Optional[Callable[[str, int], None]] = None) -> None:
+        """Atomically replace ``path`` with ``data`` (bytes-like)."""
+        self.write_hashed(path, data, on_commit=on_commit)
+
+    def write_hashed(self, path: str, data, suffix: bytes = b"", chunk_size: int = WRITE_CHUNK_SIZE,
+                     on_commit: Optional[Callable[[str, int], None]] = None) -> Tuple[str, int]:
+        """
+        Write ``data + suffix`` for ``path``, hashing while writing.
+
+        ``data`` may be a memoryview slice; it is consumed in chunks so no
+        full-size copy of the page is made. The file replaces ``path`` at the
+        next flush; ``on_commit(digest, size)`` runs after that (record the
+        page as saved there, not right after this call).
+
+        Returns:
+            (sha256 hex digest of the written bytes, number of bytes written)
+        """
+        view = memoryview(data)
+        digest = hashlib.sha256()
+        tmp_path = f"{path}.{os.getpid()}{TEMP_SUFFIX}"
+        try:
+            with open(tmp_path, 'wb') as f:
+                for offset in range(0, len(view), chunk_size):
+                    chunk = view[offset:offset + chunk_size]
+                    digest.update(chunk)
+                    f.write(chunk)
+                if suffix:
+                    digest.update(suffix)
+                    f.write(suffix)
+            if not self.sync_data:
+                os.replace(tmp_path, path)
+        except BaseException:
+            self._forget(path)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        result = (digest.hexdigest(), len(view) + len(suffix))
+        commit = (lambda: on_commit(*result)) if on_commit is not None else None
+        if self.sync_data:
+            self._mark_pending(path, tmp_path, commit)
+        elif commit is not None:
+            commit()
+        return result
+
+    def current_path(self, path: str) -> str:
+        """Where the latest data for ``path`` is readable now: its temp file while the write is pending."""
+        for final, tmp_path, _ in self._pending_files:
+            if final == path:
+                return tmp_path
+        return path
+
+    def _forget(self, path: str) -> None:
+        # 같은 경로를 배치 안에서 다시 쓰면 이전 항목은 버림 (임시 파일은 덮어씀)
+        self._pending_files = [entry for entry in self._pending_files if entry[0] != path]
+
+    def _mark_pending(self, path: str, tmp_path: str, on_commit: Optional[Callable[[], None]]) -> None:
+        self._forget(path)
+        if not self._pending_files:
+            self._oldest_pending = time.monotonic()
+        self._pending_files.append((path, tmp_path, on_commit))
+        if self.fsync_batch_size and len(self._pending_files) >= self.fsync_batch_size:
+            self.flush()
+        elif self.fsync_interval_seconds and time.monotonic() - self._oldest_pending >= self.fsync_interval_seconds:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit pending writes in one pass: sync the temp files, rename them, fsync each directory once."""
+        if not self._pending_files:
+            return
+        pending, self._pending_files = self._pending_files, []
+        committed = []
+        for path, tmp_path, on_commit in pending:
+            try:
+                fd = os.open(tmp_path, os.O_RDWR)
+                try:
+                    _sync_fd(fd)
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.error(f"❌ 파일 확정 실패: {path} ({e})")
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                continue
+            committed.append((path, on_commit))
+        dirs = {os.path.dirname(os.path.abspath(path)) for path, _ in committed}
+        for directory in dirs:
+            try:
+                _fsync_path(directory, directory=True)
+            except OSError as e:
+                # Windows 등 디렉터리 fsync를 지원하지 않는 환경
+                logger.debug(f"디렉터리 fsync 불가: {directory} ({e})")
+        for path, on_commit in committed:
+            if on_commit is None:
+                continue
+            try:
+                on_commit()
+            except Exception as e:
+                logger.warning(f"⚠️ 저장 확정 후 기록 실패: {path} ({e})")
+        logger.debug(f"💽 fsync 완료: 파일 {len(committed)}개, 디렉터리 {len(dirs)}개")
+
+
+def _temp_owner_pid(name: str) -> Optional[int]:
+    """PID embedded in an AtomicFileWriter temp name ("<file>.<pid>.part"), or None."""
+    stem = name[:-len(TEMP_SUFFIX)]
+    _, _, pid = stem.rpartition('.')
+    return int(pid) if pid.isdigit() else None
+
+
+def _pid_alive(pid: int) -> Optional[bool]:
+    """True/False if the process state is known, None if it cannot be checked (non-POSIX)."""
+    if os.name != "posix":
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return None
+    return True
+
+
+def _is_orphaned(entry: os.DirEntry, now: float, stale_after_seconds: float) -> bool:
+    pid = _temp_owner_pid(entry.name)
+    if pid is not None and pid != os.getpid() and _pid_alive(pid) is False:
+        return True
+    try:
+        return now - entry.stat(follow_symlinks=False).st_mtime >= stale_after_seconds
+    except OSError:
+        return False
+
+
+def recover_orphaned_temp_files(root: str, max_depth: int = 2, stale_after_seconds: float = STALE_TEMP_SECONDS) -> int:
+    """
+    Remove temp files left behind by an interrupted write.
+
+    A temp file is removed if the process named in it (``<file>.<pid>.part``)
+    is no longer running, or if it is older than ``stale_after_seconds``;
+    writes still in progress in another crawler process are left alone.
+
+    Args:
+        root: Downloads root directory
+        max_depth: How many directory levels to scan (root = 1)
+        stale_after_seconds: Age after which any temp file counts as orphaned
+
+    Returns:
+        Number of removed files
+    """
+    removed = 0
+    if not os.path.isdir(root):
+        return 0
+    now = time.time()
+    stack = [(root, 1)]
+    while stack:
+        directory, depth = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if depth < max_depth:
+                            stack.append((entry.path, depth + 1))
+                    elif entry.name.endswith(TEMP_SUFFIX) and _is_orphaned(entry, now, stale_after_seconds):
+                        try:
+                            os.remove(entry.path)
+                            removed += 1
+                        except OSError as e:
+                            logger.warning(f"⚠️ 임시 파일 삭제 실패: {entry.path} ({e})")
+        except OSError:
+            continue
+    if removed:
+        logger.info(f"🧹 중단된 쓰기의 임시 파일 {removed}개 정리")
+    return removed